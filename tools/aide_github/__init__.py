@@ -0,0 +1,44 @@
+"""
+Shared GitHub plumbing for the AIDE tools (issue-creator, migrate-type-labels,
+set-issue-type). Scripts add `tools/` to `sys.path` and import from here.
+"""
+
+from .batch import DEFAULT_CHUNK_SIZE, AliasResult, gql_list, gql_str, run_aliased
+from .cache import repo_cache_path
+from .index import IssueTitleIndex
+from .issue_types import load_issue_types
+from .journal import Journal
+from .labels import LabelInventory
+from .profile import Profiler
+from .ratelimit import RateLimitGovernor
+from .resolver import IssueIdResolver
+from .transport import (
+    GhCliTransport,
+    GitHubError,
+    HttpTransport,
+    Transport,
+    detect_repo,
+    make_transport,
+)
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "AliasResult",
+    "GhCliTransport",
+    "GitHubError",
+    "HttpTransport",
+    "IssueIdResolver",
+    "IssueTitleIndex",
+    "Journal",
+    "LabelInventory",
+    "Profiler",
+    "RateLimitGovernor",
+    "Transport",
+    "detect_repo",
+    "gql_list",
+    "gql_str",
+    "load_issue_types",
+    "make_transport",
+    "repo_cache_path",
+    "run_aliased",
+]
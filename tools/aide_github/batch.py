@@ -0,0 +1,89 @@
+"""
+Aliased multi-operation GraphQL documents.
+
+GitHub executes every top-level field of a document independently and reports
+failures per field (`errors[].path[0]` is the alias), so many mutations can
+share one round trip without one bad operation failing its neighbours.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .transport import GitHubError, Transport
+
+
+DEFAULT_CHUNK_SIZE = 50
+
+
+@dataclass
+class AliasResult:
+    """Outcome of one aliased operation (`key` is the caller's identifier)."""
+
+    key: Any
+    data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def gql_str(value: str) -> str:
+    """Quote a string literal for inlining into a GraphQL document."""
+    return json.dumps(value)
+
+
+def gql_list(values: Iterable[str]) -> str:
+    """Quote a list of string literals for inlining into a GraphQL document."""
+    return "[" + ", ".join(gql_str(v) for v in values) + "]"
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    size = max(1, int(size))
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def run_aliased(
+    transport: Transport,
+    fields: Sequence[Tuple[Any, str]],
+    operation: str = "mutation",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[AliasResult]:
+    """Run `(key, field)` operations in aliased documents of `chunk_size` fields.
+
+    Each `field` is a complete top-level selection such as
+    `addSubIssue(input: {...}) { issue { number } }`. Results are returned in
+    input order. Field-level errors fail only their own alias; a document-level
+    failure (HTTP error, parse error) fails every alias in that chunk.
+    """
+    results: List[AliasResult] = []
+    for chunk in _chunks(list(fields), chunk_size):
+        aliases = [f"op{i}" for i in range(len(chunk))]
+        document = operation + " {\n" + "\n".join(
+            f"  {alias}: {text}" for alias, (_key, text) in zip(aliases, chunk)
+        ) + "\n}"
+
+        errors_by_alias: Dict[str, List[str]] = {}
+        try:
+            data = transport.graphql(document)
+        except GitHubError as exc:
+            attributed = [e for e in exc.errors if e.get("path")]
+            if exc.data is None or not attributed:
+                results.extend(AliasResult(key, error=str(exc)) for key, _text in chunk)
+                continue
+            data = exc.data
+            for err in attributed:
+                errors_by_alias.setdefault(str(err["path"][0]), []).append(str(err.get("message", err)))
+
+        for alias, (key, _text) in zip(aliases, chunk):
+            if alias in errors_by_alias:
+                results.append(AliasResult(key, error="; ".join(errors_by_alias[alias])))
+            elif data.get(alias) is None:
+                results.append(AliasResult(key, error="no data returned"))
+            else:
+                results.append(AliasResult(key, data=data[alias]))
+    return results
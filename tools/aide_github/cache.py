@@ -0,0 +1,84 @@
+"""
+On-disk JSON caches for the AIDE tools.
+
+Caches live under `$AIDE_CACHE_DIR` (default: `$XDG_CACHE_HOME/aide` or
+`~/.cache/aide`), one directory per owner/repo. Writes are atomic (temp file +
+rename) so an interrupted run never leaves a truncated cache behind.
+
+Caches updated once per issue (`DeferredSave`) are written back in batches
+and flushed at the end of a run, not rewritten after every change.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def cache_dir() -> Path:
+    """Root directory for AIDE caches."""
+    if os.environ.get("AIDE_CACHE_DIR"):
+        return Path(os.environ["AIDE_CACHE_DIR"])
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "aide"
+
+
+def repo_cache_path(owner: str, repo: str, name: str) -> Path:
+    """Path of cache file `name` for owner/repo."""
+    return cache_dir() / owner / repo / name
+
+
+def load_json(path: Path, default: Any = None) -> Any:
+    """Read a JSON cache file, returning `default` if missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def save_json(path: Path, data: Any) -> None:
+    """Atomically write a JSON cache file (best effort: I/O errors are ignored)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=path.name, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def org_cache_path(owner: str, name: str) -> Path:
+    """Path of cache file `name` shared by every repo of an owner/org."""
+    return cache_dir() / owner / name
+
+
+class DeferredSave:
+    """Mixin for in-memory caches that are written back in batches.
+
+    Subclasses implement `_save()` and guard their state with `self._lock`.
+    `_changed()` (called with the lock held) marks the cache dirty and writes
+    it every `flush_every` changes; `flush()` writes what is still pending.
+    """
+    flush_every = 100
+    _pending = 0
+
+    def _save(self):
+        raise NotImplementedError
+
+    def _changed(self):
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self._pending = 0
+            self._save()
+
+    def flush(self):
+        """Write outstanding changes (no-op when nothing changed)"""
+        with self._lock:
+            if self._pending:
+                self._pending = 0
+                self._save()
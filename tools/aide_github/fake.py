@@ -0,0 +1,763 @@
+"""
+In-memory fake GitHub for exercising the AIDE tools without network access.
+
+`FakeGitHub` models the slice of the REST and GraphQL APIs the tools use
+(issues, labels, sub-issues, blocked-by links, org Issue Types). It can be
+driven in-process through `FakeTransport`, or over real HTTP through
+`FakeServer` so that `HttpTransport` (and the tools run as subprocesses) can
+be pointed at it with `AIDE_GH_API_URL`.
+
+The GraphQL support is deliberately small: a tokenizer/parser for the query
+language subset the tools emit (aliases, arguments, variables, nested
+selections) plus per-field resolvers. Errors are reported per field with a
+`path`, like GitHub does, so partial-success handling can be tested.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .transport import Transport
+
+
+DEFAULT_ISSUE_TYPES = ["Epic", "Feature", "Bug", "Technical Debt", "Chore", "Documentation", "Research"]
+
+_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class _FieldError(Exception):
+    """Raised by a resolver to null a field and report a GraphQL error."""
+
+    def __init__(self, message: str, error_type: str = "UNPROCESSABLE"):
+        super().__init__(message)
+        self.error_type = error_type
+
+
+# ---------------------------------------------------------------------------
+# GraphQL subset parser
+# ---------------------------------------------------------------------------
+
+_TOKEN_RE = re.compile(r'''
+    (?P<ws>[\s,]+|\#[^\n]*)
+  | (?P<punct>\.\.\.|[{}()\[\]:!$=@])
+  | (?P<string>"(?:\\.|[^"\\])*")
+  | (?P<number>-?\d+(?:\.\d+)?)
+  | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+''', re.VERBOSE)
+
+
+@dataclass
+class _Field:
+    name: str
+    alias: Optional[str] = None
+    args: Dict[str, Any] = field(default_factory=dict)
+    selections: List["_Field"] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        return self.alias or self.name
+
+
+@dataclass(frozen=True)
+class _Var:
+    name: str
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.tokens: List[Tuple[str, str]] = []
+        pos = 0
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if not match:
+                raise _FieldError(f"Parse error near: {text[pos:pos + 20]!r}", "PARSE")
+            pos = match.end()
+            kind = match.lastgroup
+            if kind != "ws":
+                self.tokens.append((kind, match.group(kind)))
+        self.pos = 0
+
+    def _peek(self, offset: int = 0) -> Tuple[str, str]:
+        idx = self.pos + offset
+        return self.tokens[idx] if idx < len(self.tokens) else ("eof", "")
+
+    def _take(self, value: Optional[str] = None) -> str:
+        kind, tok = self._peek()
+        if kind == "eof" or (value is not None and tok != value):
+            raise _FieldError(f"Parse error: expected {value or 'token'}, got {tok!r}", "PARSE")
+        self.pos += 1
+        return tok
+
+    def document(self) -> Tuple[str, List[_Field]]:
+        operation = "query"
+        if self._peek()[1] in ("query", "mutation"):
+            operation = self._take()
+            if self._peek()[0] == "name":
+                self._take()
+            if self._peek()[1] == "(":
+                depth = 0
+                while True:
+                    tok = self._take()
+                    depth += {"(": 1, ")": -1}.get(tok, 0)
+                    if depth == 0:
+                        break
+        return operation, self._selection_set()
+
+    def _selection_set(self) -> List[_Field]:
+        self._take("{")
+        fields = []
+        while self._peek()[1] != "}":
+            if self._peek()[1] == "...":
+                fields.extend(self._inline_fragment())
+            else:
+                fields.append(self._field())
+        self._take("}")
+        return fields
+
+    def _inline_fragment(self) -> List[_Field]:
+        # `... on Issue { ... }`: the type condition is not checked, its fields are merged in
+        self._take("...")
+        self._take("on")
+        self._take()
+        return self._selection_set()
+
+    def _field(self) -> _Field:
+        name = self._take()
+        alias = None
+        if self._peek()[1] == ":":
+            self._take(":")
+            alias, name = name, self._take()
+        args: Dict[str, Any] = {}
+        if self._peek()[1] == "(":
+            self._take("(")
+            while self._peek()[1] != ")":
+                arg_name = self._take()
+                self._take(":")
+                args[arg_name] = self._value()
+            self._take(")")
+        selections = self._selection_set() if self._peek()[1] == "{" else []
+        return _Field(name=name, alias=alias, args=args, selections=selections)
+
+    def _value(self) -> Any:
+        kind, tok = self._peek()
+        if tok == "$":
+            self._take("$")
+            return _Var(self._take())
+        if tok == "[":
+            self._take("[")
+            items = []
+            while self._peek()[1] != "]":
+                items.append(self._value())
+            self._take("]")
+            return items
+        if tok == "{":
+            self._take("{")
+            obj = {}
+            while self._peek()[1] != "}":
+                key = self._take()
+                self._take(":")
+                obj[key] = self._value()
+            self._take("}")
+            return obj
+        self._take()
+        if kind == "string":
+            return json.loads(tok)
+        if kind == "number":
+            return float(tok) if "." in tok else int(tok)
+        return {"true": True, "false": False, "null": None}.get(tok, tok)
+
+
+def _bind(value: Any, variables: Dict[str, Any]) -> Any:
+    if isinstance(value, _Var):
+        return variables.get(value.name)
+    if isinstance(value, list):
+        return [_bind(v, variables) for v in value]
+    if isinstance(value, dict):
+        return {k: _bind(v, variables) for k, v in value.items()}
+    return value
+
+
+def _connection(items: List[Any], args: Dict[str, Any], node: Callable[[Any], Any] = lambda x: x,
+                sort_key: Optional[Callable[[Any], List[Any]]] = None, descending: bool = False) -> Dict[str, Any]:
+    """Paginate `items` (already in order).
+
+    Cursors are offsets, or, with `sort_key`, the last item's sort key (like
+    GitHub's keyset cursors), so items leaving the connection between pages
+    (e.g. a label filter while labels are removed) do not shift later pages.
+    """
+    first = int(args.get("first") or 100)
+    if sort_key is not None and args.get("after"):
+        after = json.loads(args["after"])
+        start = next((i for i, item in enumerate(items)
+                      if (sort_key(item) < after if descending else sort_key(item) > after)), len(items))
+    else:
+        start = int(args["after"]) if args.get("after") else 0
+    page = items[start:start + first]
+    end = start + len(page)
+    if sort_key is not None:
+        end_cursor = json.dumps(sort_key(page[-1])) if page else args.get("after")
+        start_cursor = json.dumps(sort_key(page[0])) if page else None
+    else:
+        end_cursor = str(end) if page else args.get("after")
+        start_cursor = str(start)
+    return {
+        "totalCount": len(items),
+        "nodes": [node(item) for item in page],
+        "pageInfo": {
+            "hasNextPage": end < len(items),
+            "endCursor": end_cursor,
+            "hasPreviousPage": start > 0,
+            "startCursor": start_cursor,
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Fake GitHub state
+# ---------------------------------------------------------------------------
+
+@dataclass
+class FakeIssue:
+    number: int
+    node_id: str
+    title: str
+    body: str = ""
+    state: str = "OPEN"
+    labels: List[str] = field(default_factory=list)
+    issue_type: Optional[str] = None
+    parent: Optional[int] = None
+    sub_issues: List[int] = field(default_factory=list)
+    blocked_by: List[int] = field(default_factory=list)
+    created_at: str = ""
+    updated_at: str = ""
+
+
+class FakeGitHub:
+    """A single-repository fake GitHub with a call log."""
+
+    def __init__(
+        self,
+        owner: str = "acme",
+        repo: str = "widgets",
+        issue_types: Optional[List[str]] = None,
+        labels: Optional[List[str]] = None,
+        latency: float = 0.0,
+        rate_limit: int = 5000,
+    ):
+        self.owner = owner
+        self.repo = repo
+        self.latency = latency
+        self.repo_id = "R_fake"
+        self.issues: Dict[int, FakeIssue] = {}
+        self.labels: Dict[str, Dict[str, str]] = {}
+        self.issue_types: Dict[str, str] = {
+            name: f"IT_{i}" for i, name in enumerate(DEFAULT_ISSUE_TYPES if issue_types is None else issue_types)
+        }
+        self.rate_limit = rate_limit
+        self.rate_remaining = rate_limit
+        self.calls: List[Dict[str, Any]] = []
+        self._failures: List[Tuple[int, Dict[str, str], Dict[str, Any]]] = []
+        self._clock = 0
+        self._lock = threading.RLock()
+        for name in labels or []:
+            self.create_label(name)
+
+    # -- state helpers -----------------------------------------------------
+
+    def _tick(self) -> str:
+        self._clock += 1
+        return (_EPOCH + timedelta(seconds=self._clock)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def create_label(self, name: str, color: str = "ededed", description: str = "") -> Dict[str, str]:
+        if name not in self.labels:
+            self.labels[name] = {
+                "id": f"LA_{len(self.labels) + 1}", "name": name, "color": color, "description": description,
+            }
+        return self.labels[name]
+
+    def create_issue(self, title: str, body: str = "", labels: Optional[List[str]] = None,
+                     issue_type: Optional[str] = None) -> FakeIssue:
+        number = len(self.issues) + 1
+        now = self._tick()
+        for name in labels or []:
+            self.create_label(name)
+        issue = FakeIssue(
+            number=number, node_id=f"I_{number}", title=title, body=body,
+            labels=list(dict.fromkeys(labels or [])), issue_type=issue_type,
+            created_at=now, updated_at=now,
+        )
+        self.issues[number] = issue
+        return issue
+
+    def _touch(self, issue: FakeIssue):
+        issue.updated_at = self._tick()
+
+    def _issue(self, number: int) -> FakeIssue:
+        issue = self.issues.get(int(number))
+        if not issue:
+            raise _FieldError(f"Could not resolve to an Issue with the number of {number}.", "NOT_FOUND")
+        return issue
+
+    def _issue_by_id(self, node_id: str) -> FakeIssue:
+        for issue in self.issues.values():
+            if issue.node_id == node_id:
+                return issue
+        raise _FieldError(f"Could not resolve to a node with the global id of '{node_id}'.", "NOT_FOUND")
+
+    def _label_by_id(self, node_id: str) -> Dict[str, str]:
+        for label in self.labels.values():
+            if label["id"] == node_id:
+                return label
+        raise _FieldError(f"Could not resolve to a node with the global id of '{node_id}'.", "NOT_FOUND")
+
+    def snapshot(self) -> List[Tuple[Any, ...]]:
+        """Number-independent view of the repo (for comparing runs).
+
+        One sorted tuple per issue: title, body, labels, type, parent title and
+        blocker titles. Two runs that differ only in issue numbering (e.g.
+        serial vs concurrent creation) produce equal snapshots.
+        """
+        with self._lock:
+            title = {i.number: i.title for i in self.issues.values()}
+            return sorted(
+                (i.title, i.body, i.state, tuple(sorted(i.labels)), i.issue_type,
+                 title.get(i.parent) if i.parent else None,
+                 tuple(sorted(title[n] for n in i.blocked_by)))
+                for i in self.issues.values()
+            )
+
+    def inject_failures(self, count: int = 1, status: int = 429, retry_after: Optional[float] = None,
+                        message: str = "You have exceeded a secondary rate limit."):
+        """Make the next `count` requests fail (default: secondary rate limit)."""
+        headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+        with self._lock:
+            self._failures.extend([(status, headers, {"message": message})] * count)
+
+    # -- request dispatch --------------------------------------------------
+
+    def handle(self, method: str, path: str, body: Optional[Any]) -> Tuple[int, Dict[str, str], str]:
+        """Serve one API request, returning (status, headers, raw JSON)."""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.rate_remaining = max(0, self.rate_remaining - 1)
+            entry: Dict[str, Any] = {"method": method, "path": path}
+            self.calls.append(entry)
+            if self._failures:
+                status, headers, payload = self._failures.pop(0)
+                entry["status"] = status
+                return status, dict(headers, **{"content-type": "application/json"}), json.dumps(payload)
+            if path == "/graphql":
+                status, payload = 200, self._graphql(body or {}, entry)
+            else:
+                status, payload = self._rest(method, path, body)
+            headers = {
+                "content-type": "application/json; charset=utf-8",
+                "x-ratelimit-limit": str(self.rate_limit),
+                "x-ratelimit-remaining": str(self.rate_remaining),
+                "x-ratelimit-used": str(self.rate_limit - self.rate_remaining),
+                "x-ratelimit-reset": str(int(time.time()) + 3600),
+                "x-ratelimit-resource": "graphql" if path == "/graphql" else "core",
+            }
+            return status, headers, json.dumps(payload) if payload is not None else ""
+
+    # -- GraphQL -----------------------------------------------------------
+
+    def _graphql(self, body: Dict[str, Any], entry: Dict[str, Any]) -> Dict[str, Any]:
+        variables = body.get("variables") or {}
+        try:
+            operation, fields = _Parser(body.get("query", "")).document()
+        except _FieldError as exc:
+            return {"errors": [{"message": str(exc), "type": exc.error_type}]}
+        entry["operation"] = operation
+        entry["fields"] = [f.name for f in fields]
+        root = self._mutation_root() if operation == "mutation" else self._query_root()
+        errors: List[Dict[str, Any]] = []
+        data = self._select(root, fields, variables, [], errors)
+        payload: Dict[str, Any] = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        return payload
+
+    def _select(self, value: Any, fields: List[_Field], variables: Dict[str, Any],
+                path: List[Any], errors: List[Dict[str, Any]]) -> Any:
+        if value is None:
+            return None
+        if isinstance(value, list):
+            return [self._select(v, fields, variables, path + [i], errors) for i, v in enumerate(value)]
+        if not fields:
+            return value
+        out: Dict[str, Any] = {}
+        for f in fields:
+            try:
+                raw = value.get(f.name) if isinstance(value, dict) else None
+                if callable(raw):
+                    raw = raw(_bind(f.args, variables))
+                out[f.key] = self._select(raw, f.selections, variables, path + [f.key], errors)
+            except _FieldError as exc:
+                out[f.key] = None
+                errors.append({"type": exc.error_type, "path": path + [f.key], "message": str(exc)})
+        return out
+
+    def _query_root(self) -> Dict[str, Any]:
+        return {
+            "repository": lambda a: self._repository_node(),
+            "organization": lambda a: self._organization_node(),
+            "rateLimit": lambda a: self._rate_limit_node(),
+            "node": lambda a: self._node(a["id"]),
+            "nodes": lambda a: [self._node(i) for i in a.get("ids") or []],
+        }
+
+    def _rate_limit_node(self) -> Dict[str, Any]:
+        return {
+            "cost": 1, "limit": self.rate_limit, "remaining": self.rate_remaining,
+            "used": self.rate_limit - self.rate_remaining,
+            "resetAt": (datetime.now(timezone.utc) + timedelta(hours=1)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+
+    def _node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        for issue in self.issues.values():
+            if issue.node_id == node_id:
+                return self._issue_node(issue)
+        for label in self.labels.values():
+            if label["id"] == node_id:
+                return dict(label)
+        return None
+
+    def _repository_node(self) -> Dict[str, Any]:
+        return {
+            "id": self.repo_id,
+            "name": self.repo,
+            "nameWithOwner": f"{self.owner}/{self.repo}",
+            "owner": {"login": self.owner},
+            "issue": lambda a: self._issue_node(self._issue(a["number"])),
+            "issues": lambda a: _connection(self._filter_issues(a), a, self._issue_node, *self._issue_order(a)),
+            "labels": lambda a: _connection(
+                [dict(l) for l in self.labels.values() if a.get("query", "").lower() in l["name"].lower()], a
+            ),
+            "label": lambda a: dict(self.labels[a["name"]]) if a.get("name") in self.labels else None,
+        }
+
+    def _organization_node(self) -> Dict[str, Any]:
+        types = [{"id": tid, "name": name} for name, tid in self.issue_types.items()]
+        return {"login": self.owner, "issueTypes": lambda a: _connection(types, a)}
+
+    def _filter_issues(self, args: Dict[str, Any]) -> List[FakeIssue]:
+        issues = list(self.issues.values())
+        states = args.get("states")
+        if states:
+            issues = [i for i in issues if i.state in states]
+        filter_by = args.get("filterBy") or {}
+        wanted = args.get("labels") or filter_by.get("labels")
+        if wanted:
+            issues = [i for i in issues if any(l in wanted for l in i.labels)]
+        if filter_by.get("since"):
+            issues = [i for i in issues if i.updated_at >= filter_by["since"]]
+        key, descending = self._issue_order(args)
+        return sorted(issues, key=key, reverse=descending)
+
+    @staticmethod
+    def _issue_order(args: Dict[str, Any]) -> Tuple[Callable[[FakeIssue], List[Any]], bool]:
+        """(sort key, descending) for an issues connection's orderBy"""
+        order = args.get("orderBy") or {"field": "CREATED_AT", "direction": "ASC"}
+        if order.get("field") == "UPDATED_AT":
+            return (lambda i: [i.updated_at, i.number]), order.get("direction") == "DESC"
+        return (lambda i: [i.number]), order.get("direction") == "DESC"
+
+    def _issue_node(self, issue: FakeIssue) -> Dict[str, Any]:
+        type_id = self.issue_types.get(issue.issue_type) if issue.issue_type else None
+        return {
+            "id": issue.node_id,
+            "number": issue.number,
+            "title": issue.title,
+            "body": issue.body,
+            "state": issue.state,
+            "url": f"https://github.com/{self.owner}/{self.repo}/issues/{issue.number}",
+            "createdAt": issue.created_at,
+            "updatedAt": issue.updated_at,
+            "issueType": {"id": type_id, "name": issue.issue_type} if issue.issue_type else None,
+            "labels": lambda a: _connection([dict(self.labels[n]) for n in issue.labels], a),
+            "subIssues": lambda a: _connection([self.issues[n] for n in issue.sub_issues], a, self._issue_node),
+            "blockedBy": lambda a: _connection([self.issues[n] for n in issue.blocked_by], a, self._issue_node),
+            "parent": lambda a: self._issue_node(self.issues[issue.parent]) if issue.parent else None,
+        }
+
+    def _mutation_root(self) -> Dict[str, Any]:
+        return {
+            "createIssue": self._m_create_issue,
+            "updateIssue": self._m_update_issue,
+            "addSubIssue": self._m_add_sub_issue,
+            "addBlockedBy": self._m_add_blocked_by,
+            "updateIssueIssueType": self._m_update_issue_type,
+            "addLabelsToLabelable": self._m_add_labels,
+            "removeLabelsFromLabelable": self._m_remove_labels,
+            "createLabel": self._m_create_label,
+        }
+
+    def _type_name(self, type_id: str) -> str:
+        for name, tid in self.issue_types.items():
+            if tid == type_id:
+                return name
+        raise _FieldError(f"Could not resolve to a node with the global id of '{type_id}'.", "NOT_FOUND")
+
+    def _m_create_issue(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        data = args["input"]
+        labels = [self._label_by_id(lid)["name"] for lid in data.get("labelIds") or []]
+        issue_type = self._type_name(data["issueTypeId"]) if data.get("issueTypeId") else None
+        issue = self.create_issue(data["title"], data.get("body", ""), labels, issue_type)
+        if data.get("parentIssueId"):
+            parent = self._issue_by_id(data["parentIssueId"])
+            parent.sub_issues.append(issue.number)
+            issue.parent = parent.number
+        return {"issue": self._issue_node(issue), "clientMutationId": None}
+
+    def _m_update_issue(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        data = args["input"]
+        issue = self._issue_by_id(data["id"])
+        if "title" in data:
+            issue.title = data["title"]
+        if "body" in data:
+            issue.body = data["body"]
+        if "labelIds" in data:
+            issue.labels = [self._label_by_id(lid)["name"] for lid in data["labelIds"]]
+        if data.get("issueTypeId"):
+            issue.issue_type = self._type_name(data["issueTypeId"])
+        self._touch(issue)
+        return {"issue": self._issue_node(issue), "clientMutationId": None}
+
+    def _m_add_sub_issue(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        data = args["input"]
+        parent = self._issue_by_id(data["issueId"])
+        child = self._issue_by_id(data["subIssueId"])
+        if child.parent is not None and not data.get("replaceParent"):
+            raise _FieldError("Issue may not contain duplicate sub-issues and Sub issue may only have one parent")
+        if child.parent is not None and child.parent in self.issues:
+            self.issues[child.parent].sub_issues.remove(child.number)
+        parent.sub_issues.append(child.number)
+        child.parent = parent.number
+        self._touch(parent)
+        self._touch(child)
+        return {"issue": self._issue_node(parent), "subIssue": self._issue_node(child), "clientMutationId": None}
+
+    def _m_add_blocked_by(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        data = args["input"]
+        issue = self._issue_by_id(data["issueId"])
+        blocking = self._issue_by_id(data["blockingIssueId"])
+        if blocking.number == issue.number:
+            raise _FieldError("An issue cannot block itself")
+        if blocking.number not in issue.blocked_by:
+            issue.blocked_by.append(blocking.number)
+            self._touch(issue)
+        return {"issue": self._issue_node(issue), "blockingIssue": self._issue_node(blocking), "clientMutationId": None}
+
+    def _m_update_issue_type(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        data = args["input"]
+        issue = self._issue_by_id(data["issueId"])
+        issue.issue_type = self._type_name(data["issueTypeId"]) if data.get("issueTypeId") else None
+        self._touch(issue)
+        return {"issue": self._issue_node(issue), "clientMutationId": None}
+
+    def _m_add_labels(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        data = args["input"]
+        issue = self._issue_by_id(data["labelableId"])
+        for lid in data.get("labelIds") or []:
+            name = self._label_by_id(lid)["name"]
+            if name not in issue.labels:
+                issue.labels.append(name)
+        self._touch(issue)
+        return {"labelable": self._issue_node(issue), "clientMutationId": None}
+
+    def _m_remove_labels(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        data = args["input"]
+        issue = self._issue_by_id(data["labelableId"])
+        remove = {self._label_by_id(lid)["name"] for lid in data.get("labelIds") or []}
+        issue.labels = [n for n in issue.labels if n not in remove]
+        self._touch(issue)
+        return {"labelable": self._issue_node(issue), "clientMutationId": None}
+
+    def _m_create_label(self, args: Dict[str, Any]) -> Dict[str, Any]:
+        data = args["input"]
+        if data["name"] in self.labels:
+            raise _FieldError(f"Name '{data['name']}' has already been taken")
+        label = self.create_label(data["name"], data.get("color", "ededed"), data.get("description", ""))
+        return {"label": dict(label), "clientMutationId": None}
+
+    # -- REST --------------------------------------------------------------
+
+    def _issue_json(self, issue: FakeIssue) -> Dict[str, Any]:
+        return {
+            "number": issue.number,
+            "node_id": issue.node_id,
+            "title": issue.title,
+            "body": issue.body,
+            "state": issue.state.lower(),
+            "labels": [{"id": self.labels[n]["id"], "name": n, "color": self.labels[n]["color"]} for n in issue.labels],
+            "html_url": f"https://github.com/{self.owner}/{self.repo}/issues/{issue.number}",
+            "created_at": issue.created_at,
+            "updated_at": issue.updated_at,
+        }
+
+    def _label_json(self, label: Dict[str, str]) -> Dict[str, Any]:
+        return {"id": label["id"], "node_id": label["id"], "name": label["name"],
+                "color": label["color"], "description": label["description"]}
+
+    @staticmethod
+    def _page(items: List[Any], query: Dict[str, str]) -> List[Any]:
+        per_page = int(query.get("per_page", 30))
+        page = int(query.get("page", 1))
+        return items[(page - 1) * per_page: page * per_page]
+
+    def _rest(self, method: str, path: str, body: Optional[Any]) -> Tuple[int, Any]:
+        parts = urlsplit(path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        segments = [unquote(s) for s in parts.path.strip("/").split("/")]
+        body = body or {}
+
+        if segments[:1] == ["search"] and segments[1:] == ["issues"]:
+            terms = [t for t in re.findall(r'"[^"]*"|\S+', query.get("q", "")) if ":" not in t]
+            words = [t.strip('"').lower() for t in terms]
+            items = [self._issue_json(i) for i in self.issues.values()
+                     if all(w in i.title.lower() for w in words)]
+            return 200, {"total_count": len(items), "items": self._page(items, query)}
+
+        if segments[:1] != ["repos"] or segments[1:3] != [self.owner, self.repo]:
+            return 404, {"message": "Not Found"}
+        rest = segments[3:]
+
+        if not rest and method == "GET":
+            return 200, {"id": 1, "node_id": self.repo_id, "name": self.repo, "owner": {"login": self.owner}}
+
+        if rest == ["labels"]:
+            if method == "GET":
+                return 200, self._page([self._label_json(l) for l in self.labels.values()], query)
+            if method == "POST":
+                if body["name"] in self.labels:
+                    return 422, {"message": "Validation Failed", "errors": [{"code": "already_exists"}]}
+                return 201, self._label_json(
+                    self.create_label(body["name"], body.get("color", "ededed"), body.get("description", ""))
+                )
+
+        if rest == ["issues"]:
+            if method == "POST":
+                issue = self.create_issue(body["title"], body.get("body", ""), body.get("labels"))
+                return 201, self._issue_json(issue)
+            if method == "GET":
+                state = query.get("state", "open").upper()
+                issues = [i for i in self.issues.values() if state == "ALL" or i.state == state]
+                if query.get("since"):
+                    issues = [i for i in issues if i.updated_at >= query["since"]]
+                key = (lambda i: i.updated_at) if query.get("sort") == "updated" else (lambda i: i.number)
+                issues.sort(key=key, reverse=query.get("direction", "desc") == "desc")
+                return 200, self._page([self._issue_json(i) for i in issues], query)
+
+        if len(rest) >= 2 and rest[0] == "issues" and rest[1].isdigit():
+            issue = self.issues.get(int(rest[1]))
+            if not issue:
+                return 404, {"message": "Not Found"}
+            if len(rest) == 2 and method == "GET":
+                return 200, self._issue_json(issue)
+            if len(rest) == 2 and method == "PATCH":
+                for key in ("title", "body"):
+                    if key in body:
+                        setattr(issue, key, body[key])
+                if "labels" in body:
+                    issue.labels = list(dict.fromkeys(body["labels"]))
+                    for name in issue.labels:
+                        self.create_label(name)
+                self._touch(issue)
+                return 200, self._issue_json(issue)
+            if rest[2:] == ["labels"] and method == "POST":
+                for name in body.get("labels", []):
+                    self.create_label(name)
+                    if name not in issue.labels:
+                        issue.labels.append(name)
+                self._touch(issue)
+                return 200, [self._label_json(self.labels[n]) for n in issue.labels]
+            if len(rest) == 4 and rest[2] == "labels" and method == "DELETE":
+                if rest[3] not in issue.labels:
+                    return 404, {"message": "Label does not exist"}
+                issue.labels.remove(rest[3])
+                self._touch(issue)
+                return 200, [self._label_json(self.labels[n]) for n in issue.labels]
+
+        return 404, {"message": "Not Found"}
+
+
+class FakeTransport(Transport):
+    """Transport that serves requests from a `FakeGitHub` in-process."""
+
+    name = "fake"
+
+    def __init__(self, github: Optional[FakeGitHub] = None, governor=None):
+        super().__init__(governor)
+        self.github = github or FakeGitHub()
+
+    def _send(self, method: str, path: str, body: Optional[Any]) -> Tuple[int, Dict[str, str], str]:
+        return self.github.handle(method, path, body)
+
+
+class FakeServer:
+    """Serve a `FakeGitHub` over HTTP on localhost (use as a context manager)."""
+
+    def __init__(self, github: Optional[FakeGitHub] = None, host: str = "127.0.0.1", port: int = 0):
+        self.github = github or FakeGitHub()
+        fake = self.github
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            wbufsize = -1  # one write per response (headers + body), avoids Nagle/delayed-ACK stalls
+
+            def _serve(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                body = json.loads(raw) if raw else None
+                path = self.path
+                if path.endswith("/api/graphql"):
+                    path = "/graphql"
+                elif path.startswith("/api/v3/"):
+                    path = path[len("/api/v3"):]
+                status, headers, payload = fake.handle(self.command, path, body)
+                data = payload.encode("utf-8")
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_PATCH = do_DELETE = do_PUT = _serve
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,160 @@
+"""
+Local issue title -> number index.
+
+`IssueTitleIndex` replaces per-title search API calls: the first lookup pages
+through every issue in the repo once (100 per GraphQL request), later runs
+refresh incrementally with `filterBy: {since: ...}` from the persisted
+high-water mark, and each lookup is a dictionary hit. Issues recorded during
+a run (`add`) are written back in batches; call `flush()` at the end.
+
+When several issues share a title, lookups resolve to the oldest (lowest
+number); `matches()` lists all of them so callers can warn.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from .batch import gql_str
+from .cache import DeferredSave, load_json, repo_cache_path, save_json
+from .transport import Transport
+
+
+TITLE_INDEX_FILE = "issue-titles.json"
+
+
+def normalize_title(title: str) -> str:
+    """Key used for title matching (whitespace collapsed, case-insensitive)."""
+    return " ".join(title.split()).casefold()
+
+
+class IssueTitleIndex(DeferredSave):
+    def __init__(self, transport: Transport, owner: str, repo: str, persist: bool = True):
+        self.gh = transport
+        self.owner = owner
+        self.repo = repo
+        self._path = repo_cache_path(owner, repo, TITLE_INDEX_FILE) if persist else None
+        self._lock = threading.Lock()
+        self._refreshed = False
+        stored = (load_json(self._path, {}) if self._path else {}) or {}
+        self.synced_at: Optional[str] = stored.get("synced_at")
+        self._titles: Dict[int, str] = {int(n): t for n, t in (stored.get("issues") or {}).items()}
+        self._numbers: Dict[str, Set[int]] = {}  # title key -> numbers holding that title
+        self._rebuild()
+
+    def _rebuild(self):
+        self._numbers = {}
+        for number, title in self._titles.items():
+            self._numbers.setdefault(normalize_title(title), set()).add(number)
+
+    def _index(self, number: int, title: str, old: Optional[str]):
+        """Move one issue from title `old` to `title` in the lookup map"""
+        if old is not None:
+            key = normalize_title(old)
+            numbers = self._numbers.get(key, set())
+            numbers.discard(number)
+            if not numbers:
+                self._numbers.pop(key, None)
+        self._numbers.setdefault(normalize_title(title), set()).add(number)
+
+    def _save(self):
+        if self._path:
+            save_json(self._path, {
+                "synced_at": self.synced_at,
+                "issues": {str(n): t for n, t in sorted(self._titles.items())},
+            })
+
+    def _scan(self, since: Optional[str]) -> Tuple[Dict[int, str], Optional[str], int]:
+        """(number -> title, latest updatedAt, repo issue count) of issues updated since `since`"""
+        since_arg = f", filterBy: {{since: {gql_str(since)}}}" if since else ""
+        cursor: Optional[str] = None
+        titles: Dict[int, str] = {}
+        high_water = since
+        total = 0
+        while True:
+            after = f", after: {gql_str(cursor)}" if cursor else ""
+            count = "" if cursor else "\n    total: issues { totalCount }"
+            query = f"""
+query {{
+  repository(owner: {gql_str(self.owner)}, name: {gql_str(self.repo)}) {{
+    issues(first: 100{after}{since_arg}, orderBy: {{field: UPDATED_AT, direction: ASC}}) {{
+      nodes {{ number title updatedAt }}
+      pageInfo {{ hasNextPage endCursor }}
+    }}{count}
+  }}
+}}
+""".strip()
+            repo = self.gh.graphql(query)["repository"]
+            if not cursor:
+                total = repo["total"]["totalCount"]
+            conn = repo["issues"]
+            for node in conn["nodes"]:
+                titles[int(node["number"])] = node["title"]
+                if not high_water or node["updatedAt"] > high_water:
+                    high_water = node["updatedAt"]
+            page = conn["pageInfo"]
+            if not page["hasNextPage"]:
+                break
+            cursor = page["endCursor"]
+        return titles, high_water, total
+
+    def refresh(self) -> int:
+        """Fetch issues updated since the last sync; returns how many were seen.
+
+        Deleted or transferred issues never show up as updates. When the index
+        holds more issues than the repository has, it is rebuilt from a full
+        scan, which drops them.
+        """
+        full = not self.synced_at
+        titles, high_water, total = self._scan(self.synced_at)
+        if not full:
+            with self._lock:
+                known = len(self._titles.keys() | titles.keys())
+            if known > total:
+                full = True
+                titles, high_water, total = self._scan(None)
+
+        with self._lock:
+            if full:
+                self._titles = titles
+            else:
+                self._titles.update(titles)
+            self.synced_at = high_water
+            self._refreshed = True
+            self._rebuild()
+            self._pending = 0
+            self._save()
+        return len(titles)
+
+    def matches(self, title: str, exact: bool = True) -> List[int]:
+        """Numbers of the issues with this title, oldest first (refreshes once per run).
+
+        `exact` compares titles as written (surrounding whitespace ignored);
+        otherwise case and runs of whitespace are ignored too.
+        """
+        if not title:
+            return []
+        if not self._refreshed:
+            self.refresh()
+        with self._lock:
+            numbers = sorted(self._numbers.get(normalize_title(title), ()))
+            if exact:
+                numbers = [n for n in numbers if self._titles[n].strip() == title.strip()]
+        return numbers
+
+    def find(self, title: str, exact: bool = True) -> Optional[int]:
+        """Return the oldest issue with this title (see `matches`), or None."""
+        numbers = self.matches(title, exact)
+        return numbers[0] if numbers else None
+
+    def add(self, number: int, title: str):
+        """Record an issue this run created or retitled (no network call; written back in batches)."""
+        number = int(number)
+        with self._lock:
+            old = self._titles.get(number)
+            if old == title:
+                return
+            self._titles[number] = title
+            self._index(number, title, old)
+            self._changed()
@@ -0,0 +1,76 @@
+"""
+Org Issue Types (name -> node ID), cached on disk per org.
+
+All three tools need the same `organization { issueTypes }` map. It changes
+rarely, so it is cached in `<cache>/OWNER/issue-types.json` for
+`AIDE_ISSUE_TYPES_TTL` seconds (default 24h); `refresh=True` (the tools'
+`--refresh-cache`) forces a refetch, and so does a cached map that lacks one
+of the names the caller is about to use (a type added since the last fetch).
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Dict, Iterable
+
+from .batch import gql_str
+from .cache import load_json, org_cache_path, save_json
+from .transport import GitHubError, Transport
+
+
+ISSUE_TYPES_FILE = "issue-types.json"
+DEFAULT_TTL = 24 * 3600
+
+
+def fetch_issue_types(gh: Transport, owner: str) -> Dict[str, str]:
+    """Query org Issue Types and return name->ID (raises GitHubError if unavailable).
+
+    Only a missing organization gets the "not an organization" hint; other
+    failures (auth, rate limit, network) are raised with their own message.
+    """
+    query = f"""
+query {{
+  organization(login: {gql_str(owner)}) {{
+    issueTypes(first: 100) {{
+      nodes {{ id name }}
+    }}
+  }}
+}}
+""".strip()
+    try:
+        org = gh.graphql(query).get("organization")
+    except GitHubError as e:
+        if not e.not_found:
+            raise
+        org = None
+    if not org:
+        raise GitHubError(
+            f"Failed to query organization issue types for owner '{owner}'. "
+            "Ensure the repo owner is an organization and Issue Types are enabled.",
+            status=404,
+        )
+    return {n["name"]: n["id"] for n in org["issueTypes"]["nodes"]}
+
+
+def load_issue_types(
+    gh: Transport,
+    owner: str,
+    refresh: bool = False,
+    persist: bool = True,
+    want: Iterable[str] = (),
+) -> Dict[str, str]:
+    """Return org Issue Types, from the disk cache when fresh and complete."""
+    path = org_cache_path(owner, ISSUE_TYPES_FILE)
+    ttl = float(os.environ.get("AIDE_ISSUE_TYPES_TTL") or DEFAULT_TTL)
+    if persist and not refresh:
+        cached = load_json(path) or {}
+        types = cached.get("types") or {}
+        fresh = time.time() - float(cached.get("fetched_at", 0)) < ttl
+        if types and fresh and all(name in types for name in want):
+            return dict(types)
+
+    types = fetch_issue_types(gh, owner)
+    if persist:
+        save_json(path, {"fetched_at": time.time(), "types": types})
+    return types
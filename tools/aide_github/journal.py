@@ -0,0 +1,60 @@
+"""
+Append-only JSONL journal of completed operations.
+
+A run records each operation as soon as it has succeeded (one JSON object per
+line, flushed immediately). After a crash, a rerun opened with `resume=True`
+reads the entries back and skips that work without asking GitHub again. A
+truncated last line from an interrupted write is ignored, and terminated on
+resume so the next entry starts on a line of its own.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+class Journal:
+    def __init__(self, path: Path, resume: bool = False):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._torn = False  # the file ends in a partial line
+        self.entries: List[Dict[str, Any]] = self._read() if resume else []
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+        if self._torn:
+            self._file.write("\n")
+            self._file.flush()
+
+    def _read(self) -> List[Dict[str, Any]]:
+        entries = []
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    self._torn = not line.endswith("\n")
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            pass
+        return entries
+
+    def record(self, op: str, **fields: Any):
+        """Append one completed operation."""
+        entry = {"op": op, **fields}
+        with self._lock:
+            self.entries.append(entry)
+            self._file.write(json.dumps(entry, sort_keys=True) + "\n")
+            self._file.flush()
+
+    def of(self, op: str) -> List[Dict[str, Any]]:
+        """Entries recorded for one operation kind."""
+        with self._lock:
+            return [e for e in self.entries if e.get("op") == op]
+
+    def close(self):
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,179 @@
+"""
+Repository label inventory (name -> node ID and color), cached on disk per repo.
+
+`LabelInventory` replaces "list the first page of labels, then create what
+looks missing one request at a time": the full label list is paged through
+(100 per GraphQL request) at most once per run, and only labels that are
+truly missing are created, in aliased `createLabel` batches. The map is
+stored in `<cache>/OWNER/REPO/labels.json`; within `AIDE_LABELS_TTL` seconds
+(default 1h) a run whose labels are all cached makes no label requests at
+all. `refresh=True` (the tools' `--refresh-cache`) ignores the stored copy.
+
+The node IDs are what ID-based mutations (`addLabelsToLabelable`,
+`removeLabelsFromLabelable`, `createIssue(labelIds:)`) need, so callers look
+them up here instead of querying labels by name.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from .batch import DEFAULT_CHUNK_SIZE, gql_str, run_aliased
+from .cache import load_json, repo_cache_path, save_json
+from .transport import GitHubError, Transport
+
+
+LABELS_FILE = "labels.json"
+DEFAULT_TTL = 3600
+
+# name -> (color, description) for labels the caller asks to create
+LabelStyle = Callable[[str], Tuple[str, str]]
+
+
+class LabelInventory:
+    def __init__(self, transport: Transport, owner: str, repo: str, persist: bool = True,
+                 refresh: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.gh = transport
+        self.owner = owner
+        self.repo = repo
+        self.chunk_size = chunk_size
+        self._path = repo_cache_path(owner, repo, LABELS_FILE) if persist else None
+        self._lock = threading.RLock()  # the in-memory map; never held across a request
+        self._ensure_lock = threading.Lock()  # one ensure() at a time, so a label is created once
+        self._labels: Dict[str, Dict[str, str]] = {}
+        self._repo_id: Optional[str] = None
+        self._synced = False  # full list fetched during this run
+        ttl = float(os.environ.get("AIDE_LABELS_TTL") or DEFAULT_TTL)
+        if self._path and not refresh:
+            stored = load_json(self._path, {}) or {}
+            if time.time() - float(stored.get("fetched_at") or 0) < ttl:
+                self._labels = dict(stored.get("labels") or {})
+                self._repo_id = stored.get("repo_id")
+
+    def _save(self):
+        if self._path:
+            save_json(self._path, {
+                "fetched_at": time.time(),
+                "repo_id": self._repo_id,
+                "labels": dict(sorted(self._labels.items())),
+            })
+
+    def get(self, name: str) -> Optional[str]:
+        """Node ID of a label, if known (no network call)"""
+        with self._lock:
+            label = self._labels.get(name)
+            return label["id"] if label else None
+
+    def ids(self, names: Iterable[str]) -> Dict[str, str]:
+        """name -> node ID for the known labels among `names`"""
+        with self._lock:
+            return {n: self._labels[n]["id"] for n in names if n in self._labels}
+
+    def remember(self, labels: Iterable[Dict[str, str]]):
+        """Record labels seen in other responses ({'id', 'name'[, 'color']} nodes)"""
+        with self._lock:
+            changed = False
+            for label in labels:
+                known = self._labels.get(label["name"])
+                if not known or known["id"] != label["id"]:
+                    self._labels[label["name"]] = {"id": label["id"], "color": label.get("color") or ""}
+                    changed = True
+            if changed:
+                self._save()
+
+    def refresh(self) -> int:
+        """Fetch every label in the repo (paginated); returns how many exist"""
+        labels: Dict[str, Dict[str, str]] = {}
+        cursor: Optional[str] = None
+        while True:
+            after = f", after: {gql_str(cursor)}" if cursor else ""
+            query = f"""
+query {{
+  repository(owner: {gql_str(self.owner)}, name: {gql_str(self.repo)}) {{
+    id
+    labels(first: 100{after}) {{
+      nodes {{ id name color }}
+      pageInfo {{ hasNextPage endCursor }}
+    }}
+  }}
+}}
+""".strip()
+            repo = self.gh.graphql(query)["repository"]
+            for node in repo["labels"]["nodes"]:
+                labels[node["name"]] = {"id": node["id"], "color": node.get("color") or ""}
+            page = repo["labels"]["pageInfo"]
+            if not page["hasNextPage"]:
+                break
+            cursor = page["endCursor"]
+
+        with self._lock:
+            self._labels = labels
+            self._repo_id = repo["id"]
+            self._synced = True
+            self._save()
+        return len(labels)
+
+    def ensure(self, names: Iterable[str], style: LabelStyle) -> Dict[str, str]:
+        """Make sure every label exists; returns {name: error} for labels that could not be created.
+
+        Unknown names trigger one full refresh per run; whatever is still
+        missing afterwards is created in aliased batches of `chunk_size`.
+        Requests are made without holding the map's lock, so get()/lookup()
+        from other threads never wait on them.
+        """
+        with self._ensure_lock:
+            with self._lock:
+                wanted = [n for n in dict.fromkeys(names) if n not in self._labels]
+                synced = self._synced and self._repo_id
+            if not wanted:
+                return {}
+            if not synced:
+                self.refresh()
+                with self._lock:
+                    wanted = [n for n in wanted if n not in self._labels]
+            if not wanted:
+                return {}
+
+            fields = []
+            for name in wanted:
+                color, description = style(name)
+                fields.append((name, f"createLabel(input: {{repositoryId: {gql_str(self._repo_id)}, "
+                                     f"name: {gql_str(name)}, color: {gql_str(color)}, "
+                                     f"description: {gql_str(description)}}}) {{ label {{ id name color }} }}"))
+            failures: Dict[str, str] = {}
+            raced = False
+            created = []
+            for result in run_aliased(self.gh, fields, chunk_size=self.chunk_size):
+                label = (result.data or {}).get("label") if result.ok else None
+                if label:
+                    created.append(label)
+                elif "already" in str(result.error):
+                    raced = True  # created by someone else since the refresh
+                else:
+                    failures[result.key] = str(result.error)
+            self.remember(created)
+            if raced:
+                try:
+                    self.refresh()
+                except GitHubError:
+                    pass
+                with self._lock:
+                    failures.update({n: "label exists but could not be read back" for n in wanted
+                                     if n not in self._labels and n not in failures})
+            return failures
+
+    def lookup(self, names: Iterable[str]) -> Dict[str, str]:
+        """name -> node ID, fetching unknown names in one aliased `label(name:)` query"""
+        names = list(dict.fromkeys(names))
+        missing = [n for n in names if self.get(n) is None]
+        if missing:
+            fields = "\n".join(f"    l{i}: label(name: {gql_str(name)}) {{ id name color }}"
+                               for i, name in enumerate(missing))
+            query = (f"query {{\n  repository(owner: {gql_str(self.owner)}, "
+                     f"name: {gql_str(self.repo)}) {{\n{fields}\n  }}\n}}")
+            repo = self.gh.graphql(query)["repository"]
+            self.remember(repo[f"l{i}"] for i in range(len(missing)) if repo.get(f"l{i}"))
+        return self.ids(names)
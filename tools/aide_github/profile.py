@@ -0,0 +1,175 @@
+"""
+Per-phase profiling for the AIDE tools (`--profile`).
+
+A `Profiler` records spans: tool phases (parsing, label preflight, creation,
+linking, ...) opened with `span(profiler, name)`, and one span per GitHub call
+recorded by `Transport` when `transport.profiler` is set, carrying the
+operation name, HTTP status, GraphQL cost, retries and time spent paced or
+backing off.
+
+`write_trace()` exports Chrome trace-event JSON (load it in chrome://tracing
+or https://ui.perfetto.dev); `summary()` returns a console table of time per
+phase and per operation plus the slowest calls. Phase totals include nested
+phases and are summed across worker threads, so they can exceed the wall time;
+"waited" is the part of a call spent in rate-limit pacing or retry backoff.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Fields under these roots name the operation (e.g. repository { issue(...) } -> issue)
+_GQL_ROOTS = {"repository", "organization", "viewer"}
+_GQL_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|[{}():]|[_A-Za-z][_0-9A-Za-z]*|\S')
+_REST_ID_RE = re.compile(r"/\d+(?=/|$)")
+
+
+def graphql_operation(query: str) -> str:
+    """Short operation name for a GraphQL document: kind plus its top-level fields.
+
+    `mutation { a0: addSubIssue(...) a1: addSubIssue(...) }` -> "mutation addSubIssue";
+    `query { repository(...) { i1: issue(...) i2: issue(...) } }` -> "query issue".
+    """
+    text = query.lstrip()
+    kind = "mutation" if text.startswith("mutation") else "query"
+    names: List[str] = []
+    stack: List[Optional[str]] = []  # field that opened each enclosing selection set
+    last: Optional[str] = None  # most recent field name at the current level
+    recorded = False  # whether `last` was appended to names
+    parens = 0
+    after_colon = False
+    for token in _GQL_TOKEN_RE.findall(text):
+        if token == "(":
+            parens += 1
+        elif token == ")":
+            parens -= 1
+        elif parens:
+            continue
+        elif token == "{":
+            stack.append(last)
+            last, recorded = None, False
+        elif token == "}":
+            if stack:
+                stack.pop()
+            last, recorded = None, False
+        elif token == ":":
+            after_colon = True
+            continue
+        elif token[0].isalpha() or token[0] == "_":
+            if after_colon and recorded:
+                names.pop()  # `alias: field` names the field, not the alias
+            depth = len(stack)
+            top_level = depth == 1 or (depth == 2 and stack[1] in _GQL_ROOTS)
+            last, recorded = token, top_level
+            if top_level:
+                names.append(token)
+        after_colon = False
+    unique = sorted(set(names) - _GQL_ROOTS - {"rateLimit"})
+    return f"{kind} {'+'.join(unique)}" if unique else kind
+
+
+def rest_operation(method: str, path: str) -> str:
+    """Operation name for a REST call with numbers and the query string folded (GET /repos/o/r/issues/{n})"""
+    return f"{method} {_REST_ID_RE.sub('/{n}', path.split('?', 1)[0])}"
+
+
+class Profiler:
+    """Thread-safe span recorder; timestamps are relative to its creation."""
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, cat: str, start: float, end: float, args: Optional[Dict[str, Any]] = None):
+        """Record a finished span (start/end from time.perf_counter())"""
+        thread = threading.current_thread()
+        with self._lock:
+            self._threads.setdefault(thread.ident or 0, thread.name)
+            self._events.append({
+                "name": name, "cat": cat, "tid": thread.ident or 0,
+                "start": start - self._start, "dur": max(0.0, end - start), "args": dict(args or {}),
+            })
+
+    @contextmanager
+    def span(self, name: str, cat: str = "phase", **args) -> Iterator[Dict[str, Any]]:
+        """Time the block; the yielded dict is stored as the span's args (callers may add to it)"""
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.add(name, cat, start, time.perf_counter(), args)
+
+    # -- export ------------------------------------------------------------
+
+    def trace_events(self) -> List[Dict[str, Any]]:
+        """Chrome trace-event list (complete 'X' events plus thread names)"""
+        pid = os.getpid()
+        with self._lock:
+            events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                      for tid, name in self._threads.items()]
+            for e in self._events:
+                events.append({
+                    "name": e["name"], "cat": e["cat"], "ph": "X", "pid": pid, "tid": e["tid"],
+                    "ts": round(e["start"] * 1e6, 1), "dur": round(e["dur"] * 1e6, 1), "args": e["args"],
+                })
+        return events
+
+    def write_trace(self, path: Path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+
+    def summary(self, slowest: int = 5) -> List[str]:
+        """Console table: time per phase, per GitHub operation, and the slowest calls"""
+        with self._lock:
+            events = list(self._events)
+        if not events:
+            return []
+        wall = max(e["start"] + e["dur"] for e in events)
+        lines = [f"Profile: {wall:.2f}s wall"]
+
+        phases = [e for e in events if e["cat"] == "phase"]
+        if phases:
+            lines.append(f"  {'phase':<28} {'count':>6} {'total s':>9} {'avg ms':>8} {'% wall':>7}")
+            totals: Dict[str, List[float]] = {}
+            for e in phases:
+                totals.setdefault(e["name"], []).append(e["dur"])
+            for name, durs in sorted(totals.items(), key=lambda kv: -sum(kv[1])):
+                total = sum(durs)
+                lines.append(f"  {name:<28} {len(durs):>6} {total:>9.2f} {total / len(durs) * 1000:>8.1f} "
+                             f"{(total / wall * 100 if wall else 0):>6.1f}%")
+
+        calls = [e for e in events if e["cat"] == "call"]
+        if calls:
+            lines.append(f"  {'GitHub operation':<40} {'calls':>6} {'total s':>9} {'waited s':>8} {'avg ms':>8} "
+                         f"{'max ms':>8} {'retries':>7} {'cost':>5}")
+            by_op: Dict[str, List[Dict[str, Any]]] = {}
+            for e in calls:
+                by_op.setdefault(e["name"], []).append(e)
+            for name, group in sorted(by_op.items(), key=lambda kv: -sum(e["dur"] for e in kv[1])):
+                durs = [e["dur"] for e in group]
+                retries = sum(e["args"].get("retries", 0) for e in group)
+                cost = sum(e["args"].get("cost", 0) for e in group)
+                waited = sum(e["args"].get("paced_s", 0) + e["args"].get("backoff_s", 0) for e in group)
+                lines.append(f"  {name[:40]:<40} {len(group):>6} {sum(durs):>9.2f} {waited:>8.2f} "
+                             f"{sum(durs) / len(durs) * 1000:>8.1f} {max(durs) * 1000:>8.1f} {retries:>7} {cost:>5}")
+            statuses = Counter(e["args"].get("status") for e in calls)
+            lines.append("  statuses: " + ", ".join(f"{s}={n}" for s, n in sorted(statuses.items(), key=str)))
+            lines.append("  slowest calls:")
+            for e in sorted(calls, key=lambda e: -e["dur"])[:slowest]:
+                lines.append(f"    {e['dur'] * 1000:>8.1f} ms  {e['name']} (at {e['start']:.2f}s)")
+        return lines
+
+
+def span(profiler: Optional[Profiler], name: str, cat: str = "phase", **args):
+    """`profiler.span(...)`, or a no-op context when profiling is off"""
+    return profiler.span(name, cat, **args) if profiler is not None else nullcontext(args)
@@ -0,0 +1,304 @@
+"""
+Adaptive rate-limit governor for GitHub calls.
+
+The governor sits inside `Transport.request`:
+
+- Paces requests with token buckets: one per API resource (`core`, `graphql`,
+  `search`) plus one for content-creating writes (REST POST/PATCH/PUT/DELETE
+  and GraphQL mutations), which GitHub's secondary limits cap at ~80/minute.
+- Tracks the primary budget from `X-RateLimit-*` headers and the GraphQL
+  `rateLimit { cost remaining resetAt }` field. When a resource runs low, its
+  bucket slows to spread what is left evenly until the reset time.
+- Retries secondary-limit 403/429 responses (honouring `Retry-After`),
+  exhausted primary budgets (waits for reset), GraphQL `RATE_LIMITED` errors
+  and transient 5xx, with exponential backoff and full jitter. A 5xx is only
+  retried for idempotent requests: a POST or mutation may have been applied
+  before the error, and resending it could create a duplicate issue.
+
+`summary()` reports what happened; the tools print it at the end of a run.
+
+Environment:
+- `AIDE_GH_RATE=off` - disable pacing and retries
+- `AIDE_GH_READ_RATE` / `AIDE_GH_WRITE_RATE` - requests per second (defaults 20 / 1.33, i.e. 80 per minute)
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_READ_RATE = 20.0
+DEFAULT_WRITE_RATE = 80.0 / 60.0
+SECONDARY_LIMIT_WAIT = 60.0
+TRANSIENT_STATUSES = (500, 502, 503, 504)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; `acquire` blocks until a token is available."""
+
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, returning the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+@dataclass
+class ResourceState:
+    limit: Optional[int] = None
+    remaining: Optional[int] = None
+    reset: Optional[float] = None  # epoch seconds
+    used_cost: int = 0
+
+
+@dataclass
+class GovernorStats:
+    requests: int = 0
+    retries: int = 0
+    secondary_hits: int = 0
+    primary_hits: int = 0
+    transient_errors: int = 0
+    paced_seconds: float = 0.0
+    backoff_seconds: float = 0.0
+    graphql_cost: int = 0
+    resources: Dict[str, ResourceState] = field(default_factory=dict)
+
+
+def _parse_reset(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a `Retry-After` header (delay-seconds or HTTP-date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimitGovernor:
+    def __init__(
+        self,
+        read_rate: float = DEFAULT_READ_RATE,
+        write_rate: float = DEFAULT_WRITE_RATE,
+        burst: float = 10.0,
+        max_retries: int = 5,
+        base_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        max_wait: float = 900.0,
+        low_water: float = 0.1,
+    ):
+        self.read_rate = read_rate
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_wait = max_wait
+        self.low_water = low_water
+        self.stats = GovernorStats()
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {
+            "core": TokenBucket(read_rate, burst),
+            "graphql": TokenBucket(read_rate, burst),
+            "search": TokenBucket(30.0 / 60.0, 5),
+            "write": TokenBucket(write_rate, burst),
+        }
+        self._base_rates = {name: bucket.rate for name, bucket in self._buckets.items()}
+        self._blocked_until = 0.0  # shared pause after a secondary limit
+
+    @classmethod
+    def from_env(cls) -> Optional["RateLimitGovernor"]:
+        """Build a governor from AIDE_GH_* variables (None when disabled)."""
+        if os.environ.get("AIDE_GH_RATE", "").lower() in ("off", "0", "false", "none"):
+            return None
+        return cls(
+            read_rate=float(os.environ.get("AIDE_GH_READ_RATE") or DEFAULT_READ_RATE),
+            write_rate=float(os.environ.get("AIDE_GH_WRITE_RATE") or DEFAULT_WRITE_RATE),
+        )
+
+    @staticmethod
+    def resource_for(path: str) -> str:
+        if path == "/graphql":
+            return "graphql"
+        if path.startswith("/search/"):
+            return "search"
+        return "core"
+
+    # -- pacing ------------------------------------------------------------
+
+    def before_request(self, resource: str, is_write: bool) -> float:
+        """Block until the request may be sent; returns seconds waited."""
+        waited = 0.0
+        pause = self._blocked_until - time.time()
+        if pause > 0:
+            time.sleep(pause)
+            waited += pause
+        waited += self._buckets[resource].acquire()
+        if is_write:
+            waited += self._buckets["write"].acquire()
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.paced_seconds += waited
+        return waited
+
+    def _adapt(self, resource: str, state: ResourceState):
+        """Slow a resource's bucket to spread the remaining budget until reset."""
+        if state.limit is None or state.remaining is None or state.reset is None:
+            return
+        bucket = self._buckets.get(resource)
+        if not bucket:
+            return
+        base = self._base_rates[resource]
+        if state.remaining > state.limit * self.low_water:
+            bucket.rate = base
+            return
+        seconds_left = max(1.0, state.reset - time.time())
+        bucket.rate = min(base, max(state.remaining, 1) / seconds_left)
+
+    def record_headers(self, resource: str, headers: Dict[str, str]):
+        """Update budget tracking from X-RateLimit-* response headers."""
+        if "x-ratelimit-remaining" not in headers:
+            return
+        resource = headers.get("x-ratelimit-resource", resource)
+        with self._lock:
+            state = self.stats.resources.setdefault(resource, ResourceState())
+            try:
+                state.limit = int(headers.get("x-ratelimit-limit", state.limit or 0)) or state.limit
+                state.remaining = int(headers["x-ratelimit-remaining"])
+            except ValueError:
+                return
+            state.reset = _parse_reset(headers.get("x-ratelimit-reset")) or state.reset
+            self._adapt(resource, state)
+
+    def record_graphql_cost(self, rate_limit: Dict[str, Any]):
+        """Update tracking from a GraphQL `rateLimit { cost remaining resetAt }` selection."""
+        with self._lock:
+            state = self.stats.resources.setdefault("graphql", ResourceState())
+            cost = int(rate_limit.get("cost") or 0)
+            state.used_cost += cost
+            self.stats.graphql_cost += cost
+            if rate_limit.get("remaining") is not None:
+                state.remaining = int(rate_limit["remaining"])
+            if rate_limit.get("limit") is not None:
+                state.limit = int(rate_limit["limit"])
+            state.reset = _parse_reset(rate_limit.get("resetAt")) or state.reset
+            self._adapt("graphql", state)
+
+    # -- retries -----------------------------------------------------------
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.base_backoff * (2 ** attempt)))
+
+    def retry_delay(self, attempt: int, status: int, headers: Dict[str, str], payload: Any,
+                    idempotent: bool = True) -> Optional[float]:
+        """Return seconds to wait before retrying, or None if the response is final.
+
+        Rate-limit rejections are retried for every request (GitHub did not
+        apply them); transient 5xx only when `idempotent`.
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        message = ""
+        if isinstance(payload, dict):
+            message = str(payload.get("message") or "")
+            errors = payload.get("errors") or []
+            if status == 200 and any(isinstance(e, dict) and e.get("type") == "RATE_LIMITED" for e in errors):
+                return self._primary_wait(headers, attempt)
+
+        if status in (403, 429):
+            retry_after = headers.get("retry-after")
+            if retry_after or "secondary rate limit" in message.lower():
+                delay = _parse_retry_after(retry_after)
+                if delay is None:
+                    delay = max(SECONDARY_LIMIT_WAIT, self._backoff(attempt))
+                delay += random.uniform(0, 1)
+                with self._lock:
+                    self.stats.secondary_hits += 1
+                    self._blocked_until = max(self._blocked_until, time.time() + delay)
+                return self._count_retry(delay)
+            if headers.get("x-ratelimit-remaining") == "0":
+                return self._primary_wait(headers, attempt)
+            return None
+
+        if status in TRANSIENT_STATUSES:
+            with self._lock:
+                self.stats.transient_errors += 1
+            return self._count_retry(self._backoff(attempt)) if idempotent else None
+        return None
+
+    def _primary_wait(self, headers: Dict[str, str], attempt: int) -> Optional[float]:
+        reset = _parse_reset(headers.get("x-ratelimit-reset"))
+        delay = (reset - time.time() + 1) if reset else self._backoff(attempt)
+        delay = max(delay, 1.0) + random.uniform(0, 1)
+        if delay > self.max_wait:
+            return None
+        with self._lock:
+            self.stats.primary_hits += 1
+            self._blocked_until = max(self._blocked_until, time.time() + delay)
+        return self._count_retry(delay)
+
+    def _count_retry(self, delay: float) -> float:
+        with self._lock:
+            self.stats.retries += 1
+            self.stats.backoff_seconds += delay
+        return delay
+
+    # -- reporting ---------------------------------------------------------
+
+    def summary(self) -> List[str]:
+        s = self.stats
+        lines = [
+            f"Rate limits: {s.requests} request(s), {s.retries} retr{'y' if s.retries == 1 else 'ies'}, "
+            f"paced {s.paced_seconds:.1f}s, backoff {s.backoff_seconds:.1f}s",
+        ]
+        if s.secondary_hits or s.primary_hits or s.transient_errors:
+            lines.append(
+                f"  secondary-limit hits={s.secondary_hits}, primary-limit waits={s.primary_hits}, "
+                f"transient errors={s.transient_errors}"
+            )
+        if s.graphql_cost:
+            lines.append(f"  GraphQL cost={s.graphql_cost} point(s)")
+        for name, state in sorted(s.resources.items()):
+            if state.remaining is None:
+                continue
+            reset = datetime.fromtimestamp(state.reset).strftime("%H:%M:%S") if state.reset else "?"
+            lines.append(f"  {name}: {state.remaining}/{state.limit} remaining (resets {reset})")
+        return lines
@@ -0,0 +1,90 @@
+"""
+Issue number -> GraphQL node ID resolution.
+
+`IssueIdResolver` fetches IDs for many numbers per request (aliased
+`issue(number:)` fields), memoizes them for the run, and optionally persists
+the map per owner/repo. Node IDs never change, so the disk cache is never
+invalidated. IDs learned one at a time (`remember`) are written back in
+batches; call `flush()` at the end of a run.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Dict, Iterable, Optional
+
+from .batch import gql_str
+from .cache import DeferredSave, load_json, repo_cache_path, save_json
+from .transport import GitHubError, Transport
+
+
+ID_CACHE_FILE = "issue-ids.json"
+
+
+class IssueIdResolver(DeferredSave):
+    def __init__(self, transport: Transport, owner: str, repo: str, persist: bool = True, chunk_size: int = 100):
+        self.gh = transport
+        self.owner = owner
+        self.repo = repo
+        self.chunk_size = chunk_size
+        self._path = repo_cache_path(owner, repo, ID_CACHE_FILE) if persist else None
+        self._lock = threading.Lock()
+        self._ids: Dict[int, str] = {}
+        if self._path:
+            stored = load_json(self._path, {}) or {}
+            self._ids = {int(num): node_id for num, node_id in stored.items()}
+
+    def _save(self):
+        if self._path:
+            save_json(self._path, {str(num): node_id for num, node_id in sorted(self._ids.items())})
+
+    def remember(self, number: int, node_id: Optional[str]):
+        """Record an ID learned elsewhere (e.g. from a create response)."""
+        if not node_id:
+            return
+        with self._lock:
+            if self._ids.get(int(number)) == node_id:
+                return
+            self._ids[int(number)] = node_id
+            self._changed()
+
+    def resolve(self, numbers: Iterable[int]) -> Dict[int, str]:
+        """Return {number: node_id} for every number that exists.
+
+        Unknown numbers are fetched in aliased queries of `chunk_size`;
+        numbers that do not resolve to an issue are omitted from the result.
+        """
+        wanted = list(dict.fromkeys(int(n) for n in numbers))
+        with self._lock:
+            missing = [n for n in wanted if n not in self._ids]
+        for start in range(0, len(missing), self.chunk_size):
+            chunk = missing[start:start + self.chunk_size]
+            fields = "\n".join(f"    i{num}: issue(number: {num}) {{ id }}" for num in chunk)
+            query = (f"query {{\n  repository(owner: {gql_str(self.owner)}, name: {gql_str(self.repo)}) {{\n"
+                     f"{fields}\n  }}\n}}")
+            try:
+                data = self.gh.graphql(query)
+            except GitHubError as exc:
+                # Missing numbers come back as per-field NOT_FOUND errors with
+                # partial data; anything else is a real failure.
+                if not exc.data or not exc.data.get("repository"):
+                    raise
+                data = exc.data
+            repo_data = data.get("repository") or {}
+            with self._lock:
+                for num in chunk:
+                    node = repo_data.get(f"i{num}")
+                    if node and node.get("id"):
+                        self._ids[num] = node["id"]
+                        self._pending += 1
+        if missing:
+            self.flush()
+        with self._lock:
+            return {n: self._ids[n] for n in wanted if n in self._ids}
+
+    def get(self, number: int) -> str:
+        """Return the node ID for one issue number (raises GitHubError if missing)."""
+        ids = self.resolve([number])
+        if number not in ids:
+            raise GitHubError(f"Could not resolve issue #{number} in {self.owner}/{self.repo}")
+        return ids[number]
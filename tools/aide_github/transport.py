@@ -0,0 +1,423 @@
+"""
+GitHub transports shared by the AIDE tools.
+
+Every tool talks to GitHub through a `Transport`, which exposes two calls:
+`graphql(query, variables)` and `rest(method, path, body)`.
+
+Backends:
+- `HttpTransport` - keep-alive HTTPS connection pool speaking the API directly,
+  authenticated with the token `gh` already holds (one `gh auth token` call).
+- `GhCliTransport` - forks `gh api` per call (fallback when no token is available).
+- `aide_github.fake.FakeTransport` - in-memory fake GitHub for tests/benchmarks.
+
+Environment:
+- `AIDE_GH_TRANSPORT` - default backend (`auto`, `http`, `gh`)
+- `AIDE_GH_API_URL`   - API base URL override (GHE, or a local fake server)
+- `GH_TOKEN` / `GITHUB_TOKEN` - token for the HTTP backend (skips `gh auth token`)
+- `GH_REPO`           - OWNER/REPO override for repo detection
+- `AIDE_GH_RATE`      - `off` disables the rate-limit governor (see ratelimit.py)
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import queue
+import re
+import subprocess
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .profile import Profiler, graphql_operation, rest_operation
+from .ratelimit import RateLimitGovernor
+
+
+API_URL = "https://api.github.com"
+USER_AGENT = "aide-tools"
+RATE_LIMIT_ALIAS = "aideRateLimit"
+IDEMPOTENT_METHODS = ("GET", "HEAD", "PUT", "DELETE")
+# Pooled connections idle longer than this are not used for non-idempotent
+# requests: a stale keep-alive connection loses the response, and such a
+# request cannot be resent safely.
+WRITE_MAX_IDLE = 4.0
+
+
+class GitHubError(RuntimeError):
+    """A failed GitHub call (HTTP error status or GraphQL `errors`)."""
+
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        errors: Optional[List[Dict[str, Any]]] = None,
+        data: Any = None,
+    ):
+        super().__init__(message)
+        self.status = status
+        self.errors = errors or []
+        self.data = data
+
+    @property
+    def not_found(self) -> bool:
+        """A 404 or GraphQL NOT_FOUND: the object does not exist (or is not visible to the token)"""
+        return self.status == 404 or any(isinstance(e, dict) and e.get("type") == "NOT_FOUND" for e in self.errors)
+
+
+def is_idempotent(method: str, path: str, body: Optional[Any] = None) -> bool:
+    """Whether resending a request that may already have been applied is harmless.
+
+    GraphQL queries and GET/HEAD/PUT/DELETE are; POST, PATCH and GraphQL
+    mutations (creating issues, adding comments, ...) may repeat their effect.
+    """
+    if path == "/graphql":
+        return not str((body or {}).get("query", "")).lstrip().startswith("mutation")
+    return method.upper() in IDEMPOTENT_METHODS
+
+
+_GRAPHQL_KEYWORD_RE = re.compile(r'(?:[\s,\ufeff]|#[^\n]*)*(\w*)')
+# Comments and strings (skipped whole) and the punctuation that nests selection sets
+_GRAPHQL_NESTING_RE = re.compile(r'#[^\n]*|"""(?:[^"\\]|\\.|"(?!""))*"""|"(?:[^"\\\n]|\\.)*"|[(){}]')
+
+
+def _with_rate_limit(query: str) -> Optional[str]:
+    """`query` with the `rateLimit` selection added to its first operation's
+    top-level selection set, or None when that operation is not a query.
+
+    Fragment definitions are skipped; strings, comments and the braces of
+    object values inside arguments are not taken for selection sets.
+    """
+    depth = parens = 0
+    definition = 0  # where the current top-level definition starts
+    for token in _GRAPHQL_NESTING_RE.finditer(query):
+        ch = token.group()
+        if ch == "(":
+            parens += 1
+        elif ch == ")":
+            parens -= 1
+        elif parens or ch not in "{}":
+            continue
+        elif ch == "{":
+            if depth == 0:
+                keyword = _GRAPHQL_KEYWORD_RE.match(query, definition).group(1) or "query"
+                if keyword not in ("query", "fragment"):
+                    return None
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                if keyword == "query":
+                    end = token.start()
+                    return f"{query[:end]} {RATE_LIMIT_ALIAS}: rateLimit {{ cost limit remaining resetAt }}\n{query[end:]}"
+                definition = token.end()
+    return None
+
+
+class Transport:
+    """Base transport: subclasses implement `_send`."""
+
+    name = "base"
+
+    def __init__(self, governor: Optional[RateLimitGovernor] = None):
+        self.calls = 0
+        self.governor = governor
+        self.profiler: Optional[Profiler] = None  # set to record one span per call (--profile)
+        self._calls_lock = threading.Lock()
+
+    def _send(self, method: str, path: str, body: Optional[Any]) -> Tuple[int, Dict[str, str], str]:
+        """Perform one request, returning (status, headers, raw body)."""
+        raise NotImplementedError
+
+    def _call_span(self, method: str, path: str, body: Optional[Any]):
+        """Profiler span for one call (its args collect status, retries, waits and cost)"""
+        if self.profiler is None:
+            return nullcontext({})
+        if path == "/graphql":
+            name = graphql_operation(str((body or {}).get("query", "")))
+        else:
+            name = rest_operation(method.upper(), path)
+        return self.profiler.span(name, "call", transport=self.name)
+
+    def request(self, method: str, path: str, body: Optional[Any] = None) -> Any:
+        with self._call_span(method, path, body) as info:
+            return self._request(method, path, body, info)
+
+    def _request(self, method: str, path: str, body: Optional[Any], info: Dict[str, Any]) -> Any:
+        method = method.upper()
+        governor = self.governor
+        resource = RateLimitGovernor.resource_for(path)
+        if path == "/graphql":
+            is_write = str((body or {}).get("query", "")).lstrip().startswith("mutation")
+        else:
+            is_write = method != "GET"
+        idempotent = is_idempotent(method, path, body)
+
+        attempt = 0
+        while True:
+            if governor:
+                waited = governor.before_request(resource, is_write)
+                if waited:
+                    info["paced_s"] = round(info.get("paced_s", 0.0) + waited, 4)
+            with self._calls_lock:
+                self.calls += 1
+            status, headers, raw = self._send(method, path, body)
+            try:
+                payload = json.loads(raw) if raw.strip() else None
+            except ValueError:
+                payload = None
+            if governor:
+                governor.record_headers(resource, headers)
+                delay = governor.retry_delay(attempt, status, headers, payload, idempotent)
+                if delay is not None:
+                    time.sleep(delay)
+                    attempt += 1
+                    info["retries"] = attempt
+                    info["backoff_s"] = round(info.get("backoff_s", 0.0) + delay, 4)
+                    continue
+            break
+
+        info["status"] = status
+
+        if status >= 400:
+            message = payload.get("message") if isinstance(payload, dict) else raw.strip()
+            raise GitHubError(f"{method} {path} failed ({status}): {message}", status=status, data=payload)
+        return payload
+
+    def rest(self, method: str, path: str, body: Optional[Any] = None) -> Any:
+        """Call a REST endpoint (path relative to the API root) and return parsed JSON."""
+        return self.request(method, path, body)
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL document and return its `data`.
+
+        Raises GitHubError when the response carries `errors`; partial results
+        are available on the exception as `.data` (per-alias callers use this).
+        """
+        track_cost = False
+        if self.governor is not None or self.profiler is not None:
+            # Ask for the query's point cost alongside its data (queries only;
+            # `rateLimit` is not selectable on mutations).
+            costed = _with_rate_limit(query)
+            if costed is not None:
+                query, track_cost = costed, True
+        body: Dict[str, Any] = {"query": query}
+        if variables:
+            body["variables"] = variables
+        with self._call_span("POST", "/graphql", body) as info:
+            payload = self._request("POST", "/graphql", body, info) or {}
+            data = payload.get("data")
+            if track_cost and isinstance(data, dict) and data.get(RATE_LIMIT_ALIAS):
+                rate_limit = data.pop(RATE_LIMIT_ALIAS)
+                info["cost"] = int(rate_limit.get("cost") or 0)
+                if self.governor:
+                    self.governor.record_graphql_cost(rate_limit)
+        errors = payload.get("errors")
+        if errors:
+            message = "; ".join(str(e.get("message", e)) for e in errors)
+            raise GitHubError(f"GraphQL error: {message}", errors=errors, data=data)
+        return data or {}
+
+    def summary(self) -> List[str]:
+        """End-of-run report lines (rate-limit governor state), empty if ungoverned."""
+        return self.governor.summary() if self.governor else []
+
+    def close(self):
+        pass
+
+
+class HttpTransport(Transport):
+    """Direct HTTPS transport backed by a pool of keep-alive connections."""
+
+    name = "http"
+
+    def __init__(self, token: str, base_url: Optional[str] = None, pool_size: int = 8, timeout: float = 60.0,
+                 governor: Optional[RateLimitGovernor] = None):
+        super().__init__(governor)
+        parts = urlsplit(base_url or os.environ.get("AIDE_GH_API_URL") or API_URL)
+        self.scheme = parts.scheme or "https"
+        self.host = parts.hostname or "api.github.com"
+        self.port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._token = token
+        # (connection, time it was released)
+        self._pool: "queue.LifoQueue[Tuple[http.client.HTTPConnection, float]]" = queue.LifoQueue(maxsize=pool_size)
+
+    def _graphql_path(self) -> str:
+        # GHE serves REST at /api/v3 and GraphQL at /api/graphql.
+        if self.prefix.endswith("/api/v3"):
+            return self.prefix[: -len("/v3")] + "/graphql"
+        return self.prefix + "/graphql"
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        if self.scheme == "http":
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+
+    def _acquire(self, max_idle: Optional[float] = None) -> http.client.HTTPConnection:
+        while True:
+            try:
+                conn, released = self._pool.get_nowait()
+            except queue.Empty:
+                return self._new_connection()
+            if max_idle is None or time.monotonic() - released <= max_idle:
+                return conn
+            conn.close()
+
+    def _release(self, conn: http.client.HTTPConnection):
+        try:
+            self._pool.put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            conn.close()
+
+    def _send(self, method: str, path: str, body: Optional[Any]) -> Tuple[int, Dict[str, str], str]:
+        url = self._graphql_path() if path == "/graphql" else self.prefix + path
+        data = json.dumps(body).encode("utf-8") if body is not None else None
+        headers = {
+            "Authorization": f"bearer {self._token}",
+            "Accept": "application/vnd.github+json",
+            "User-Agent": USER_AGENT,
+            "Connection": "keep-alive",
+        }
+        if data is not None:
+            headers["Content-Type"] = "application/json; charset=utf-8"
+
+        # A pooled connection may have been closed by the server while idle;
+        # retry once on a fresh connection before giving up. Once the request
+        # has been sent, only idempotent requests are resent: the server may
+        # already have applied a POST or mutation whose response was lost.
+        idempotent = is_idempotent(method, path, body)
+        for attempt in range(2):
+            conn = self._acquire(None if idempotent else WRITE_MAX_IDLE)
+            sent = False
+            try:
+                conn.request(method, url, body=data, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                raw = resp.read().decode("utf-8")
+            except (http.client.RemoteDisconnected, http.client.CannotSendRequest,
+                    ConnectionResetError, BrokenPipeError) as exc:
+                conn.close()
+                if sent and not idempotent:
+                    raise GitHubError(f"{method} {path} failed: connection lost before the response ({exc}); "
+                                      "not resent, as it may already have been applied") from exc
+                if attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, raw
+        raise GitHubError(f"{method} {path} failed: connection closed")
+
+    def close(self):
+        while True:
+            try:
+                self._pool.get_nowait()[0].close()
+            except queue.Empty:
+                return
+
+
+class GhCliTransport(Transport):
+    """Fallback transport that forks `gh api` for every call."""
+
+    name = "gh"
+
+    _STATUS_RE = re.compile(r"^HTTP/\S+\s+(\d{3})")
+
+    def _send(self, method: str, path: str, body: Optional[Any]) -> Tuple[int, Dict[str, str], str]:
+        endpoint = "graphql" if path == "/graphql" else path.lstrip("/")
+        cmd = ["gh", "api", "--include", "--method", method, endpoint]
+        if body is not None:
+            cmd.extend(["--input", "-"])
+        result = subprocess.run(
+            cmd,
+            input=json.dumps(body) if body is not None else None,
+            capture_output=True, text=True, encoding="utf-8",
+        )
+        status, headers, raw = self._split_include(result.stdout)
+        if status is None:
+            # gh failed before any HTTP exchange (not installed, not authenticated, ...).
+            raise GitHubError(f"gh {' '.join(cmd[1:])} failed ({result.returncode}): {result.stderr.strip()}")
+        return status, headers, raw
+
+    @classmethod
+    def _split_include(cls, output: str) -> Tuple[Optional[int], Dict[str, str], str]:
+        """Split `gh api --include` output into status, headers and body."""
+        text = output.replace("\r\n", "\n")
+        match = cls._STATUS_RE.match(text)
+        if not match:
+            return None, {}, text
+        head, _, raw = text.partition("\n\n")
+        headers: Dict[str, str] = {}
+        for line in head.split("\n")[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        return int(match.group(1)), headers, raw
+
+
+def gh_auth_token() -> Optional[str]:
+    """Return a GitHub token from the environment or `gh auth token`."""
+    for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        if os.environ.get(var):
+            return os.environ[var]
+    try:
+        result = subprocess.run(["gh", "auth", "token"], capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
+def make_transport(kind: Optional[str] = None) -> Transport:
+    """Build a transport: `http`, `gh`, or `auto` (http when a token is available).
+
+    Transports built here are paced by a RateLimitGovernor unless AIDE_GH_RATE=off.
+    """
+    kind = (kind or os.environ.get("AIDE_GH_TRANSPORT") or "auto").lower()
+    governor = RateLimitGovernor.from_env()
+    if kind == "gh":
+        return GhCliTransport(governor)
+    if kind not in ("auto", "http"):
+        raise ValueError(f"Unknown transport '{kind}'. Use auto, http or gh.")
+    token = gh_auth_token()
+    if token:
+        return HttpTransport(token, governor=governor)
+    if kind == "http":
+        raise GitHubError("No GitHub token found (set GH_TOKEN or run `gh auth login`).")
+    return GhCliTransport(governor)
+
+
+_REMOTE_RE = re.compile(r"github\.com[:/](?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$")
+
+
+def detect_repo(repo_override: Optional[str] = None) -> Tuple[str, str]:
+    """Return (owner, repo) from an override, GH_REPO, the git remote, or `gh repo view`."""
+    value = repo_override or os.environ.get("GH_REPO")
+    if value:
+        owner, name = value.split("/", 1)
+        return owner, name
+
+    try:
+        result = subprocess.run(
+            ["git", "remote", "get-url", "origin"], capture_output=True, text=True, check=False
+        )
+    except OSError:
+        result = None
+    match = _REMOTE_RE.search(result.stdout.strip()) if result and result.returncode == 0 else None
+    if match:
+        return match.group("owner"), match.group("repo")
+
+    result = subprocess.run(
+        ["gh", "repo", "view", "--json", "owner,name"], capture_output=True, text=True, check=True
+    )
+    data = json.loads(result.stdout)
+    return data["owner"]["login"], data["name"]
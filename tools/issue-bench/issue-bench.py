@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Issue Bench - measure how many GitHub round trips issue-creator spends per issue
+
+Runs issue-creator against a local fake GitHub (aide_github.fake.FakeServer)
+with a configurable per-call latency, and reports wall time, API calls per
+issue, `gh` subprocesses and peak memory for each scenario. Thresholds fail
+the run when a change increases calls per issue.
+
+Usage:
+    ./issue-bench.py gen --epics 4 --children 50 --blockers 2 > specs.md
+    ./issue-bench.py run                          # default workload, check thresholds
+    ./issue-bench.py run --latency 0.05 --transport gh --concurrency 4
+    ./issue-bench.py run --write-thresholds       # record current calls/issue as the new limits
+"""
+
+import sys
+import os
+import json
+import math
+import re
+import random
+import argparse
+import shutil
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TOOLS_DIR))
+from aide_github.fake import FakeGitHub, FakeServer  # noqa: E402
+
+ISSUE_CREATOR = TOOLS_DIR / 'issue-creator' / 'issue-creator.py'
+THRESHOLDS_FILE = Path(__file__).resolve().parent / 'thresholds.json'
+SCENARIOS = ['create', 'update-auto', 'update-auto-noop', 'update-epic', 'update-blockers']
+
+WORDS = ('drone job queue priority resource refund cancel schedule worker claim render '
+         'save load network sync cache index label epic parser config budget retry').split()
+
+
+# ---------------------------------------------------------------------------
+# Synthetic specs
+# ---------------------------------------------------------------------------
+
+def generate_specs(epics: int, children: int, blockers: int, body_min: int = 200, body_max: int = 2000,
+                   seed: int = 0) -> List[str]:
+    """Return one spec file text per Epic (N epics x M children x K blockers).
+
+    Child c of each Epic is blocked by the K children before it. Bodies are
+    random words between body_min and body_max characters (seeded, so the
+    same arguments always produce the same specs).
+    """
+    rng = random.Random(seed)
+
+    def body(size: int) -> str:
+        words, length = [], 0
+        while length < size:
+            word = rng.choice(WORDS)
+            words.append(word)
+            length += len(word) + 1
+        lines = [' '.join(words[i:i + 12]) for i in range(0, len(words), 12)]
+        return '\n'.join(f"- {line}" for line in lines)
+
+    files = []
+    for e in range(epics):
+        sections = [f"## [Epic]: Bench Epic {e}\n\n### Goal\n{body(rng.randint(body_min, body_max))}\n"]
+        for c in range(children):
+            meta = f"priority: {('high', 'medium', 'low')[c % 3]}\narea: area-{c % 5}\n"
+            if blockers and c >= blockers:
+                meta += "blocked_by: " + ", ".join(f"Bench {e}.{c - k - 1}" for k in range(blockers)) + "\n"
+            sections.append(f"## [Feature]: Bench {e}.{c}\n{meta}\n### Goal\n{body(rng.randint(body_min, body_max))}\n")
+        files.append("\n---\n\n".join(sections))
+    return files
+
+
+def with_issue_numbers(text: str, numbers: Dict[str, int]) -> str:
+    """Add `issue_number: N` under every section heading whose issue exists"""
+    def add(match: 're.Match') -> str:
+        tag, title = match.group(1), match.group(2).strip()
+        num = numbers.get(f"[Epic]: {title}" if tag == 'Epic' else title)
+        return f"{match.group(0)}\nissue_number: {num}" if num else match.group(0)
+    return re.sub(r'^## \[(\w+)\]: (.*)$', add, text, flags=re.M)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+@dataclass
+class Result:
+    scenario: str
+    issues: int
+    calls: int
+    subprocesses: int
+    wall: float
+    peak_rss_mb: Optional[float]
+    ok: bool
+
+    @property
+    def calls_per_issue(self) -> float:
+        return self.calls / self.issues if self.issues else 0.0
+
+
+class Bench:
+    def __init__(self, workdir: Path, latency: float, transport: str, concurrency: int):
+        self.workdir = workdir
+        self.github = FakeGitHub(latency=latency)
+        self.server = FakeServer(self.github)
+        self.transport = transport
+        self.concurrency = concurrency
+        self.gh_log = workdir / 'fake-gh.log'
+        self.bin_dir = workdir / 'bin'
+        if transport == 'gh':
+            # GhCliTransport runs `gh` from PATH; make that fake-gh
+            self.bin_dir.mkdir()
+            (self.bin_dir / 'gh').symlink_to(Path(__file__).resolve().parent / 'fake-gh')
+
+    def env(self) -> Dict[str, str]:
+        env = dict(os.environ,
+                   GH_REPO=f"{self.github.owner}/{self.github.repo}",
+                   AIDE_GH_API_URL=self.server.url,
+                   AIDE_CACHE_DIR=str(self.workdir / 'cache'),
+                   AIDE_FAKE_GH_LOG=str(self.gh_log),
+                   AIDE_GH_RATE='off')  # measure round trips, not client-side pacing
+        if self.transport == 'gh':
+            env['PATH'] = str(self.bin_dir) + os.pathsep + env.get('PATH', '')
+            env.pop('GH_TOKEN', None)
+            env.pop('GITHUB_TOKEN', None)
+        else:
+            env['GH_TOKEN'] = 'fake-token'
+        return env
+
+    def run(self, scenario: str, issues: int, args: List[str]) -> Result:
+        """Run issue-creator once and measure it"""
+        calls_before = len(self.github.calls)
+        self.gh_log.write_text('')
+        cmd = [sys.executable, str(ISSUE_CREATOR), '--transport', self.transport] + args
+        with open(self.workdir / f'{scenario}.log', 'w', encoding='utf-8') as out:
+            start = time.perf_counter()
+            proc = subprocess.Popen(cmd, env=self.env(), cwd=self.workdir, stdin=subprocess.DEVNULL,
+                                    stdout=out, stderr=subprocess.STDOUT)
+            if hasattr(os, 'wait4'):
+                _, status, usage = os.wait4(proc.pid, 0)
+                proc.returncode = os.waitstatus_to_exitcode(status)
+                peak = usage.ru_maxrss / 1024  # kilobytes on Linux
+            else:
+                proc.wait()
+                peak = None
+            wall = time.perf_counter() - start
+
+        subprocesses = sum(1 for _ in open(self.gh_log, encoding='utf-8'))
+        return Result(scenario, issues, len(self.github.calls) - calls_before, subprocesses, wall, peak,
+                      proc.returncode == 0)
+
+    def numbers(self) -> Dict[str, int]:
+        return {issue.title: issue.number for issue in self.github.issues.values()}
+
+
+def run_suite(args: argparse.Namespace) -> List[Result]:
+    files = generate_specs(args.epics, args.children, args.blockers, args.body_min, args.body_max, args.seed)
+    spec_text = "\n---\n\n".join(files)
+    specs = args.epics * (args.children + 1)
+    blocked = args.epics * max(0, args.children - args.blockers) if args.blockers else 0
+
+    workdir = Path(tempfile.mkdtemp(prefix='issue-bench-'))
+    bench = Bench(workdir, args.latency, args.transport, args.concurrency)
+    spec_path = workdir / 'specs.md'
+    spec_path.write_text(spec_text, encoding='utf-8')
+    results = []
+    # Each scenario runs on the state the previous ones left; unselected prerequisites run unmeasured
+    needed = set(args.scenarios)
+    if needed - {'create'}:
+        needed.add('create')
+    if 'update-auto-noop' in needed:
+        needed.add('update-auto')
+
+    with bench.server:
+        for scenario in SCENARIOS:
+            if scenario not in needed:
+                continue
+            label = scenario if scenario in args.scenarios else f'setup-{scenario}'
+            if scenario == 'create':
+                result = bench.run(label, specs, [str(spec_path), '--concurrency', str(args.concurrency)])
+            elif scenario in ('update-auto', 'update-auto-noop'):
+                auto_path = workdir / 'specs-auto.md'
+                if not auto_path.exists():
+                    auto_path.write_text(with_issue_numbers(spec_text, bench.numbers()), encoding='utf-8')
+                result = bench.run(label, specs, [str(auto_path), '--update-auto'])
+            elif scenario == 'update-epic':
+                epic_num = bench.numbers()['[Epic]: Bench Epic 0']
+                epic_path = workdir / 'specs-epic.md'
+                epic_path.write_text(files[0], encoding='utf-8')
+                result = bench.run(label, args.children + 1, [str(epic_path), '--update-epic', str(epic_num)])
+            else:
+                result = bench.run(label, blocked, [str(spec_path), '--update-blockers'])
+            if not result.ok:
+                print(f"[ERROR] {label} failed; see {workdir / (label + '.log')}", file=sys.stderr)
+            if scenario in args.scenarios:
+                results.append(result)
+            elif not result.ok:
+                results.append(result)
+                break
+
+    if args.keep:
+        print(f"Work directory kept: {workdir}", file=sys.stderr)
+    elif all(r.ok for r in results):
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def print_table(results: List[Result], thresholds: Dict[str, Dict[str, float]]):
+    print(f"{'scenario':<18} {'issues':>6} {'calls':>6} {'calls/issue':>11} {'limit':>6} "
+          f"{'gh procs':>8} {'wall s':>7} {'peak MB':>8}")
+    for r in results:
+        limit = thresholds.get(r.scenario, {}).get('calls_per_issue')
+        peak = f"{r.peak_rss_mb:.1f}" if r.peak_rss_mb is not None else 'n/a'
+        print(f"{r.scenario:<18} {r.issues:>6} {r.calls:>6} {r.calls_per_issue:>11.2f} "
+              f"{(f'{limit:.2f}' if limit is not None else '-'):>6} {r.subprocesses:>8} {r.wall:>7.2f} {peak:>8}")
+
+
+def check_thresholds(results: List[Result], thresholds: Dict[str, Dict[str, float]]) -> List[str]:
+    """Return one message per scenario whose calls per issue exceed its limit"""
+    failures = []
+    for r in results:
+        limit = thresholds.get(r.scenario, {}).get('calls_per_issue')
+        if limit is not None and r.calls_per_issue > limit + 1e-9:
+            failures.append(f"{r.scenario}: {r.calls_per_issue:.2f} calls/issue exceeds the limit of {limit:.2f}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark issue-creator round trips against a local fake GitHub',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def workload(p: argparse.ArgumentParser, epics: int, children: int):
+        p.add_argument('--epics', type=int, default=epics, metavar='N', help=f'Epics (default: {epics})')
+        p.add_argument('--children', type=int, default=children, metavar='M',
+                       help=f'Children per Epic (default: {children})')
+        p.add_argument('--blockers', type=int, default=2, metavar='K',
+                       help='blocked_by entries per child, on the previous K children (default: 2)')
+        p.add_argument('--body-min', type=int, default=200, metavar='CHARS', help='Minimum body size (default: 200)')
+        p.add_argument('--body-max', type=int, default=2000, metavar='CHARS', help='Maximum body size (default: 2000)')
+        p.add_argument('--seed', type=int, default=0, help='Random seed for bodies (default: 0)')
+
+    gen = sub.add_parser('gen', help='Write synthetic spec file(s)')
+    workload(gen, 3, 20)
+    gen.add_argument('--out', metavar='DIR', help='Write one file per Epic into DIR (default: one spec on stdout)')
+
+    run = sub.add_parser('run', help='Run the benchmark scenarios')
+    workload(run, 2, 24)
+    run.add_argument('--latency', type=float, default=0.0, metavar='SECONDS',
+                     help='Fake server delay per API call (default: 0)')
+    run.add_argument('--transport', choices=['http', 'gh'], default='http',
+                     help='issue-creator backend; gh forks the bundled fake-gh per call (default: http)')
+    run.add_argument('--concurrency', type=int, default=1, metavar='N', help='issue-creator --concurrency (default: 1)')
+    run.add_argument('--scenarios', default=','.join(SCENARIOS), metavar='LIST',
+                     help=f"Comma-separated scenarios (default: {','.join(SCENARIOS)})")
+    run.add_argument('--thresholds', default=str(THRESHOLDS_FILE), metavar='PATH',
+                     help='Calls-per-issue limits (default: thresholds.json next to this script)')
+    run.add_argument('--write-thresholds', action='store_true', help='Save the measured calls/issue as the limits')
+    run.add_argument('--json', metavar='PATH', help='Also write the results as JSON')
+    run.add_argument('--keep', action='store_true', help='Keep the work directory (specs, logs, caches)')
+
+    args = parser.parse_args()
+
+    if args.command == 'gen':
+        files = generate_specs(args.epics, args.children, args.blockers, args.body_min, args.body_max, args.seed)
+        if args.out:
+            out = Path(args.out)
+            out.mkdir(parents=True, exist_ok=True)
+            for i, text in enumerate(files):
+                (out / f"epic-{i:03d}.md").write_text(text, encoding='utf-8')
+            print(f"Wrote {len(files)} spec file(s) to {out}")
+        else:
+            sys.stdout.write("\n---\n\n".join(files))
+        return
+
+    args.scenarios = [s.strip() for s in args.scenarios.split(',') if s.strip()]
+    unknown = [s for s in args.scenarios if s not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (choose from {', '.join(SCENARIOS)})")
+
+    thresholds_path = Path(args.thresholds)
+    thresholds = json.loads(thresholds_path.read_text(encoding='utf-8')) if thresholds_path.exists() else {}
+
+    print(f"Workload: {args.epics} epic(s) x {args.children} children x {args.blockers} blocker(s), "
+          f"transport={args.transport}, latency={args.latency}s, concurrency={args.concurrency}")
+    results = run_suite(args)
+    print()
+    print_table(results, thresholds)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(
+            [dict(asdict(r), calls_per_issue=round(r.calls_per_issue, 4)) for r in results], indent=2) + "\n",
+            encoding='utf-8')
+
+    if not all(r.ok for r in results):
+        sys.exit(1)
+
+    if args.write_thresholds:
+        for r in results:
+            thresholds.setdefault(r.scenario, {})['calls_per_issue'] = math.ceil(r.calls_per_issue * 100) / 100
+        thresholds_path.write_text(json.dumps(thresholds, indent=2, sort_keys=True) + "\n", encoding='utf-8')
+        print(f"\nWrote limits to {thresholds_path}")
+        return
+
+    failures = check_thresholds(results, thresholds)
+    if failures:
+        print()
+        for failure in failures:
+            print(f"[FAIL] {failure}", file=sys.stderr)
+        sys.exit(1)
+    print()
+    print("[OK] Calls per issue within limits")
+
+
+if __name__ == '__main__':
+    main()
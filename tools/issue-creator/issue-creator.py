@@ -6,6 +6,7 @@ Part of the AIDE framework. Project-specific config in issue-creator.config.json
 
 Usage:
     ./issue-creator.py spec.md                    # Create new issues
+    ./issue-creator.py specs/ 'plans/*.md'        # Create from many files in one run
     ./issue-creator.py spec.md --update 171       # Update issue #171
     ./issue-creator.py spec.md --update-epic 170  # Update Epic #170 + children
     ./issue-creator.py --help                     # Show help
@@ -15,12 +16,41 @@ import sys
 import os
 import json
 import re
-import subprocess
 import argparse
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+import functools
+import glob
+import hashlib
+import itertools
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from aide_github import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    AliasResult,
+    GitHubError,
+    IssueIdResolver,
+    IssueTitleIndex,
+    Journal,
+    LabelInventory,
+    Profiler,
+    Transport,
+    detect_repo,
+    gql_list,
+    gql_str,
+    load_issue_types,
+    make_transport,
+    repo_cache_path,
+    run_aliased,
+)
+from aide_github.cache import DeferredSave, cache_dir, load_json, save_json  # noqa: E402
+from aide_github.profile import span  # noqa: E402
+
 @dataclass
 class IssueSpec:
     title: str
@@ -34,9 +64,377 @@ class IssueSpec:
     blocked_by: List[str] = field(default_factory=list)
     issue_number: Optional[int] = None  # For update mode
 
+
+class BlockerGraph:
+    """Blocking relationships between spec sections, checked without touching GitHub.
+
+    `blocked_by: X` on section S and `blocks: S` on section X are the same
+    edge, merged into one set of (blocked, blocker) formatted titles.
+    References resolve through a single map of the sections' titles (the
+    formatted title or the heading text, whitespace and case ignored).
+
+    Sections can be added one at a time while a stream is read: a reference
+    to a section not seen yet waits until that section appears, and an edge
+    that would close a cycle is refused and recorded in `cycles`. References
+    that never resolve are reported by `unknown()`.
+    """
+
+    def __init__(self):
+        self.edges: List[Tuple[str, str]] = []
+        self.cycles: List[List[str]] = []  # each as blocked -> blocker -> ... -> blocked
+        self._edge_set = set()
+        self._titles: Dict[str, str] = {}  # title key -> formatted title
+        self._blockers: Dict[str, List[str]] = {}  # blocked title -> blocker titles
+        self._waiting: Dict[str, List[Tuple[str, str, str]]] = {}  # ref key -> [(title, field, ref)]
+
+    @staticmethod
+    def key(title: str) -> str:
+        return ' '.join(title.split()).casefold()
+
+    def add(self, title: str, spec: IssueSpec) -> List[Tuple[str, str]]:
+        """Add a section; returns the (blocked, blocker) edges that became resolvable"""
+        return self.add_refs(title, spec.title, spec.blocked_by, spec.blocks)
+
+    def add_refs(self, title: str, heading: str, blocked_by: List[str], blocks: List[str]) -> List[Tuple[str, str]]:
+        """add() from a section's final title, heading title and reference lists"""
+        new = []
+        keys = list(dict.fromkeys([self.key(title), self.key(heading)]))
+        for key in keys:
+            self._titles.setdefault(key, title)
+        for key in keys:
+            for source, field_name, _ref in self._waiting.pop(key, []):
+                new += self._link(source, self._titles[key], field_name)
+        for field_name, refs in (('blocked_by', blocked_by), ('blocks', blocks)):
+            for ref in refs:
+                target = self._titles.get(self.key(ref))
+                if target is None:
+                    self._waiting.setdefault(self.key(ref), []).append((title, field_name, ref))
+                else:
+                    new += self._link(title, target, field_name)
+        return new
+
+    def _link(self, title: str, other: str, field_name: str) -> List[Tuple[str, str]]:
+        blocked, blocker = (title, other) if field_name == 'blocked_by' else (other, title)
+        if (blocked, blocker) in self._edge_set:
+            return []
+        path = self._path(blocker, blocked)
+        if path is not None:
+            self.cycles.append([blocked] + path)
+            return []
+        self._edge_set.add((blocked, blocker))
+        self._blockers.setdefault(blocked, []).append(blocker)
+        self.edges.append((blocked, blocker))
+        return [(blocked, blocker)]
+
+    def _path(self, start: str, goal: str) -> Optional[List[str]]:
+        """Titles from `start` to `goal` following blocked-by edges (None if unreachable)"""
+        parents: Dict[str, Optional[str]] = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            if node == goal:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parents[node]
+                return path[::-1]
+            for blocker in self._blockers.get(node, ()):
+                if blocker not in parents:
+                    parents[blocker] = node
+                    stack.append(blocker)
+        return None
+
+    def unknown(self) -> List[Tuple[str, str, str]]:
+        """(title, field, reference) for references that match no section"""
+        return [entry for entries in self._waiting.values() for entry in entries]
+
+    def external_edges(self) -> List[Tuple[str, str]]:
+        """Unresolved references as (blocked, blocker) edges, the other end being the reference text"""
+        return [(title, ref) if field_name == 'blocked_by' else (ref, title)
+                for title, field_name, ref in self.unknown()]
+
+    def warnings(self) -> List[str]:
+        """One message per unresolved reference and per refused (cycle-closing) edge"""
+        messages = [f"'{title}' blocker not found: {ref}" if field_name == 'blocked_by'
+                    else f"'{title}' blocks an issue not in the spec: {ref}"
+                    for title, field_name, ref in self.unknown()]
+        return messages + [f"blocking cycle: {' -> '.join(cycle)}" for cycle in self.cycles]
+
+    def ordered_edges(self) -> List[Tuple[str, str]]:
+        """Edges in topological order: an issue's blockers are linked before the issues it blocks"""
+        blocks: Dict[str, List[str]] = {}
+        pending: Dict[str, int] = {}
+        for blocked, blocker in self.edges:
+            blocks.setdefault(blocker, []).append(blocked)
+            pending[blocked] = pending.get(blocked, 0) + 1
+            pending.setdefault(blocker, 0)
+        ready = [title for title, count in pending.items() if not count]
+        rank: Dict[str, int] = {}
+        while ready:
+            title = ready.pop(0)
+            rank[title] = len(rank)
+            for blocked in blocks.get(title, ()):
+                pending[blocked] -= 1
+                if not pending[blocked]:
+                    ready.append(blocked)
+        return sorted(self.edges, key=lambda edge: (rank[edge[1]], rank[edge[0]]))
+
+
+@dataclass
+class CreateRun:
+    """What IssueCreator._run_create_schedule did, for the create-mode report"""
+    specs: List[IssueSpec] = field(default_factory=list)
+    titles: List[str] = field(default_factory=list)
+    numbers: Dict[str, int] = field(default_factory=dict)
+    child_links: List[Tuple[str, str]] = field(default_factory=list)
+    blockers: BlockerGraph = field(default_factory=BlockerGraph)  # edges are (blocked, blocker) titles
+    link_results: Dict[Tuple[str, str, str], AliasResult] = field(default_factory=dict)
+    type_results: List[AliasResult] = field(default_factory=list)
+
+# Spec parsing tables, compiled once (see IssueCreator.iter_specs)
+SPEC_TITLE_RE = re.compile(
+    r'##\s*(?:\[(?P<tag>Epic|Bug|Tech Debt|Technical Debt|Feature|Chore|Documentation|Docs|Research)\]\s*:?\s*)?(?P<title>.+?)\s*$'
+)
+SPEC_FIELD_RE = re.compile(r'(?P<key>type|priority|area|blocks|blocked_by|parent|issue_number):\s*(?P<value>.*)$',
+                           re.IGNORECASE)
+SPEC_HEADER_ONLY_FIELDS = {'parent'}  # newer keys, only read from the metadata header
+SPEC_FIELD_VALUE_RES = {
+    'priority': re.compile(r'\w+'),
+    'issue_number': re.compile(r'\d+'),
+    '*': re.compile(r'.+'),
+}
+SPEC_TYPE_MAP = {
+    "feature": "feature",
+    "bug": "bug",
+    "technical-debt": "technical-debt",
+    "chore": "chore",
+    "documentation": "documentation",
+    "research": "research",
+}
+SPEC_TAG_MAP = {
+    "Epic": "epic",
+    "Feature": "feature",
+    "Bug": "bug",
+    "Tech Debt": "technical-debt",
+    "Technical Debt": "technical-debt",
+    "Chore": "chore",
+    "Documentation": "documentation",
+    "Docs": "documentation",
+    "Research": "research",
+}
+
+
+def split_lines(content: str) -> Iterator[str]:
+    """Yield the lines of `content`, keeping newlines (splits on \\n only, like re's `$`)"""
+    start = 0
+    while start < len(content):
+        end = content.find('\n', start)
+        if end < 0:
+            yield content[start:]
+            return
+        yield content[start:end + 1]
+        start = end + 1
+
+
+class PushState(DeferredSave):
+    """Per-repo record of the spec content last pushed to each issue.
+
+    Maps issue number -> fingerprint (hash of title, body, labels and Issue
+    Type as pushed), stored in the AIDE cache so --update-auto can skip
+    sections that did not change since the last run. Written back in batches
+    (see `flush`).
+    """
+    FILE = "pushed-specs.json"
+
+    def __init__(self, owner: str, repo: str, persist: bool = True):
+        self._path = repo_cache_path(owner, repo, self.FILE) if persist else None
+        self._lock = threading.Lock()
+        stored = (load_json(self._path, {}) if self._path else {}) or {}
+        self._hashes: Dict[int, str] = {int(num): digest for num, digest in stored.items()}
+
+    def unchanged(self, issue_num: int, fingerprint: str) -> bool:
+        with self._lock:
+            return self._hashes.get(int(issue_num)) == fingerprint
+
+    def fingerprint(self, issue_num: int) -> Optional[str]:
+        """Fingerprint last pushed to an issue (None if this machine never pushed it)"""
+        with self._lock:
+            return self._hashes.get(int(issue_num))
+
+    def record(self, issue_num: int, fingerprint: str):
+        with self._lock:
+            if self._hashes.get(int(issue_num)) == fingerprint:
+                return
+            self._hashes[int(issue_num)] = fingerprint
+            self._changed()
+
+    def _save(self):
+        if self._path:
+            save_json(self._path, {str(num): digest for num, digest in sorted(self._hashes.items())})
+
+
+class AreaMatcher:
+    """All `area_keywords` compiled into one regex, built as a trie of the keywords.
+
+    One left-to-right scan finds every keyword occurrence, so the cost grows
+    with the text, not with the number of areas/keywords. Modes:
+
+    - `substring` (default): the legacy `keyword in text` behaviour, spaces
+      included ("work queue" does not match "work\\n  queue").
+    - `word` (opt-in): keywords match whole words only ("ai" does not fire on
+      "maintain"); a multi-word keyword is a phrase and matches across any
+      whitespace ("work queue" matches "work\\n  queue").
+
+    Compiled matchers are memoized per process and cached on disk in
+    `<cache>/area-matchers/`, keyed on the config file's content hash and
+    the mode, so a run with an unchanged config skips the trie build.
+    """
+    _cache: Dict[str, 'AreaMatcher'] = {}
+    VERSION = 2  # bump when the compiled form changes
+
+    def __init__(self, area_keywords: Dict[str, List[str]], mode: str = 'substring'):
+        if mode not in ('word', 'substring'):
+            raise ValueError(f"Invalid area_match '{mode}'. Use 'word' or 'substring'.")
+        self.word = mode == 'word'
+        self.areas_by_keyword: Dict[str, set] = {}
+        for area, keywords in area_keywords.items():
+            for keyword in keywords:
+                key = self._normalize(keyword) if self.word else keyword.lower()
+                if key:
+                    self.areas_by_keyword.setdefault(key, set()).add(area)
+        self.all_areas = {a for areas in self.areas_by_keyword.values() for a in areas}
+
+        # The scan reports the longest keyword at each position; keywords it
+        # shadows (prefixes ending on a boundary) are folded in up front.
+        shadowed = {}
+        for key in self.areas_by_keyword:
+            for end in range(1, len(key)):
+                prefix = key[:end]
+                if prefix in self.areas_by_keyword and (not self.word or not re.match(r'\w', key[end])):
+                    shadowed.setdefault(key, set()).update(self.areas_by_keyword[prefix])
+        for key, areas in shadowed.items():
+            self.areas_by_keyword[key] |= areas
+
+        trie: Dict = {}
+        for key in self.areas_by_keyword:
+            node = trie
+            for ch in key:
+                node = node.setdefault(ch, {})
+            node[''] = True
+        body = self._trie_regex(trie, self.word) if trie else '(?!)'
+        if self.word:
+            self.regex = re.compile(rf'(?<!\w)(?=({body})(?!\w))')
+        else:
+            self.regex = re.compile(rf'(?=({body}))')
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return ' '.join(text.lower().split())
+
+    @classmethod
+    def _trie_regex(cls, node: Dict, word: bool) -> str:
+        # Word mode: a space in a phrase matches any run of whitespace; substring mode: one space
+        alternatives = [(r'\s+' if word and ch == ' ' else re.escape(ch)) + cls._trie_regex(child, word)
+                        for ch, child in sorted(node.items()) if ch]
+        if not alternatives:
+            return ''
+        body = alternatives[0] if len(alternatives) == 1 else '(?:' + '|'.join(alternatives) + ')'
+        if '' in node:
+            # Greedy optional: the longest keyword is tried first.
+            body = body + '?' if len(alternatives) == 1 and len(body) == 1 else f'(?:{body})?'
+        return body
+
+    @classmethod
+    def for_config(cls, area_keywords: Dict[str, List[str]], mode: str = 'substring',
+                   config_digest: Optional[str] = None, persist: bool = True) -> 'AreaMatcher':
+        """Matcher for a config, from the process memo, then the disk cache, then built.
+
+        `config_digest` is the hash of the config file the keywords came from;
+        without one the keyword table itself is hashed.
+        """
+        source = config_digest or json.dumps(area_keywords, sort_keys=True)
+        key = hashlib.sha256(json.dumps([cls.VERSION, source, mode]).encode('utf-8')).hexdigest()
+        matcher = cls._cache.get(key)
+        if matcher is not None:
+            return matcher
+        path = cache_dir() / 'area-matchers' / f'{key[:32]}.json'
+        stored = load_json(path) if persist else None
+        if isinstance(stored, dict) and stored.get('key') == key:
+            matcher = cls._from_stored(stored)
+        else:
+            matcher = cls(area_keywords, mode)
+            if persist:
+                save_json(path, {
+                    'key': key,
+                    'pattern': matcher.regex.pattern,
+                    'word': matcher.word,
+                    'areas_by_keyword': {k: sorted(v) for k, v in matcher.areas_by_keyword.items()},
+                })
+        cls._cache[key] = matcher
+        return matcher
+
+    @classmethod
+    def _from_stored(cls, stored: Dict) -> 'AreaMatcher':
+        matcher = cls.__new__(cls)
+        matcher.word = stored['word']
+        matcher.areas_by_keyword = {k: set(v) for k, v in stored['areas_by_keyword'].items()}
+        matcher.all_areas = {a for areas in matcher.areas_by_keyword.values() for a in areas}
+        matcher.regex = re.compile(stored['pattern'])
+        return matcher
+
+    def areas(self, text: str) -> List[str]:
+        """Sorted areas whose keywords occur in `text`"""
+        found = set()
+        for match in self.regex.finditer(text.lower()):
+            keyword = match.group(1)
+            found |= self.areas_by_keyword[self._normalize(keyword) if self.word else keyword]
+            if len(found) == len(self.all_areas):
+                break
+        return sorted(found)
+
+
+def phase(name: str):
+    """Record each call of the decorated IssueCreator method as a `name` span (--profile)"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with span(self.profiler, name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorate
+
+
+class ChecklistScan:
+    """Counts '- [ ]' checklist items in spec lines as they stream past"""
+    LINE_RE = re.compile(r'^\s*-\s*\[\s*\]')
+    ITEM_RE = re.compile(r'-\s*\[\s*\]')
+
+    def __init__(self):
+        self.found = False
+        self.count = 0
+
+    def tap(self, lines: Iterable[str]) -> Iterator[str]:
+        for line in lines:
+            if '[' in line:
+                self.found = self.found or bool(self.LINE_RE.match(line))
+                self.count += len(self.ITEM_RE.findall(line))
+            yield line
+
+    def warnings(self) -> List[str]:
+        if not self.found:
+            return []
+        return [
+            f"[WARN] Found {self.count} checklist item(s) '- [ ]' in spec.\n"
+            f"       Issues should use plain bullets '- item', not checklists.\n"
+            f"       Checklists belong in PRs (progress tracking), not Issues (descriptive).\n"
+            f"       The tool will proceed, but consider fixing the spec format."
+        ]
+
+
 class IssueCreator:
     DEFAULT_CONFIG = {
         "area_keywords": {},
+        "area_match": "substring",
         "default_priority": "medium",
         "default_status_ready": "status:ready",
         "epic_label": "Epic",
@@ -51,11 +449,124 @@ class IssueCreator:
         }
     }
 
-    def __init__(self):
+    def __init__(self, transport: Optional[Transport] = None, batch_size: int = DEFAULT_CHUNK_SIZE,
+                 use_cache: bool = True, refresh_cache: bool = False, transport_kind: Optional[str] = None,
+                 force: bool = False, profiler: Optional[Profiler] = None):
+        """No I/O beyond reading the config: the GitHub client, repo detection
+        and caches are set up on first use, so --plan never touches the network."""
+        self.profiler = profiler
+        if transport is not None and profiler is not None:
+            transport.profiler = profiler
+        self.config_digest: Optional[str] = None  # hash of the config file, set by _load_config
         self.config = self._load_config()
-        self.repo_info = self._get_repo_info()
-        self.issue_types = self._get_issue_types()
+        self._area_matcher: Optional[AreaMatcher] = None
+        self._gh = transport
+        self._transport_kind = transport_kind
+        self._repo_info: Optional[Dict[str, str]] = None
+        self._ids: Optional[IssueIdResolver] = None
+        self._titles: Optional[IssueTitleIndex] = None
+        self._duplicate_titles: Set[str] = set()  # titles already warned about by find_issue_by_title
+        self._pushed: Optional[PushState] = None
+        self._remote: Dict[int, Dict] = {}  # prefetched issue state, consumed by update_issue
+        self._seen_types: Dict[int, Optional[str]] = {}  # Issue Type id update_issue found when not setting it
+        self._remote_lock = threading.Lock()
+        self.noop_updates = 0
+        self.force = force
+        self._init_lock = threading.Lock()
+        self.batch_size = batch_size
+        self._labels: Optional[LabelInventory] = None
+        self._label_failures = set()
+        self.use_cache = use_cache
+        self.refresh_cache = refresh_cache
+        self._issue_types: Optional[Dict[str, str]] = None
+        self._types_refetched = refresh_cache
         self.created_issues = {}
+        self.journal: Optional[Journal] = None
+
+    @property
+    def gh(self) -> Transport:
+        """GitHub transport, built on the first real call"""
+        if self._gh is None:
+            with self._init_lock:
+                if self._gh is None:
+                    gh = make_transport(self._transport_kind)
+                    gh.profiler = self.profiler
+                    self._gh = gh
+        return self._gh
+
+    @property
+    def repo_info(self) -> Dict[str, str]:
+        if self._repo_info is None:
+            with self._init_lock:
+                if self._repo_info is None:
+                    self._repo_info = self._get_repo_info()
+        return self._repo_info
+
+    @property
+    def ids(self) -> IssueIdResolver:
+        if self._ids is None:
+            gh, owner, repo = self.gh, self.repo_info['owner'], self.repo_info['repo']
+            with self._init_lock:
+                if self._ids is None:
+                    self._ids = IssueIdResolver(gh, owner, repo, persist=self.use_cache)
+        return self._ids
+
+    @property
+    def labels(self) -> LabelInventory:
+        if self._labels is None:
+            gh, owner, repo = self.gh, self.repo_info['owner'], self.repo_info['repo']
+            with self._init_lock:
+                if self._labels is None:
+                    self._labels = LabelInventory(gh, owner, repo, persist=self.use_cache,
+                                                  refresh=self.refresh_cache, chunk_size=self.batch_size)
+        return self._labels
+
+    @property
+    def titles(self) -> IssueTitleIndex:
+        if self._titles is None:
+            gh, owner, repo = self.gh, self.repo_info['owner'], self.repo_info['repo']
+            with self._init_lock:
+                if self._titles is None:
+                    self._titles = IssueTitleIndex(gh, owner, repo, persist=self.use_cache)
+        return self._titles
+
+    @property
+    def pushed(self) -> PushState:
+        if self._pushed is None:
+            owner, repo = self.repo_info['owner'], self.repo_info['repo']
+            with self._init_lock:
+                if self._pushed is None:
+                    self._pushed = PushState(owner, repo, persist=self.use_cache)
+        return self._pushed
+
+    def open_journal(self, source: str, resume: bool = False) -> Journal:
+        """Journal completed operations for a spec source (file path or '<stdin>'; see --resume).
+
+        Kept with the repo's caches, or under the system temp directory with
+        --no-cache (so --resume still finds it, but nothing is written under
+        the cache directory).
+        """
+        digest = hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+        owner, repo, name = self.repo_info['owner'], self.repo_info['repo'], f'journal-{digest}.jsonl'
+        if self.use_cache:
+            path = repo_cache_path(owner, repo, name)
+        else:
+            path = Path(tempfile.gettempdir()) / 'aide' / owner / repo / name
+        self.journal = Journal(path, resume=resume)
+        return self.journal
+
+    def flush_caches(self):
+        """Write back cache changes batched during the run (IDs, titles and push fingerprints)"""
+        for cache in (self._ids, self._titles, self._pushed):
+            if cache is not None:
+                cache.flush()
+
+    def summary(self) -> List[str]:
+        """End-of-run summary lines: skipped no-op updates and rate limits (none without GitHub calls)"""
+        lines = []
+        if self.noop_updates:
+            lines.append(f"Skipped {self.noop_updates} no-op update(s) (issue already matched the spec)")
+        return lines + (self._gh.summary() if self._gh is not None else [])
 
     @staticmethod
     def _normalize_title(title: str) -> str:
@@ -71,48 +582,67 @@ class IssueCreator:
         """Return the formatted title for a spec."""
         return self._format_title(spec.title, spec.issue_type)
 
-    def find_issue_by_title(self, title: str) -> Optional[int]:
-        """Return an existing issue number by exact title (searches open+closed)."""
-        if not title:
-            return None
-
-        result = subprocess.run(
-            ['gh', 'issue', 'list', '--state', 'all', '--search', title,
-             '--json', 'number,title', '--limit', '100'],
-            capture_output=True, text=True, encoding='utf-8', check=True
-        )
-        issues = json.loads(result.stdout)
-
-        normalized = title.strip()
-        for issue in issues:
-            if issue['title'].strip() == normalized:
-                return issue['number']
-        return None
-
+    def spec_fingerprint(self, spec: IssueSpec) -> str:
+        """Hash of everything a push writes for this spec (title, body, labels, Issue Type).
+
+        Recorded only once all of it is on the issue: callers that set the
+        Issue Type separately (set_type=False) record it after that succeeds.
+        """
+        issue_type = self.config['issue_type_mapping'].get(spec.issue_type)
+        payload = [self.format_issue_title(spec), spec.body, sorted(self.labels_for_spec(spec)), issue_type]
+        return hashlib.sha256(json.dumps(payload).encode('utf-8')).hexdigest()
+
+    def needs_push(self, spec: IssueSpec) -> bool:
+        """False when the spec's issue already holds exactly this content (per the push state)"""
+        if self.force or not spec.issue_number:
+            return True
+        return not self.pushed.unchanged(spec.issue_number, self.spec_fingerprint(spec))
+
+    @phase('title lookup')
+    def find_issue_by_title(self, title: str, exact: bool = True) -> Optional[int]:
+        """Return an existing issue number by title (open+closed).
+
+        Served from the local title index (see IssueTitleIndex), which is
+        synced incrementally once per run instead of searching per title.
+        `exact=False` ignores case and extra whitespace, as blocker references
+        do. When several issues match, the oldest is used (with a warning).
+        """
+        numbers = self.titles.matches(title, exact)
+        if len(numbers) > 1 and title not in self._duplicate_titles:
+            self._duplicate_titles.add(title)
+            others = ', '.join(f"#{n}" for n in numbers[1:])
+            print(f"[WARN] {len(numbers)} issues are titled '{title}'; using the oldest, #{numbers[0]} "
+                  f"(also {others}).", file=sys.stderr)
+        return numbers[0] if numbers else None
+
+    @phase('label preflight')
     def ensure_labels(self, labels: List[str]):
-        """Ensure labels exist in the repo before creating issues."""
-        result = subprocess.run(
-            ['gh', 'label', 'list', '--json', 'name'],
-            capture_output=True, text=True, check=True
-        )
-        existing = {label['name'] for label in json.loads(result.stdout)}
-        missing = [label for label in labels if label not in existing]
-
-        for label in missing:
-            description = "Auto-created by issue-creator"
-            color = "c5def5"
-            if label == self.config.get('epic_label'):
-                description = "Parent issue grouping related work"
-                color = "7057ff"
-            elif label.startswith("priority:"):
-                color = "fbca04"
-            elif label.startswith("status:"):
-                color = "0e8a16"
-
-            subprocess.run(
-                ['gh', 'label', 'create', label, '--description', description, '--color', color],
-                capture_output=True, text=True
-            )
+        """Ensure labels exist in the repo before creating issues.
+
+        The repo's full label list comes from the label inventory (cached on
+        disk, paginated when refreshed); labels still missing are created in
+        aliased batches, and no request is made when every label is known.
+        """
+        wanted = [label for label in labels if label not in self._label_failures]
+        if not wanted:
+            return
+        try:
+            failures = self.labels.ensure(wanted, self._label_style)
+        except GitHubError as exc:
+            failures = {label: str(exc) for label in wanted if self.labels.get(label) is None}
+        for label, error in failures.items():
+            print(f"[WARN] Unable to create label '{label}': {error}", file=sys.stderr)
+            self._label_failures.add(label)
+
+    def _label_style(self, label: str) -> Tuple[str, str]:
+        """(color, description) for a label the tool creates"""
+        if label == self.config.get('epic_label'):
+            return "7057ff", "Parent issue grouping related work"
+        if label.startswith("priority:"):
+            return "fbca04", "Auto-created by issue-creator"
+        if label.startswith("status:"):
+            return "0e8a16", "Auto-created by issue-creator"
+        return "c5def5", "Auto-created by issue-creator"
 
     def labels_for_spec(self, spec: IssueSpec) -> List[str]:
         """Compute labels the tool will apply for a spec."""
@@ -125,7 +655,7 @@ class IssueCreator:
         labels.append(self.config['default_status_ready'])
         return labels
 
-    def ensure_labels_for_specs(self, specs: List[IssueSpec]):
+    def ensure_labels_for_specs(self, specs: Iterable[IssueSpec]):
         """Preflight and create any labels needed for specs."""
         label_set = set()
         for spec in specs:
@@ -143,206 +673,272 @@ class IssueCreator:
 
         for path in config_paths:
             if path.exists():
-                with open(path) as f:
-                    user_config = json.load(f)
-                    # Merge with defaults
-                    config = self.DEFAULT_CONFIG.copy()
-                    config.update(user_config)
-                    print(f"[OK] Loaded config from {path}", file=sys.stderr)
-                    return config
+                raw = path.read_bytes()
+                self.config_digest = hashlib.sha256(raw).hexdigest()
+                user_config = json.loads(raw)
+                # Merge with defaults
+                config = self.DEFAULT_CONFIG.copy()
+                config.update(user_config)
+                print(f"[OK] Loaded config from {path}", file=sys.stderr)
+                return config
 
         print("[WARN] No config found, using defaults (no area inference)", file=sys.stderr)
         print("  Create issue-creator.config.json in project root to customize", file=sys.stderr)
         return self.DEFAULT_CONFIG
 
+    @phase('repo lookup')
     def _get_repo_info(self) -> Dict[str, str]:
-        """Get owner and repo from gh CLI"""
-        result = subprocess.run(
-            ['gh', 'repo', 'view', '--json', 'owner,name'],
-            capture_output=True, text=True, check=True
-        )
-        data = json.loads(result.stdout)
+        """Get owner and repo (GH_REPO, git remote, or gh CLI)"""
+        owner, repo = detect_repo()
         return {
-            'owner': data['owner']['login'],
-            'repo': data['name']
+            'owner': owner,
+            'repo': repo
         }
 
-    def _get_issue_types(self) -> Dict[str, str]:
-        """Query org issue types and return name->ID mapping"""
-        query = f'''{{
-          organization(login: "{self.repo_info['owner']}") {{
-            issueTypes(first: 100) {{
-              nodes {{
-                id
-                name
-              }}
-            }}
-          }}
-        }}'''
+    def _repo_path(self) -> str:
+        """REST path prefix for the current repository"""
+        return f"/repos/{self.repo_info['owner']}/{self.repo_info['repo']}"
 
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={query}'],
-            capture_output=True, text=True, check=True
-        )
+    @property
+    def issue_types(self) -> Dict[str, str]:
+        """Org Issue Types name->ID, loaded on first use (see aide_github.issue_types)"""
+        if self._issue_types is None:
+            self._issue_types = self._get_issue_types()
+        return self._issue_types
 
-        data = json.loads(result.stdout)
-        types = data['data']['organization']['issueTypes']['nodes']
-        return {t['name']: t['id'] for t in types}
+    @phase('issue types')
+    def _get_issue_types(self, want: Iterable[str] = ()) -> Dict[str, str]:
+        """Load org issue types from the shared cache (or the API when stale)"""
+        try:
+            return load_issue_types(self.gh, self.repo_info['owner'], refresh=self.refresh_cache,
+                                    persist=self.use_cache, want=want)
+        except GitHubError as e:
+            print(f"[WARN] {e}", file=sys.stderr)
+            return {}
 
     def infer_areas(self, text: str) -> List[str]:
         """Infer area labels from content using config keywords"""
         if not self.config.get('area_keywords'):
             return []
-
-        text_lower = text.lower()
-        areas = set()
-
-        for area, keywords in self.config['area_keywords'].items():
-            if any(kw in text_lower for kw in keywords):
-                areas.add(area)
-
-        return sorted(areas)
+        if self._area_matcher is None:
+            self._area_matcher = AreaMatcher.for_config(self.config['area_keywords'],
+                                                        self.config.get('area_match', 'substring'),
+                                                        self.config_digest, persist=self.use_cache)
+        return self._area_matcher.areas(text)
 
     def check_for_checklists(self, content: str) -> List[str]:
         """Check for checklist patterns and return warnings"""
-        warnings = []
-        checklist_pattern = re.compile(r'^(\s*)-\s*\[\s*\]', re.MULTILINE)
-        matches = checklist_pattern.findall(content)
-
-        if matches:
-            count = len(re.findall(r'-\s*\[\s*\]', content))
-            warnings.append(
-                f"[WARN] Found {count} checklist item(s) '- [ ]' in spec.\n"
-                f"       Issues should use plain bullets '- item', not checklists.\n"
-                f"       Checklists belong in PRs (progress tracking), not Issues (descriptive).\n"
-                f"       The tool will proceed, but consider fixing the spec format."
-            )
-        return warnings
+        scan = ChecklistScan()
+        for _ in scan.tap(split_lines(content)):
+            pass
+        return scan.warnings()
 
     def parse_spec_file(self, content: str) -> List[IssueSpec]:
         """Parse spec file into IssueSpec objects"""
-        specs = []
+        return list(self.iter_specs(split_lines(content)))
+
+    def parse_spec_files(self, paths: List[Path], workers: int = 8) -> Tuple[List[IssueSpec], List[str]]:
+        """Parse several spec files on a thread pool; returns (specs in path order, checklist warnings).
+
+        Each file is parsed on its own (an Epic scopes the sections after it
+        within its file only); cross-file parents use the `parent:` field.
+        """
+        def parse(path: Path) -> Tuple[List[IssueSpec], ChecklistScan]:
+            checklists = ChecklistScan()
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    return list(self.iter_specs(checklists.tap(f))), checklists
+            except ValueError as exc:
+                raise ValueError(f"{path}: {exc}") from exc
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(paths)))) as pool:
+            parsed = list(pool.map(parse, paths))
+
+        specs = [spec for file_specs, _ in parsed for spec in file_specs]
+        merged = ChecklistScan()
+        for _, checklists in parsed:
+            merged.found = merged.found or checklists.found
+            merged.count += checklists.count
+        return specs, merged.warnings()
+
+    def iter_specs(self, lines: Iterable[str]) -> Iterator[IssueSpec]:
+        """Yield IssueSpec objects from spec lines (a file, stdin, or a list).
+
+        Single pass: each line is read once and only the current section is
+        held in memory, so callers can start on the first specs while the
+        rest of the input is still arriving.
+        """
         # Specs are separated by a single line containing exactly `---`.
         #
         # IMPORTANT: `---` is reserved for spec boundaries and should not be used
         # inside a single spec section. If you need visual separation within a
         # spec, use headings (`### ...`) or another marker (e.g. `***`).
-        sections = re.split(r'(?m)^\s*---\s*$', content)
+        #
+        # Section text matches the former re.split(r'(?m)^\s*---\s*$'): blank
+        # lines around a separator belong to the separator, and every section
+        # after the first starts with the separator's newline.
+        section: List[str] = []
+        blank: List[str] = []
+        leading = True
+        first = True
         current_epic = None
 
-        for section in sections:
-            if not section.strip():
+        for line in lines:
+            if line.strip() == '---':
+                spec = self._parse_section(''.join(section) if first else '\n' + ''.join(section), current_epic)
+                if spec:
+                    if spec.is_epic:
+                        current_epic = self._format_title(spec.title, spec.issue_type)
+                    yield spec
+                section, blank, leading, first = [], [], True, False
+            elif not line.strip():
+                if first or not leading:
+                    blank.append(line)
+            else:
+                section.extend(blank)
+                blank = []
+                section.append(line)
+                leading = False
+
+        text = ''.join(section + blank)
+        spec = self._parse_section(text if first else '\n' + text, current_epic)
+        if spec:
+            yield spec
+
+    def iter_blocker_refs(self, lines: Iterable[str]) -> Iterator[Tuple[str, str, List[str], List[str]]]:
+        """Yield (final title, heading title, blocked_by, blocks) per section, for BlockerGraph.add_refs.
+
+        Reads only each section's title heading and blocks/blocked_by lines,
+        with the same rules as _parse_section but no body, area inference or
+        IssueSpec, so a spec can be checked for cycles far faster than parsed.
+        Sections without a title heading are skipped (iter_specs reports them).
+        """
+        title_match = None
+        fields: Dict[str, str] = {}
+        for line in itertools.chain(lines, ['---']):
+            if line.strip() == '---':
+                if title_match:
+                    title = self._normalize_title(title_match.group('title'))
+                    issue_type = 'epic' if (title_match.group('tag') or '').strip() == 'Epic' else ''
+                    blocked_by, blocks = ([ref.strip() for ref in fields[key].split(',')] if key in fields else []
+                                          for key in ('blocked_by', 'blocks'))
+                    yield self._format_title(title, issue_type), title, blocked_by, blocks
+                title_match, fields = None, {}
                 continue
+            field_match = SPEC_FIELD_RE.match(line)
+            if field_match:
+                key = field_match.group('key').lower()
+                if key in ('blocks', 'blocked_by') and key not in fields:
+                    value = SPEC_FIELD_VALUE_RES['*'].match(field_match.group('value'))
+                    if value:
+                        fields[key] = value.group(0)
+            elif title_match is None:
+                title_match = SPEC_TITLE_RE.match(line)
+
+    def _parse_section(self, section: str, current_epic: Optional[str]) -> Optional[IssueSpec]:
+        """Build the IssueSpec for one section (None for a blank section)"""
+        if not section.strip():
+            return None
 
-            issue_type = "feature"  # default
-            type_match = re.search(r'^type:\s*(.+?)$', section, re.MULTILINE | re.IGNORECASE)
-            if type_match:
-                raw_type = type_match.group(1).strip().lower()
-                type_map = {
-                    "feature": "feature",
-                    "bug": "bug",
-                    "technical-debt": "technical-debt",
-                    "chore": "chore",
-                    "documentation": "documentation",
-                    "research": "research",
-                }
-                issue_type = type_map.get(raw_type, raw_type)
-
-            title_match = re.search(
-                r'^##\s*(?:\[(?P<tag>Epic|Bug|Tech Debt|Technical Debt|Feature|Chore|Documentation|Docs|Research)\]\s*:?\s*)?(?P<title>.+?)\s*$',
-                section, re.MULTILINE
+        # First occurrence of each metadata field and of the title heading wins.
+        # `parent:` is only read from the metadata header (the field lines around
+        # the heading, before any body text), so body lines starting with
+        # "parent:" stay text as they were before the key existed.
+        fields: Dict[str, str] = {}
+        title_match = None
+        header = True
+        for line in section.split('\n'):
+            field_match = SPEC_FIELD_RE.match(line)
+            if field_match and (header or field_match.group('key').lower() not in SPEC_HEADER_ONLY_FIELDS):
+                key = field_match.group('key').lower()
+                if key not in fields:
+                    value = SPEC_FIELD_VALUE_RES.get(key, SPEC_FIELD_VALUE_RES['*']).match(field_match.group('value'))
+                    if value:
+                        fields[key] = value.group(0)
+                continue
+            if title_match is None:
+                title_match = SPEC_TITLE_RE.match(line)
+                if title_match:
+                    continue
+            if line.strip():
+                header = False
+
+        issue_type = "feature"  # default
+        if 'type' in fields:
+            raw_type = fields['type'].strip().lower()
+            issue_type = SPEC_TYPE_MAP.get(raw_type, raw_type)
+
+        if not title_match:
+            raise ValueError(
+                "Spec section is missing a level-2 heading like '## [Feature]: Title'. "
+                "Remember: '---' can only appear between specs."
             )
-            if not title_match:
-                raise ValueError(
-                    "Spec section is missing a level-2 heading like '## [Feature]: Title'. "
-                    "Remember: '---' can only appear between specs."
-                )
-
-            raw_title = title_match.group('title').strip()
-            title = self._normalize_title(raw_title)
-
-            raw_tag = (title_match.group('tag') or '').strip()
-            tag_map = {
-                "Epic": "epic",
-                "Feature": "feature",
-                "Bug": "bug",
-                "Tech Debt": "technical-debt",
-                "Technical Debt": "technical-debt",
-                "Chore": "chore",
-                "Documentation": "documentation",
-                "Docs": "documentation",
-                "Research": "research",
-            }
 
-            is_epic = raw_tag == "Epic"
-            if is_epic:
-                issue_type = "epic"
-            elif raw_title.lower().startswith("issue:"):
-                raise ValueError(
-                    f"Legacy heading '## Issue: ...' is not supported for '{title}'. "
-                    "Use a typed heading like '## [Feature]: Title' instead."
-                )
-            elif raw_tag:
-                issue_type = tag_map.get(raw_tag, issue_type)
-            elif not type_match:
-                raise ValueError(
-                    f"Missing required issue type for '{title}'. "
-                    "Add a heading tag like '## [Feature]:' or metadata 'type: <value>'."
-                )
-            elif issue_type not in (
-                "feature", "bug", "technical-debt", "chore", "documentation", "research"
-            ):
-                raise ValueError(
-                    f"Invalid issue type '{issue_type}' for '{title}'. "
-                    "Allowed values: feature, bug, technical-debt, chore, documentation, research."
-                )
-
-            # Extract fields
-            priority_match = re.search(r'^priority:\s*(\w+)', section, re.MULTILINE | re.IGNORECASE)
-            priority = priority_match.group(1) if priority_match else self.config['default_priority']
-
-            area_match = re.search(r'^area:\s*(.+?)$', section, re.MULTILINE | re.IGNORECASE)
-            explicit_areas = [a.strip() for a in area_match.group(1).split(',')] if area_match else []
-
-            blocks_match = re.search(r'^blocks:\s*(.+?)$', section, re.MULTILINE | re.IGNORECASE)
-            blocks = [b.strip() for b in blocks_match.group(1).split(',')] if blocks_match else []
-
-            blocked_match = re.search(r'^blocked_by:\s*(.+?)$', section, re.MULTILINE | re.IGNORECASE)
-            blocked_by = [b.strip() for b in blocked_match.group(1).split(',')] if blocked_match else []
-
-            issue_num_match = re.search(r'^issue_number:\s*(\d+)', section, re.MULTILINE | re.IGNORECASE)
-            issue_number = int(issue_num_match.group(1)) if issue_num_match else None
-
-            # Infer areas from content.
-            #
-            # If the spec provides explicit `area:` values, treat them as the
-            # source of truth and do not add inferred areas (prevents noisy
-            # labels from incidental keywords in the body).
-            inferred_areas = self.infer_areas(section) if not explicit_areas else []
-            areas = list(set(explicit_areas + inferred_areas))
-
-            if is_epic:
-                current_epic = self._format_title(title, issue_type)
-
-            spec = IssueSpec(
-                title=title,
-                body=section,
-                priority=priority,
-                areas=areas,
-                is_epic=is_epic,
-                issue_type=issue_type,
-                parent_title=current_epic if not is_epic else None,
-                blocks=blocks,
-                blocked_by=blocked_by,
-                issue_number=issue_number
+        raw_title = title_match.group('title').strip()
+        title = self._normalize_title(raw_title)
+        raw_tag = (title_match.group('tag') or '').strip()
+
+        is_epic = raw_tag == "Epic"
+        if is_epic:
+            issue_type = "epic"
+        elif raw_title.lower().startswith("issue:"):
+            raise ValueError(
+                f"Legacy heading '## Issue: ...' is not supported for '{title}'. "
+                "Use a typed heading like '## [Feature]: Title' instead."
+            )
+        elif raw_tag:
+            issue_type = SPEC_TAG_MAP.get(raw_tag, issue_type)
+        elif 'type' not in fields:
+            raise ValueError(
+                f"Missing required issue type for '{title}'. "
+                "Add a heading tag like '## [Feature]:' or metadata 'type: <value>'."
+            )
+        elif issue_type not in SPEC_TYPE_MAP:
+            raise ValueError(
+                f"Invalid issue type '{issue_type}' for '{title}'. "
+                "Allowed values: feature, bug, technical-debt, chore, documentation, research."
             )
 
-            specs.append(spec)
+        # Extract fields
+        priority = fields.get('priority', self.config['default_priority'])
+        explicit_areas = [a.strip() for a in fields['area'].split(',')] if 'area' in fields else []
+        blocks = [b.strip() for b in fields['blocks'].split(',')] if 'blocks' in fields else []
+        blocked_by = [b.strip() for b in fields['blocked_by'].split(',')] if 'blocked_by' in fields else []
+        if 'parent' in fields:
+            # Explicit Epic reference (may live in another spec file of the same run)
+            parent_name = self._normalize_title(fields['parent'])
+            if parent_name.startswith('[Epic]'):
+                parent_name = parent_name[len('[Epic]'):].lstrip(' :')
+            current_epic = self._format_title(parent_name, 'epic')
+        issue_number = int(fields['issue_number']) if 'issue_number' in fields else None
+
+        # Infer areas from content.
+        #
+        # If the spec provides explicit `area:` values, treat them as the
+        # source of truth and do not add inferred areas (prevents noisy
+        # labels from incidental keywords in the body).
+        inferred_areas = self.infer_areas(section) if not explicit_areas else []
+        areas = list(set(explicit_areas + inferred_areas))
+
+        return IssueSpec(
+            title=title,
+            body=section,
+            priority=priority,
+            areas=areas,
+            is_epic=is_epic,
+            issue_type=issue_type,
+            parent_title=current_epic if not is_epic else None,
+            blocks=blocks,
+            blocked_by=blocked_by,
+            issue_number=issue_number
+        )
 
-        return specs
+    @phase('create issue')
+    def create_issue(self, spec: IssueSpec, set_type: bool = True) -> int:
+        """Create single GitHub issue, returns issue number.
 
-    def create_issue(self, spec: IssueSpec) -> int:
-        """Create single GitHub issue, returns issue number"""
+        Pass set_type=False when the caller batches Issue Type mutations itself.
+        """
         labels = []
 
         if spec.issue_type == "epic":
@@ -362,133 +958,163 @@ class IssueCreator:
         body = spec.body
         title = self.format_issue_title(spec)
 
-        # Create issue via gh CLI
-        cmd = [
-            'gh', 'issue', 'create',
-            '--title', title,
-            '--body', body,
-        ]
-
-        for label in labels:
-            cmd.extend(['--label', label])
-
-        result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-
-        if result.returncode != 0:
-            print(f"Error creating issue: {result.stderr}", file=sys.stderr)
-            raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
+        # Create issue via REST
+        try:
+            result = self.gh.rest('POST', f"{self._repo_path()}/issues",
+                                  {'title': title, 'body': body, 'labels': labels})
+        except GitHubError as exc:
+            print(f"Error creating issue: {exc}", file=sys.stderr)
+            raise
 
-        # Extract issue number from URL
-        url = result.stdout.strip()
-        issue_num = int(url.split('/')[-1])
+        issue_num = int(result['number'])
+        self.ids.remember(issue_num, result.get('node_id'))
+        self.titles.add(issue_num, title)
 
         # Set GitHub issue type
-        self.set_issue_type(issue_num, spec.issue_type)
+        if set_type:
+            self.set_issue_type(issue_num, spec.issue_type)
+            self.pushed.record(issue_num, self.spec_fingerprint(spec))
 
         return issue_num
 
-    def ensure_issue_for_spec(self, spec: IssueSpec) -> Tuple[int, bool]:
-        """Create the issue unless it already exists, returning (number, created)."""
-        formatted_title = self.format_issue_title(spec)
-
+    def existing_issue_for_spec(self, spec: IssueSpec) -> Optional[int]:
+        """Return the issue a spec should update (issue_number or same title), if any."""
         if spec.issue_number:
-            self.update_issue(spec.issue_number, spec)
-            return spec.issue_number, False
+            return spec.issue_number
 
+        formatted_title = self.format_issue_title(spec)
         existing = self.find_issue_by_title(formatted_title)
         if existing:
             print(f"[WARN] Issue '{formatted_title}' already exists as #{existing}; updating instead of creating.", file=sys.stderr)
-            self.update_issue(existing, spec)
+        return existing
+
+    def ensure_issue_for_spec(self, spec: IssueSpec, set_type: bool = True,
+                              existing: Optional[int] = None) -> Tuple[int, bool]:
+        """Create the issue unless it already exists, returning (number, created).
+
+        Callers that already looked the spec up pass `existing` to skip the lookup.
+        """
+        if existing is None:
+            existing = self.existing_issue_for_spec(spec)
+        if existing:
+            self.update_issue(existing, spec, set_type=set_type)
             return existing, False
 
-        issue_num = self.create_issue(spec)
+        issue_num = self.create_issue(spec, set_type=set_type)
         return issue_num, True
 
     def get_issue_id(self, issue_num: int) -> str:
-        """Get GraphQL node ID for issue number"""
-        query = f'''{{
-          repository(owner: "{self.repo_info['owner']}", name: "{self.repo_info['repo']}") {{
-            issue(number: {issue_num}) {{
-              id
-            }}
-          }}
-        }}'''
+        """Get GraphQL node ID for issue number (memoized, see IssueIdResolver)"""
+        return self.ids.get(issue_num)
 
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={query}'],
-            capture_output=True, text=True, check=True
-        )
+    @staticmethod
+    def _add_sub_issue_field(parent_id: str, child_id: str) -> str:
+        """addSubIssue mutation field (usable standalone or as an alias)"""
+        return (f'addSubIssue(input: {{issueId: {gql_str(parent_id)}, subIssueId: {gql_str(child_id)}}}) '
+                '{ issue { number title } }')
 
-        data = json.loads(result.stdout)
-        return data['data']['repository']['issue']['id']
+    @staticmethod
+    def _add_blocked_by_field(blocked_id: str, blocking_id: str) -> str:
+        """addBlockedBy mutation field (usable standalone or as an alias)"""
+        return (f'addBlockedBy(input: {{issueId: {gql_str(blocked_id)}, blockingIssueId: {gql_str(blocking_id)}}}) '
+                '{ issue { number } blockingIssue { number } }')
 
-    def add_child_to_parent(self, parent_num: int, child_num: int):
-        """Link child issue to parent epic via addSubIssue mutation"""
+    @staticmethod
+    def _update_issue_type_field(issue_id: str, type_id: str) -> str:
+        """updateIssueIssueType mutation field (usable standalone or as an alias)"""
+        return (f'updateIssueIssueType(input: {{issueId: {gql_str(issue_id)}, issueTypeId: {gql_str(type_id)}}}) '
+                '{ issue { number issueType { name } } }')
+
+    @phase('link children')
+    def add_child_to_parent(self, parent_num: int, child_num: int) -> bool:
+        """Link child issue to parent epic via addSubIssue mutation.
+
+        Returns False without a call when prefetched state shows the link already exists.
+        """
+        with self._remote_lock:
+            known = self._remote.get(child_num)
+        if known and (known.get('parent') or {}).get('number') == parent_num:
+            self._count_noop()
+            return False
         parent_id = self.get_issue_id(parent_num)
         child_id = self.get_issue_id(child_num)
 
-        mutation = f'''mutation {{
-          addSubIssue(input: {{
-            issueId: "{parent_id}"
-            subIssueId: "{child_id}"
-          }}) {{
-            issue {{
-              number
-              title
-            }}
-          }}
-        }}'''
-
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={mutation}'],
-            capture_output=True, text=True, check=False
-        )
-
-        if result.returncode != 0:
-            print(f"[WARN] Unable to link #{child_num} to #{parent_num}: {result.stderr}", file=sys.stderr)
+        try:
+            self.gh.graphql(f"mutation {{ {self._add_sub_issue_field(parent_id, child_id)} }}")
+        except GitHubError as exc:
+            print(f"[WARN] Unable to link #{child_num} to #{parent_num}: {exc}", file=sys.stderr)
+        return True
 
+    @phase('link blockers')
     def add_blocking_relationship(self, blocked_issue_num: int, blocking_issue_num: int):
         """Add 'blocked by' relationship via addBlockedBy mutation"""
         blocked_id = self.get_issue_id(blocked_issue_num)
         blocking_id = self.get_issue_id(blocking_issue_num)
 
-        mutation = f'''mutation {{
-          addBlockedBy(input: {{
-            issueId: "{blocked_id}"
-            blockingIssueId: "{blocking_id}"
-          }}) {{
-            issue {{
-              number
-            }}
-            blockingIssue {{
-              number
-            }}
-          }}
-        }}'''
-
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={mutation}'],
-            capture_output=True, text=True, check=False
-        )
-
-        if result.returncode != 0:
-            print(f"[WARN] Unable to add blocker #{blocking_issue_num} -> #{blocked_issue_num}: {result.stderr}", file=sys.stderr)
+        try:
+            self.gh.graphql(f"mutation {{ {self._add_blocked_by_field(blocked_id, blocking_id)} }}")
+        except GitHubError as exc:
+            print(f"[WARN] Unable to add blocker #{blocking_issue_num} -> #{blocked_issue_num}: {exc}", file=sys.stderr)
+
+    def _run_pairs(self, pairs: List[Tuple[int, int]], build_field) -> List[AliasResult]:
+        """Resolve both ends of each pair in bulk, then run build_field(id_a, id_b) batched"""
+        ids = self.ids.resolve([n for pair in pairs for n in pair])
+        results: Dict[Tuple[int, int], AliasResult] = {}
+        fields = []
+        for a, b in pairs:
+            unresolved = [n for n in (a, b) if n not in ids]
+            if unresolved:
+                results[(a, b)] = AliasResult((a, b), error=f"issue #{unresolved[0]} not found")
+            else:
+                fields.append(((a, b), build_field(ids[a], ids[b])))
+        for result in run_aliased(self.gh, fields, chunk_size=self.batch_size):
+            results[result.key] = result
+        return [results[pair] for pair in pairs]
+
+    @phase('link children')
+    def link_children(self, pairs: List[Tuple[int, int]]) -> List[AliasResult]:
+        """Batch addSubIssue for (parent, child) pairs; one result per pair"""
+        return self._run_pairs(pairs, self._add_sub_issue_field)
+
+    @phase('link blockers')
+    def link_blockers(self, pairs: List[Tuple[int, int]]) -> List[AliasResult]:
+        """Batch addBlockedBy for (blocked, blocking) pairs; one result per pair"""
+        return self._run_pairs(pairs, self._add_blocked_by_field)
+
+    def set_issue_types(self, items: List[Tuple[int, str]]) -> List[AliasResult]:
+        """Batch updateIssueIssueType for (issue number, issue_type) pairs.
+
+        Items without a configured/known type are skipped (no result returned).
+        """
+        typed = [(num, type_id) for num, issue_type in items
+                 for type_id in [self._type_id_for(issue_type)] if type_id]
+        return self.set_issue_type_ids(typed)
+
+    @phase('set types')
+    def set_issue_type_ids(self, typed: List[Tuple[int, str]]) -> List[AliasResult]:
+        """Batch updateIssueIssueType for (issue number, Issue Type node ID) pairs"""
+        ids = self.ids.resolve([num for num, _ in typed])
+        results = [AliasResult(num, error=f"issue #{num} not found") for num, _ in typed if num not in ids]
+        fields = [(num, self._update_issue_type_field(ids[num], type_id)) for num, type_id in typed if num in ids]
+        return results + run_aliased(self.gh, fields, chunk_size=self.batch_size)
 
     def link_blocker_pair(self, blocked_num: int, blocking_num: int):
         """Explicitly link blocked -> blocking issues."""
         try:
             self.add_blocking_relationship(blocked_num, blocking_num)
             print(f"[OK] Linked #{blocking_num} as blocker of #{blocked_num}")
-        except subprocess.CalledProcessError as exc:
-            print(f"[ERROR] Failed to link blocker #{blocking_num} -> #{blocked_num}: {exc.stderr}", file=sys.stderr)
+        except GitHubError as exc:
+            print(f"[ERROR] Failed to link blocker #{blocking_num} -> #{blocked_num}: {exc}", file=sys.stderr)
 
     def link_child_pair(self, parent_num: int, child_num: int):
         """Explicitly link child to epic."""
         try:
-            self.add_child_to_parent(parent_num, child_num)
-            print(f"[OK] Linked #{child_num} as child of Epic #{parent_num}")
-        except subprocess.CalledProcessError as exc:
-            print(f"[ERROR] Failed to link child #{child_num} to Epic #{parent_num}: {exc.stderr}", file=sys.stderr)
+            if self.add_child_to_parent(parent_num, child_num):
+                print(f"[OK] Linked #{child_num} as child of Epic #{parent_num}")
+            else:
+                print(f"[SKIP] #{child_num} is already a child of Epic #{parent_num}")
+        except GitHubError as exc:
+            print(f"[ERROR] Failed to link child #{child_num} to Epic #{parent_num}: {exc}", file=sys.stderr)
 
     @staticmethod
     def parse_link_arg(value: str) -> Tuple[int, int]:
@@ -498,40 +1124,33 @@ class IssueCreator:
         left, right = value.split(':', 1)
         return int(left), int(right)
 
-    def set_issue_type(self, issue_num: int, issue_type: str):
-        """Set GitHub issue type via updateIssueIssueType mutation"""
+    def _type_id_for(self, issue_type: str) -> Optional[str]:
+        """Return the org Issue Type ID for an issue_type key (None if unmapped)"""
         # Get mapped type name from config
         type_name = self.config['issue_type_mapping'].get(issue_type)
         if not type_name:
-            return  # No type mapping configured
+            return None  # No type mapping configured
 
-        # Get type ID from cached org types
+        # Get type ID from cached org types (a cached map missing the name is refetched)
         type_id = self.issue_types.get(type_name)
+        if not type_id and not self._types_refetched:
+            self._types_refetched = True
+            self._issue_types = self._get_issue_types(want=[type_name])
+            type_id = self._issue_types.get(type_name)
         if not type_id:
             print(f"[WARN] Issue type '{type_name}' not found in org", file=sys.stderr)
+        return type_id
+
+    def set_issue_type(self, issue_num: int, issue_type: str):
+        """Set GitHub issue type via updateIssueIssueType mutation"""
+        type_id = self._type_id_for(issue_type)
+        if not type_id:
             return
 
         # Get issue GraphQL ID
         issue_id = self.get_issue_id(issue_num)
 
-        mutation = f'''mutation {{
-          updateIssueIssueType(input: {{
-            issueId: "{issue_id}"
-            issueTypeId: "{type_id}"
-          }}) {{
-            issue {{
-              number
-              issueType {{
-                name
-              }}
-            }}
-          }}
-        }}'''
-
-        subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={mutation}'],
-            capture_output=True, text=True, check=True
-        )
+        self.gh.graphql(f"mutation {{ {self._update_issue_type_field(issue_id, type_id)} }}")
 
     def infer_type_from_labels(self, labels: List[str]) -> str:
         """Infer issue_type from labels"""
@@ -542,6 +1161,9 @@ class IssueCreator:
         print(f"Syncing types for {len(issue_numbers)} issue(s)...")
         print()
 
+        # Resolve all node IDs in one request up front
+        self.ids.resolve(issue_numbers)
+
         synced_count = 0
         skipped_count = 0
 
@@ -568,124 +1190,227 @@ class IssueCreator:
 
     def get_current_labels(self, issue_num: int) -> List[str]:
         """Get current labels for an issue"""
-        result = subprocess.run(
-            ['gh', 'issue', 'view', str(issue_num), '--json', 'labels'],
-            capture_output=True, text=True, check=True
-        )
-        data = json.loads(result.stdout)
+        data = self.gh.rest('GET', f"{self._repo_path()}/issues/{issue_num}")
         return [label['name'] for label in data.get('labels', [])]
 
-    def update_issue(self, issue_num: int, spec: IssueSpec):
-        """Update existing GitHub issue"""
-        labels = []
-
-        if spec.issue_type == "epic":
-            labels.append(self.config['epic_label'])
-
-        # Priority
-        labels.append(f'priority:{spec.priority}')
-
-        # Areas
-        for area in spec.areas:
-            labels.append(f'area:{area}')
-
-        # Status
-        labels.append(self.config['default_status_ready'])
-
-        # Build title (only Epic gets prefix, others use labels)
+    MANAGED_LABEL_PREFIXES = ('priority:', 'area:', 'status:', 'Epic')
+
+    @classmethod
+    def _is_managed_label(cls, label: str) -> bool:
+        """Labels the tool owns (replaced on update); everything else is preserved"""
+        return any(label.startswith(p) or label == p for p in cls.MANAGED_LABEL_PREFIXES)
+
+    def _label_ids(self, names: List[str]) -> Dict[str, str]:
+        """Return name->node ID for existing labels, fetching unknown names in one aliased query"""
+        return self.labels.lookup(names)
+
+    ISSUE_STATE_SELECTION = ('id number title body issueType { id name } parent { number } '
+                             'labels(first: 100) { nodes { id name } }')
+
+    @phase('prefetch')
+    def prefetch_issues(self, numbers: Iterable[int]) -> Dict[int, Dict]:
+        """Fetch title, body, labels, Issue Type and parent for many issues.
+
+        One aliased query per `batch_size` issues. The state is kept until
+        update_issue (or add_child_to_parent) consumes it, so each of those
+        can decide which mutations are needed without another read.
+        Numbers that do not resolve to an issue are omitted.
+        """
+        wanted = list(dict.fromkeys(int(n) for n in numbers))
+        with self._remote_lock:
+            missing = [n for n in wanted if n not in self._remote]
+        for start in range(0, len(missing), max(1, self.batch_size)):
+            chunk = missing[start:start + max(1, self.batch_size)]
+            fields = "\n".join(f"    i{num}: issue(number: {num}) {{ {self.ISSUE_STATE_SELECTION} }}" for num in chunk)
+            query = (f"query {{\n  repository(owner: {gql_str(self.repo_info['owner'])}, "
+                     f"name: {gql_str(self.repo_info['repo'])}) {{\n{fields}\n  }}\n}}")
+            try:
+                data = self.gh.graphql(query)
+            except GitHubError as exc:
+                # Missing numbers come back as NOT_FOUND errors with partial data
+                if not exc.data or not exc.data.get('repository'):
+                    raise
+                data = exc.data
+            repo_data = data.get('repository') or {}
+            for num in chunk:
+                node = repo_data.get(f"i{num}")
+                if not node:
+                    continue
+                self.ids.remember(num, node['id'])
+                self.labels.remember(node['labels']['nodes'])
+                with self._remote_lock:
+                    self._remote[num] = node
+        with self._remote_lock:
+            return {n: self._remote[n] for n in wanted if n in self._remote}
+
+    def _take_issue_state(self, issue_num: int) -> Dict:
+        """Prefetched state for one issue (fetched now if absent); the cache entry is dropped"""
+        with self._remote_lock:
+            state = self._remote.pop(issue_num, None)
+        if state is None:
+            state = self.prefetch_issues([issue_num]).get(issue_num)
+            with self._remote_lock:
+                self._remote.pop(issue_num, None)
+        if state is None:
+            raise GitHubError(f"Issue #{issue_num} not found in {self.repo_info['owner']}/{self.repo_info['repo']}")
+        return state
+
+    def _count_noop(self):
+        with self._remote_lock:
+            self.noop_updates += 1
+
+    @phase('update issue')
+    def update_issue(self, issue_num: int, spec: IssueSpec, set_type: bool = True) -> bool:
+        """Update existing GitHub issue; returns False when it already matched (nothing sent).
+
+        Uses the state from prefetch_issues (or one read) and sends only what
+        differs, in one aliased mutation document: the changed title/body
+        fields, at most one removeLabelsFromLabelable and one
+        addLabelsToLabelable for the exact label delta, and the Issue Type if
+        it differs. Managed labels are verified from the mutation response
+        rather than a second read.
+        """
+        labels = self.labels_for_spec(spec)
+        title = self.format_issue_title(spec)
         body = spec.body
-        if spec.issue_type == "epic":
-            title = f"[Epic]: {spec.title}"
-        else:
-            title = spec.title
-
-        # Get current labels and preserve custom ones
-        current_labels = self.get_current_labels(issue_num)
-        managed_prefixes = ('priority:', 'area:', 'status:', 'Epic')
-        custom_labels = [l for l in current_labels
-                        if not any(l.startswith(p) or l == p
-                                  for p in managed_prefixes)]
-
-        # Combine managed labels with custom labels
-        all_labels = labels + custom_labels
-        # Update issue via gh CLI.
-        #
-        # NOTE: In practice, mixing `--remove-label` and `--add-label` in the
-        # same `gh issue edit` call can be flaky. We apply changes in phases and
-        # verify managed labels were applied, retrying once if needed.
-        max_attempts = 2
-        for attempt in range(1, max_attempts + 1):
-            # 1) Update title/body
-            cmd = ['gh', 'issue', 'edit', str(issue_num), '--title', title, '--body', body]
-            result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-            if result.returncode != 0:
-                print(f"Error updating issue #{issue_num}: {result.stderr}", file=sys.stderr)
-                raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
-
-            # 2) Remove existing managed labels
-            for label in current_labels:
-                if any(label.startswith(p) or label == p for p in managed_prefixes):
-                    cmd = ['gh', 'issue', 'edit', str(issue_num), '--remove-label', label]
-                    result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-                    if result.returncode != 0:
-                        print(f"Error updating issue #{issue_num}: {result.stderr}", file=sys.stderr)
-                        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
-
-            # 3) Add expected labels (managed + preserved custom)
-            for label in all_labels:
-                cmd = ['gh', 'issue', 'edit', str(issue_num), '--add-label', label]
-                result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8')
-                if result.returncode != 0:
-                    print(f"Error updating issue #{issue_num}: {result.stderr}", file=sys.stderr)
-                    raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout, result.stderr)
-
-            # Set GitHub issue type
-            self.set_issue_type(issue_num, spec.issue_type)
-
-            # Verify managed labels landed
-            updated_labels = self.get_current_labels(issue_num)
-            missing_managed = [l for l in labels if l not in updated_labels]
-            if not missing_managed:
-                break
-
-            if attempt < max_attempts:
-                print(
-                    f"[WARN] Issue #{issue_num}: missing label(s) after update ({', '.join(missing_managed)}); retrying...",
-                    file=sys.stderr
-                )
-                current_labels = updated_labels
-                custom_labels = [l for l in current_labels
-                                 if not any(l.startswith(p) or l == p for p in managed_prefixes)]
-                all_labels = labels + custom_labels
-                continue
 
+        # Get current state and preserve custom labels
+        state = self._take_issue_state(issue_num)
+        issue_id = state['id']
+        current = {label['name']: label['id'] for label in state['labels']['nodes']}
+        custom_labels = [l for l in current if not self._is_managed_label(l)]
+        desired = list(dict.fromkeys(labels + custom_labels))
+
+        remove_ids = [current[l] for l in current if l not in desired]
+        add_names = [l for l in desired if l not in current]
+        add_ids = self._label_ids(add_names)
+        unknown = [l for l in add_names if l not in add_ids]
+        if unknown:
+            print(f"[WARN] Issue #{issue_num}: label(s) not found in repo: {', '.join(unknown)}", file=sys.stderr)
+
+        labels_selection = '{ labelable { labels(first: 100) { nodes { name } } } }'
+        fields = []
+        edits = [f'{name}: {gql_str(value)}' for name, value in (('title', title), ('body', body))
+                 if state.get(name) != value]
+        if edits:
+            fields.append(('edit', f'updateIssue(input: {{id: {gql_str(issue_id)}, {", ".join(edits)}}}) '
+                                   '{ issue { number } }'))
+        if remove_ids:
+            fields.append(('remove', f'removeLabelsFromLabelable(input: {{labelableId: {gql_str(issue_id)}, '
+                                     f'labelIds: {gql_list(remove_ids)}}}) {labels_selection}'))
+        if add_ids:
+            fields.append(('add', f'addLabelsToLabelable(input: {{labelableId: {gql_str(issue_id)}, '
+                                  f'labelIds: {gql_list(add_ids.values())}}}) {labels_selection}'))
+        type_id = self._type_id_for(spec.issue_type) if set_type else None
+        if not set_type:
+            with self._remote_lock:
+                self._seen_types[issue_num] = (state.get('issueType') or {}).get('id')
+        if type_id and (state.get('issueType') or {}).get('id') != type_id:
+            fields.append(('type', self._update_issue_type_field(issue_id, type_id)))
+
+        if not fields:
+            self._count_noop()
+            self.titles.add(issue_num, title)
+            if set_type:
+                self.pushed.record(issue_num, self.spec_fingerprint(spec))
+            return False
+
+        results = {r.key: r for r in run_aliased(self.gh, fields, chunk_size=len(fields))}
+        failed = [f"{key}: {r.error}" for key, r in results.items() if not r.ok]
+        if failed:
+            print(f"Error updating issue #{issue_num}: {'; '.join(failed)}", file=sys.stderr)
+            raise GitHubError(f"Failed to update issue #{issue_num}: {'; '.join(failed)}")
+        self.titles.add(issue_num, title)
+        if set_type:
+            self.pushed.record(issue_num, self.spec_fingerprint(spec))
+
+        # Verify managed labels landed (last label mutation reports the final set)
+        final = results.get('add') or results.get('remove')
+        updated_labels = ([n['name'] for n in final.data['labelable']['labels']['nodes']]
+                          if final else list(current))
+        missing_managed = [l for l in labels if l not in updated_labels]
+        if missing_managed:
             print(
                 f"[WARN] Issue #{issue_num}: missing label(s) after update ({', '.join(missing_managed)}).",
                 file=sys.stderr
             )
-
-    def get_epic_children(self, epic_num: int) -> List[int]:
-        """Get child issue numbers for an Epic"""
-        query = f'''{{
-          repository(owner: "{self.repo_info['owner']}", name: "{self.repo_info['repo']}") {{
+        return True
+
+    @phase('epic children')
+    def get_epic_children(self, epic_num: int) -> List[Dict]:
+        """Get every child issue ({'number', 'title'}) of an Epic, 100 per page"""
+        children: List[Dict] = []
+        cursor: Optional[str] = None
+        while True:
+            after = f", after: {gql_str(cursor)}" if cursor else ""
+            query = f'''{{
+          repository(owner: {gql_str(self.repo_info['owner'])}, name: {gql_str(self.repo_info['repo'])}) {{
             issue(number: {epic_num}) {{
-              subIssues(first: 100) {{
+              subIssues(first: 100{after}) {{
                 nodes {{
                   number
+                  title
                 }}
+                pageInfo {{ hasNextPage endCursor }}
               }}
             }}
           }}
         }}'''
 
-        result = subprocess.run(
-            ['gh', 'api', 'graphql', '-f', f'query={query}'],
-            capture_output=True, text=True, check=True
-        )
+            data = self.gh.graphql(query)
+            issue = data['repository']['issue']
+            if not issue:
+                raise GitHubError(f"Epic #{epic_num} not found")
+            conn = issue['subIssues']
+            children.extend(conn['nodes'])
+            if not conn['pageInfo']['hasNextPage']:
+                return children
+            cursor = conn['pageInfo']['endCursor']
 
-        data = json.loads(result.stdout)
-        sub_issues = data['data']['repository']['issue'].get('subIssues', {}).get('nodes', [])
-        return [issue['number'] for issue in sub_issues]
+    @staticmethod
+    def _title_key(title: str) -> str:
+        """Title used for matching: whitespace collapsed, case-insensitive"""
+        return ' '.join(title.split()).casefold()
+
+    def match_epic_children(self, children: List[Dict],
+                            specs: List[IssueSpec]) -> Tuple[Dict[int, int], List[int]]:
+        """Pair spec sections with an Epic's existing children.
+
+        Keys, in order of precedence: the section's `issue_number`, the
+        fingerprint last pushed to the child (see PushState), then the
+        normalized title. Sections with an `issue_number` only match that
+        issue (process_updates adopts it if it is not a child yet). Each key is a dict lookup and each child is claimed
+        at most once, so this is O(children + sections) and inserting or
+        reordering sections does not shift the pairing.
+
+        Returns ({section index: child number}, child numbers left unmatched).
+        """
+        by_number = {c['number']: c['number'] for c in children}
+        by_hash: Dict[str, int] = {}
+        by_title: Dict[str, int] = {}
+        for child in children:
+            fingerprint = self.pushed.fingerprint(child['number'])
+            if fingerprint:
+                by_hash.setdefault(fingerprint, child['number'])
+            by_title.setdefault(self._title_key(child['title']), child['number'])
+
+        matched: Dict[int, int] = {}
+        claimed = set()
+        keys = [
+            (by_number, lambda spec: spec.issue_number),
+            (by_hash, lambda spec: self.spec_fingerprint(spec)),
+            (by_title, lambda spec: self._title_key(self.format_issue_title(spec))),
+        ]
+        for table, key in keys:
+            for i, spec in enumerate(specs):
+                # An explicit issue_number is authoritative even when it is not a child yet
+                if i in matched or (spec.issue_number and table is not by_number):
+                    continue
+                num = table.get(key(spec))
+                if num is not None and num not in claimed:
+                    matched[i] = num
+                    claimed.add(num)
+        return matched, [c['number'] for c in children if c['number'] not in claimed]
 
     def process_updates(self, specs: List[IssueSpec], update_mode: str, target_issue: Optional[int] = None):
         """Update existing issues"""
@@ -697,8 +1422,10 @@ class IssueCreator:
                 sys.exit(1)
 
             print(f"Updating issue #{target_issue}...")
-            self.update_issue(target_issue, spec)
-            print(f"[OK] Updated #{target_issue}: {spec.title}")
+            if self.update_issue(target_issue, spec):
+                print(f"[OK] Updated #{target_issue}: {spec.title}")
+            else:
+                print(f"[SKIP] #{target_issue} already matches the spec: {spec.title}")
 
         elif update_mode == 'epic' and target_issue:
             # Update Epic + all children
@@ -707,26 +1434,56 @@ class IssueCreator:
                 print("No Epic found in spec file", file=sys.stderr)
                 sys.exit(1)
 
-            print(f"Updating Epic #{target_issue}...")
-            self.update_issue(target_issue, epic_spec)
-            print(f"[OK] Updated Epic #{target_issue}: {epic_spec.title}")
-            print()
-
-            # Get existing children
+            # Get every existing child, pair them with the spec sections, then read the Epic
+            # and every issue to update in one batch
             children = self.get_epic_children(target_issue)
             child_specs = [s for s in specs if not s.is_epic]
+            matched, orphans = self.match_epic_children(children, child_specs)
+            self.prefetch_issues([target_issue] + list(matched.values())
+                                 + [s.issue_number for i, s in enumerate(child_specs)
+                                    if i not in matched and s.issue_number])
 
-            if len(child_specs) != len(children):
-                print(f"[WARN] Spec has {len(child_specs)} children, Epic #{target_issue} has {len(children)} children")
-                print(f"  Will update first {min(len(child_specs), len(children))} children")
+            print(f"Updating Epic #{target_issue}...")
+            if self.update_issue(target_issue, epic_spec):
+                print(f"[OK] Updated Epic #{target_issue}: {epic_spec.title}")
+            else:
+                print(f"[SKIP] Epic #{target_issue} already matches the spec: {epic_spec.title}")
+            print()
 
-            # Update children (match by order)
-            for i, child_num in enumerate(children):
-                if i < len(child_specs):
-                    spec = child_specs[i]
+            print(f"Matched {len(matched)} of {len(child_specs)} section(s) to Epic #{target_issue}'s "
+                  f"{len(children)} child issue(s)")
+
+            # Update matched children; create (or adopt, via issue_number) the rest and link them in one batch
+            new_links: List[Tuple[int, int]] = []
+            for i, spec in enumerate(child_specs):
+                child_num = matched.get(i)
+                if child_num is None and spec.issue_number:
+                    child_num = spec.issue_number
+                    new_links.append((target_issue, child_num))
+                if child_num is not None:
                     print(f"Updating child #{child_num}...")
-                    self.update_issue(child_num, spec)
-                    print(f"  [OK] Updated #{child_num}: {spec.title}")
+                    if self.update_issue(child_num, spec):
+                        print(f"  [OK] Updated #{child_num}: {spec.title}")
+                    else:
+                        print(f"  [SKIP] #{child_num} already matches the spec: {spec.title}")
+                else:
+                    print(f"Creating child: {spec.title}...")
+                    child_num = self.create_issue(spec)
+                    self.created_issues[self.format_issue_title(spec)] = child_num
+                    print(f"  [OK] Created #{child_num}: {spec.title}")
+                    new_links.append((target_issue, child_num))
+
+            if new_links:
+                for (_, child_num), result in zip(new_links, self.link_children(new_links)):
+                    if result.ok:
+                        print(f"  [OK] Linked #{child_num} to Epic #{target_issue}")
+                    else:
+                        print(f"  [WARN] Unable to link #{child_num} to Epic #{target_issue}: {result.error}",
+                              file=sys.stderr)
+
+            for child_num in orphans:
+                print(f"[WARN] Child #{child_num} of Epic #{target_issue} matches no spec section; left unchanged",
+                      file=sys.stderr)
 
         elif update_mode == 'auto':
             # Update/create issues based on issue_number field in specs
@@ -735,11 +1492,23 @@ class IssueCreator:
             epic_spec = next((s for s in specs if s.is_epic), None)
             epic_num = epic_spec.issue_number if epic_spec else None
 
+            unchanged_count = 0
+
+            # Read every issue that will be updated in one batch
+            self.prefetch_issues([s.issue_number for s in specs if s.issue_number and self.needs_push(s)])
+
             # First, update Epic if present
             if epic_spec and epic_spec.issue_number:
-                print(f"Updating Epic #{epic_spec.issue_number}...")
-                self.update_issue(epic_spec.issue_number, epic_spec)
-                print(f"[OK] Updated Epic #{epic_spec.issue_number}: {epic_spec.title}")
+                if self.needs_push(epic_spec):
+                    print(f"Updating Epic #{epic_spec.issue_number}...")
+                    if self.update_issue(epic_spec.issue_number, epic_spec):
+                        print(f"[OK] Updated Epic #{epic_spec.issue_number}: {epic_spec.title}")
+                    else:
+                        print(f"[SKIP] Epic #{epic_spec.issue_number} already matches the spec: {epic_spec.title}")
+                        unchanged_count += 1
+                else:
+                    print(f"[SKIP] Epic #{epic_spec.issue_number} unchanged since last push: {epic_spec.title}")
+                    unchanged_count += 1
                 print()
 
             # Then process children
@@ -747,12 +1516,18 @@ class IssueCreator:
                 if spec.is_epic:
                     continue  # Already handled above
 
-                if spec.issue_number:
+                if spec.issue_number and not self.needs_push(spec):
+                    print(f"[SKIP] #{spec.issue_number} unchanged since last push: {spec.title}")
+                    unchanged_count += 1
+                elif spec.issue_number:
                     # Update existing issue
                     print(f"Updating issue #{spec.issue_number}...")
-                    self.update_issue(spec.issue_number, spec)
-                    print(f"[OK] Updated #{spec.issue_number}: {spec.title}")
-                    updated_count += 1
+                    if self.update_issue(spec.issue_number, spec):
+                        print(f"[OK] Updated #{spec.issue_number}: {spec.title}")
+                        updated_count += 1
+                    else:
+                        print(f"[SKIP] #{spec.issue_number} already matches the spec: {spec.title}")
+                        unchanged_count += 1
                 else:
                     # Create new issue
                     print(f"Creating new issue: {spec.title}...")
@@ -767,88 +1542,377 @@ class IssueCreator:
 
                     created_count += 1
 
-            if updated_count == 0 and created_count == 0:
+            if updated_count == 0 and created_count == 0 and unchanged_count == 0:
                 print("No issues updated or created.", file=sys.stderr)
                 sys.exit(1)
 
             print()
-            print(f"Summary: Updated {updated_count}, Created {created_count} issue(s)")
+            print(f"Summary: Updated {updated_count}, Created {created_count}, "
+                  f"Unchanged {unchanged_count} issue(s)")
+
+    def blocker_graph(self, specs: Iterable[IssueSpec]) -> BlockerGraph:
+        """Merge the specs' blocks/blocked_by fields into one graph (no network access)"""
+        graph = BlockerGraph()
+        for spec in specs:
+            graph.add(self.format_issue_title(spec), spec)
+        return graph
 
     def process_blockers(self, specs: List[IssueSpec]):
-        """Apply blocked_by relationships for existing issues"""
-        blocked_specs = [s for s in specs if s.blocked_by]
-        if not blocked_specs:
+        """Apply blocked_by/blocks relationships for existing issues.
+
+        Edges between sections come from the spec's BlockerGraph; each section
+        resolves to its issue_number or through the title index, and only
+        references to issues outside the spec are looked up by their own
+        title. The blocked issues are updated from the spec, then every link
+        is sent in batched addBlockedBy calls, blockers first.
+        """
+        graph = self.blocker_graph(specs)
+        edges = graph.ordered_edges() + graph.external_edges()
+        if not edges:
             print("No blocked_by entries found in spec.", file=sys.stderr)
             return
 
-        for spec in blocked_specs:
-            formatted_title = self.format_issue_title(spec)
-            issue_num = spec.issue_number or self.find_issue_by_title(formatted_title)
+        spec_by_title: Dict[str, IssueSpec] = {}
+        for spec in specs:
+            spec_by_title.setdefault(self.format_issue_title(spec), spec)
+        numbers: Dict[str, Optional[int]] = {}
+
+        def number(title: str) -> Optional[int]:
+            if title not in numbers:
+                spec = spec_by_title.get(title)
+                if spec is None:  # a reference to an issue outside the spec
+                    numbers[title] = self.find_issue_by_title(title, exact=False)
+                else:
+                    numbers[title] = spec.issue_number or self.find_issue_by_title(title)
+            return numbers[title]
+
+        blocked_titles = {blocked for blocked, _ in edges}
+        targets = []
+        for title, spec in spec_by_title.items():
+            if title not in blocked_titles:
+                continue
+            issue_num = number(title)
             if not issue_num:
-                print(f"[WARN] Could not find issue '{formatted_title}' to update blockers.", file=sys.stderr)
+                print(f"[WARN] Could not find issue '{title}' to update blockers.", file=sys.stderr)
                 continue
+            targets.append((issue_num, spec))
 
+        self.prefetch_issues(num for num, _ in targets)
+        for issue_num, spec in targets:
             self.update_issue(issue_num, spec)
-            for blocker_title in spec.blocked_by:
-                blocking_num = self.find_issue_by_title(blocker_title)
-                if not blocking_num:
-                    print(f"[WARN] Could not resolve blocker '{blocker_title}' for #{issue_num}", file=sys.stderr)
-                    continue
-                self.add_blocking_relationship(issue_num, blocking_num)
-                print(f"  [OK] #{issue_num} blocked by #{blocking_num}")
 
-    def process_specs(self, specs: List[IssueSpec]):
-        """Create all issues and set up relationships"""
-        print(f"Creating {len(specs)} issues...")
+        pairs = []
+        for blocked, blocker in edges:
+            blocked_num, blocking_num = number(blocked), number(blocker)
+            if not blocked_num:
+                if blocked not in spec_by_title:
+                    print(f"[WARN] Could not find issue '{blocked}' blocked by '{blocker}'", file=sys.stderr)
+                continue
+            if not blocking_num:
+                print(f"[WARN] Could not resolve blocker '{blocker}' for #{blocked_num}", file=sys.stderr)
+                continue
+            pairs.append((blocked_num, blocking_num))
+        pairs = list(dict.fromkeys(pairs))
+        for (blocked_num, blocking_num), result in zip(pairs, self.link_blockers(pairs)):
+            if result.ok:
+                print(f"  [OK] #{blocked_num} blocked by #{blocking_num}")
+            else:
+                print(f"[WARN] Unable to add blocker #{blocking_num} -> #{blocked_num}: {result.error}",
+                      file=sys.stderr)
+
+    def _run_create_schedule(self, specs: Iterable[IssueSpec], concurrency: int, on_issue) -> CreateRun:
+        """Create/update issues on a bounded worker pool and link them as endpoints appear.
+
+        `specs` may be a lazy iterator (see iter_specs): specs are pulled only
+        when a worker is free, so the first issues are created while the rest
+        of the input is still being read. They are read `batch_size` sections
+        at a time, with one label preflight per chunk, so at most one chunk of
+        unprocessed sections is held at a time.
+
+        Every spec is an independent job, except a repeated title, which waits
+        for (and then updates) the issue its first occurrence produced. Issue
+        Type updates (skipped when an existing issue already has the type) and
+        link operations are queued as soon as their issue numbers are known and
+        dispatched in aliased batches of `batch_size`
+        (partial batches once no more creations are outstanding), ahead of
+        queued creations. `on_issue(spec, title, number, created)` is called from
+        this (main) thread in spec order, so output is deterministic for any
+        `concurrency`. A section whose blocker edge would close a cycle (possible
+        only for input run() could not check first, i.e. stdin) ends the run
+        before anything more is sent.
+        """
+        source = iter(specs)
+        streaming = not isinstance(specs, list)
+        run = CreateRun()
+        titles, numbers, link_results = run.titles, run.numbers, run.link_results
+        journal = self.journal
+        resumed: Dict[int, Dict] = {}
+        done_types = set()
+        done_ops = set()
+        if journal:
+            resumed = {e['spec']: e for e in journal.of('issue')}
+            done_types = {(e['number'], e['type_id']) for e in journal.of('type')}
+            done_ops = {(e['op'], e['a'], e['b']) for e in journal.of('child') + journal.of('blocker')}
+
+        first_index: Dict[str, int] = {}
+        dependents: Dict[int, List[int]] = {}
+        pending: List[int] = []
+        existing: Dict[int, Optional[int]] = {}
+        type_ids: List[Optional[str]] = []
+        # Link ops wait on both endpoint titles.
+        ops_by_title: Dict[str, List[Tuple[str, str, str]]] = {}
+        planned_ops = set()
+        outcomes: List[Optional[Tuple[int, bool]]] = []
+        ready_ops: Dict[str, List[Tuple[str, str, str]]] = {'child': [], 'blocker': []}
+        queued_ops = set()
+        ready_types: List[Tuple[int, str]] = []
+        awaiting_type: Dict[int, str] = {}  # issue -> push fingerprint, recorded once its type is set
+        next_report = 0
+        exhausted = False
+        lookahead: Deque[IssueSpec] = deque()
+
+        def queue_op(op: Tuple[str, str, str]):
+            if op not in queued_ops and op[1] in numbers and op[2] in numbers:
+                queued_ops.add(op)
+                if op in done_ops:
+                    link_results[op] = AliasResult(op)
+                else:
+                    ready_ops[op[0]].append(op)
+
+        def complete(i: int, issue_num: int, created: bool):
+            """Record spec i's issue and release whatever was waiting on it"""
+            outcomes[i] = (issue_num, created)
+            numbers[titles[i]] = issue_num
+            fingerprint = self.spec_fingerprint(run.specs[i])
+            if streaming:
+                run.specs[i] = replace(run.specs[i], body='')  # only the report needs it from here on
+            with self._remote_lock:
+                current_type = self._seen_types.pop(issue_num, None)
+            if type_ids[i] and (issue_num, type_ids[i]) not in done_types and current_type != type_ids[i]:
+                ready_types.append((issue_num, type_ids[i]))
+                awaiting_type[issue_num] = fingerprint
+            else:
+                self.pushed.record(issue_num, fingerprint)
+            for j in dependents.pop(i, []):
+                if j in resumed:
+                    complete(j, resumed[j]['number'], resumed[j]['created'])
+                else:
+                    existing[j] = issue_num
+                    pending.append(j)
+            pending.sort()
+            for op in ops_by_title.get(titles[i], []):
+                queue_op(op)
+
+        def pull() -> bool:
+            """Take the next spec and plan its work (False once the input is exhausted)"""
+            if not lookahead:
+                with span(self.profiler, 'parse'):
+                    lookahead.extend(itertools.islice(source, self.batch_size))
+                if not lookahead:
+                    return False
+                # Labels the next chunk needs, created in one batch (none are requested when all are known)
+                self.ensure_labels_for_specs(lookahead)
+            spec = lookahead.popleft()
+            i = len(run.specs)
+            title = self.format_issue_title(spec)
+            run.specs.append(spec)
+            titles.append(title)
+            outcomes.append(None)
+            type_ids.append(self._type_id_for(spec.issue_type))
+            if i in resumed and resumed[i].get('title') != title:
+                del resumed[i]
+
+            # Plan Phase 2/3 links by title so they can run as soon as both ends exist
+            new_ops = []
+            if spec.parent_title:
+                run.child_links.append((spec.parent_title, title))
+                new_ops.append(('child', spec.parent_title, title))
+            cycles = len(run.blockers.cycles)
+            for blocked_title, blocker_title in run.blockers.add(title, spec):
+                new_ops.append(('blocker', blocked_title, blocker_title))
+            if len(run.blockers.cycles) > cycles:
+                # Only an unchecked stream (stdin) gets here: stop before sending anything more
+                for cycle in run.blockers.cycles[cycles:]:
+                    print(f"[ERROR] Blocking cycle in spec: {' -> '.join(cycle)}", file=sys.stderr)
+                print("[ERROR] Stopped at the section that closes the cycle; fix the spec before rerunning.",
+                      file=sys.stderr)
+                sys.exit(1)
+            for op in new_ops:
+                if op not in planned_ops:
+                    planned_ops.add(op)
+                    for endpoint in op[1:]:
+                        ops_by_title.setdefault(endpoint, []).append(op)
+
+            first = first_index.setdefault(title, i)
+            if first == i:
+                if i in resumed:
+                    complete(i, resumed[i]['number'], resumed[i]['created'])
+                else:
+                    existing[i] = self.existing_issue_for_spec(spec)
+                    pending.append(i)
+            elif outcomes[first] is not None:
+                if i in resumed:
+                    complete(i, resumed[i]['number'], resumed[i]['created'])
+                else:
+                    existing[i] = outcomes[first][0]
+                    pending.append(i)
+            else:
+                resumed.pop(i, None)
+                dependents.setdefault(first, []).append(i)
+            for op in new_ops:
+                queue_op(op)
+            return True
+
+        def journal_result(job, result):
+            if not journal:
+                return
+            if job[0] == 'create':
+                journal.record('issue', spec=job[1], title=titles[job[1]], number=result[0], created=result[1])
+            elif job[1] == 'type':
+                for (issue_num, type_id), r in zip(job[2], result):
+                    if r.ok:
+                        journal.record('type', number=issue_num, type_id=type_id)
+            else:
+                for op, r in result:
+                    if r.ok:
+                        journal.record(op[0], a=op[1], b=op[2])
+
+        def submit_batch(kind: str, items):
+            if kind == 'type':
+                return pool.submit(self.set_issue_type_ids, items)
+            pairs = [(numbers[a], numbers[b]) for _, a, b in items]
+            link = self.link_children if kind == 'child' else self.link_blockers
+            return pool.submit(lambda: list(zip(items, link(pairs))))
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            in_flight: Dict = {}
+            try:
+                while True:
+                    while len(in_flight) < max(1, concurrency):
+                        creating = (bool(pending) or not exhausted
+                                    or any(job[0] == 'create' for job in in_flight.values()))
+                        batch = None
+                        for kind, queue_ in (('child', ready_ops['child']), ('blocker', ready_ops['blocker']),
+                                             ('type', ready_types)):
+                            if len(queue_) >= self.batch_size or (queue_ and not creating):
+                                batch = (kind, queue_[:self.batch_size])
+                                del queue_[:self.batch_size]
+                                break
+                        if batch:
+                            in_flight[submit_batch(*batch)] = ('batch', *batch)
+                        elif pending:
+                            i = pending.pop(0)
+                            future = pool.submit(self.ensure_issue_for_spec, run.specs[i], False, existing[i])
+                            in_flight[future] = ('create', i)
+                        elif not exhausted:
+                            exhausted = not pull()
+                        else:
+                            break
+
+                    # Nothing in flight after dispatching means nothing is left to do.
+                    idle = not in_flight
+                    if not idle:
+                        done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                        for future in done:
+                            job = in_flight.pop(future)
+                            result = future.result()
+                            journal_result(job, result)
+                            if job[0] == 'batch':
+                                if job[1] == 'type':
+                                    run.type_results.extend(result)
+                                    for (issue_num, _), r in zip(job[2], result):
+                                        if r.ok and issue_num in awaiting_type:
+                                            self.pushed.record(issue_num, awaiting_type.pop(issue_num))
+                                else:
+                                    link_results.update({op: r for op, r in result})
+                                continue
+
+                            complete(job[1], *result)
+
+                    while next_report < len(outcomes) and outcomes[next_report] is not None:
+                        on_issue(run.specs[next_report], titles[next_report], *outcomes[next_report])
+                        next_report += 1
+                    if idle:
+                        break
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                # Journal work that still finished so --resume does not redo it
+                for future, job in in_flight.items():
+                    if not future.cancelled() and future.exception() is None:
+                        journal_result(job, future.result())
+                raise
+
+        return run
+
+    def process_specs(self, specs: Iterable[IssueSpec], concurrency: int = 1):
+        """Create all issues and set up relationships.
+
+        `specs` may be a list or a lazy iterator (e.g. iter_specs over stdin).
+        Issue creation runs on up to `concurrency` workers; the resulting
+        issues, types and links (and the printed report) are the same as a
+        serial run, only issue numbering may differ.
+        """
+        if isinstance(specs, list):
+            print(f"Creating {len(specs)} issues...")
+        else:
+            print("Creating issues...")
+        if self.journal and self.journal.entries:
+            print(f"Resuming: {len(self.journal.entries)} operation(s) already completed per {self.journal.path}")
         print()
 
-        # Phase 1: Create all issues
-        for spec in specs:
-            formatted_title = self.format_issue_title(spec)
-            issue_num, created = self.ensure_issue_for_spec(spec)
-            self.created_issues[formatted_title] = issue_num
-
+        def report(spec: IssueSpec, formatted_title: str, issue_num: int, created: bool):
+            action = "Created" if created else "Updated"
             if spec.is_epic:
-                action = "Created" if created else "Updated"
                 print(f"[OK] {action} Epic #{issue_num}: {formatted_title}")
             else:
                 areas_str = ', '.join(spec.areas) if spec.areas else 'none'
-                action = "Created" if created else "Updated"
                 print(f"  [OK] {action} #{issue_num}: {formatted_title} (priority: {spec.priority}, areas: {areas_str})")
 
+        # Phase 1 (create/update + Issue Types) with Phase 2/3 links dispatched as they become ready
+        run = self._run_create_schedule(specs, concurrency, report)
+        specs, titles, numbers, link_results = run.specs, run.titles, run.numbers, run.link_results
+        title_set = set(titles)
+        for title in titles:
+            self.created_issues[title] = numbers[title]
+
+        for result in run.type_results:
+            if not result.ok:
+                print(f"  [WARN] Unable to set Issue Type on #{result.key}: {result.error}", file=sys.stderr)
+
         print()
 
-        # Phase 2: Link parent/child relationships
+        # Phase 2: Report parent/child links (batched addSubIssue)
         if any(s.parent_title for s in specs):
             print("Setting up relationships...")
-            for spec in specs:
-                if spec.parent_title and spec.parent_title in self.created_issues:
-                    parent_num = self.created_issues[spec.parent_title]
-                    child_title = self.format_issue_title(spec)
-                    child_num = self.created_issues.get(child_title)
-                    if child_num is None:
-                        continue
-
-                    self.add_child_to_parent(parent_num, child_num)
+            for parent_title, child_title in run.child_links:
+                child_num = numbers[child_title]
+                if parent_title not in title_set:
+                    print(f"  [WARN] #{child_num} parent Epic not found: {parent_title}", file=sys.stderr)
+                    continue
+                result = link_results[('child', parent_title, child_title)]
+                parent_num = numbers[parent_title]
+                if result.ok:
                     print(f"  [OK] Linked #{child_num} as child of #{parent_num}")
+                else:
+                    print(f"  [WARN] Unable to link #{child_num} to #{parent_num}: {result.error}", file=sys.stderr)
             print()
 
-        # Phase 3: Set blocking relationships
-        blocked_issues = [s for s in specs if s.blocked_by]
-        if blocked_issues:
+        # Phase 3: Report blocking relationships (batched addBlockedBy)
+        graph = run.blockers
+        if graph.edges or graph.cycles or graph.unknown():
             print("Setting up blocking relationships...")
-            for spec in blocked_issues:
-                blocked_title = self.format_issue_title(spec)
-                blocked_issue_num = self.created_issues.get(blocked_title)
-                if blocked_issue_num is None:
-                    continue
-                for blocker_title in spec.blocked_by:
-                    if blocker_title in self.created_issues:
-                        blocking_issue_num = self.created_issues[blocker_title]
-                        self.add_blocking_relationship(blocked_issue_num, blocking_issue_num)
-                        print(f"  [OK] #{blocked_issue_num} blocked by #{blocking_issue_num}")
-                    else:
-                        print(f"  [WARN] #{blocked_issue_num} blocker not found: {blocker_title}", file=sys.stderr)
+            for blocked_title, blocker_title in graph.edges:
+                blocked_issue_num = numbers[blocked_title]
+                result = link_results[('blocker', blocked_title, blocker_title)]
+                blocking_issue_num = numbers[blocker_title]
+                if result.ok:
+                    print(f"  [OK] #{blocked_issue_num} blocked by #{blocking_issue_num}")
+                else:
+                    print(f"  [WARN] Unable to add blocker #{blocking_issue_num} -> #{blocked_issue_num}: "
+                          f"{result.error}", file=sys.stderr)
+            for warning in graph.warnings():
+                print(f"  [WARN] Not linked, {warning}", file=sys.stderr)
             print()
 
         print("Summary:")
@@ -862,6 +1926,130 @@ class IssueCreator:
         for title, num in self.created_issues.items():
             print(f"  #{num}: {title}")
 
+    def build_plan(self, specs: List[IssueSpec], mode: str = 'create', target: Optional[int] = None,
+                   link_children: Iterable[Tuple[int, int]] = (), link_blockers: Iterable[Tuple[int, int]] = (),
+                   sync_types: Iterable[int] = ()) -> Dict:
+        """Return the operation graph a run would execute, without any network access.
+
+        `mode` is one of create, single, epic, auto, blockers or add-child.
+        Issues are referenced as {"spec": i} (issue produced by spec i),
+        {"number": n} (existing issue) or {"title": t} (looked up by title at
+        run time); "after" lists the operation ids each operation waits for.
+        """
+        ops: List[Dict] = []
+        warnings: List[str] = []
+
+        def add(op: str, after: Iterable[int] = (), **fields) -> int:
+            ops.append({'id': len(ops), 'op': op, **fields, 'after': sorted(set(after))})
+            return len(ops) - 1
+
+        def issue_fields(i: int) -> Dict:
+            spec = specs[i]
+            return {
+                'spec': i,
+                'title': self.format_issue_title(spec),
+                'issue_type': self.config['issue_type_mapping'].get(spec.issue_type),
+                'labels': self.labels_for_spec(spec),
+            }
+
+        for number in sync_types:
+            add('sync_type', issue={'number': number})
+        for parent, child in link_children:
+            add('add_sub_issue', parent={'number': parent}, child={'number': child})
+        for blocked, blocker in link_blockers:
+            add('add_blocked_by', issue={'number': blocked}, blocker={'number': blocker})
+
+        if specs:
+            labels = sorted({label for spec in specs for label in self.labels_for_spec(spec)})
+            preflight = [add('ensure_labels', labels=labels)]
+        else:
+            preflight = []
+
+        if mode == 'create':
+            by_title: Dict[str, int] = {}
+            for i, spec in enumerate(specs):
+                title = self.format_issue_title(spec)
+                first = by_title.get(title)
+                after = preflight + ([first] if first is not None else [])
+                by_title[title] = add('upsert', after, match='title', **issue_fields(i))
+            for i, spec in enumerate(specs):
+                if spec.parent_title and spec.parent_title not in by_title:
+                    warnings.append(f"'{self.format_issue_title(spec)}' parent Epic not found: {spec.parent_title}")
+                elif spec.parent_title:
+                    parent_op, child_op = by_title[spec.parent_title], by_title[self.format_issue_title(spec)]
+                    add('add_sub_issue', [parent_op, child_op],
+                        parent={'spec': ops[parent_op]['spec']}, child={'spec': ops[child_op]['spec']})
+            graph = self.blocker_graph(specs)
+            for blocked_title, blocker_title in graph.ordered_edges():
+                blocked_op, blocker_op = by_title[blocked_title], by_title[blocker_title]
+                add('add_blocked_by', [blocked_op, blocker_op],
+                    issue={'spec': ops[blocked_op]['spec']}, blocker={'spec': ops[blocker_op]['spec']})
+            warnings.extend(graph.warnings())
+
+        elif mode == 'single' and specs:
+            add('update', preflight, issue={'number': target}, **issue_fields(0))
+
+        elif mode == 'epic':
+            epic_index = next((i for i, s in enumerate(specs) if s.is_epic), None)
+            if epic_index is None:
+                warnings.append("No Epic found in spec file")
+            else:
+                epic_op = add('update', preflight, issue={'number': target}, **issue_fields(epic_index))
+                add('update_epic_children', [epic_op], epic={'number': target},
+                    match=['issue_number', 'content_hash', 'title'], create_unmatched=True,
+                    specs=[i for i, s in enumerate(specs) if not s.is_epic])
+
+        elif mode == 'auto':
+            epic_index = next((i for i, s in enumerate(specs) if s.is_epic), None)
+            epic_num = specs[epic_index].issue_number if epic_index is not None else None
+            if epic_num:
+                add('update', preflight, issue={'number': epic_num}, **issue_fields(epic_index))
+            for i, spec in enumerate(specs):
+                if spec.is_epic:
+                    continue
+                if spec.issue_number:
+                    add('update', preflight, issue={'number': spec.issue_number}, **issue_fields(i))
+                    continue
+                create_op = add('create', preflight, **issue_fields(i))
+                if epic_num:
+                    add('add_sub_issue', [create_op], parent={'number': epic_num}, child={'spec': i})
+
+        elif mode == 'blockers':
+            graph = self.blocker_graph(specs)
+            edges = graph.ordered_edges() + graph.external_edges()
+            refs: Dict[str, Dict] = {}
+            for i, spec in enumerate(specs):
+                title = self.format_issue_title(spec)
+                if title not in refs:
+                    refs[title] = {'number': spec.issue_number} if spec.issue_number else {'title': title}
+            blocked_titles = {blocked for blocked, _ in edges}
+            update_ops: Dict[str, int] = {}
+            for i, spec in enumerate(specs):
+                title = self.format_issue_title(spec)
+                if title in blocked_titles and title not in update_ops:
+                    update_ops[title] = add('update', preflight, issue=refs[title], **issue_fields(i))
+            for blocked_title, blocker_title in edges:
+                add('add_blocked_by', [update_ops[blocked_title]] if blocked_title in update_ops else [],
+                    issue=refs.get(blocked_title, {'title': blocked_title}),
+                    blocker=refs.get(blocker_title, {'title': blocker_title}))
+            warnings.extend(f"blocking cycle: {' -> '.join(cycle)}" for cycle in graph.cycles)
+
+        elif mode == 'add-child' and specs:
+            create_op = add('create', preflight, **issue_fields(0))
+            add('add_sub_issue', [create_op], parent={'number': target}, child={'spec': 0})
+
+        counts: Dict[str, int] = {}
+        for op in ops:
+            counts[op['op']] = counts.get(op['op'], 0) + 1
+        return {
+            'mode': mode,
+            'specs': len(specs),
+            'counts': counts,
+            'operations': ops,
+            'warnings': warnings,
+        }
+
+
 def main():
     try:
         sys.stdout.reconfigure(encoding='utf-8')
@@ -879,7 +2067,7 @@ Examples:
   # Update single issue
   %(prog)s specs.md --update 171
 
-  # Update Epic and all children (matches by order)
+  # Update Epic and all children (matched by issue_number, content or title; new sections are created)
   %(prog)s specs.md --update-epic 170
 
   # Auto-update issues (requires issue_number: N in spec)
@@ -891,6 +2079,9 @@ Examples:
   # Create new issue and add to Epic #170
   %(prog)s new_child.md --add-child 170
 
+  # Create from several files, globs or directories (*.md) in one run
+  %(prog)s specs/milestone-3/ 'specs/shared/*.md'
+
   # Read from stdin
   cat specs.md | %(prog)s
 
@@ -906,9 +2097,11 @@ Update mode metadata:
         '''
     )
 
-    parser.add_argument('spec_file', nargs='?', help='Spec file path (or read from stdin)')
+    parser.add_argument('spec_files', nargs='*', metavar='SPEC',
+                        help='Spec file(s), glob(s) or directories of *.md specs (or read from stdin)')
     parser.add_argument('--update', type=int, metavar='NUM', help='Update single issue NUM with first spec in file')
-    parser.add_argument('--update-epic', type=int, metavar='NUM', help='Update Epic NUM and all children (matches by order)')
+    parser.add_argument('--update-epic', type=int, metavar='NUM', help='Update Epic NUM and its children (matched by issue_number, content hash or title); '
+                             'unmatched sections are created and linked')
     parser.add_argument('--update-auto', action='store_true', help='Update issues based on issue_number metadata in specs')
     parser.add_argument('--add-child', type=int, metavar='EPIC_NUM', help='Create new issue from spec and link to Epic EPIC_NUM')
     parser.add_argument(
@@ -920,12 +2113,207 @@ Update mode metadata:
     parser.add_argument('--update-blockers', action='store_true', help='Update blocked_by relationships for issues described in the spec')
     parser.add_argument('--link-blocker', action='append', metavar='BLOCKED:BLOCKER', help='Explicitly link two existing issues via blocking (can be repeated)')
     parser.add_argument('--link-child', action='append', metavar='PARENT:CHILD', help='Explicitly link an existing child to an Epic (can be repeated)')
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        metavar='N',
+        help=f'Max operations per aliased GraphQL mutation when linking/setting types (default: {DEFAULT_CHUNK_SIZE})',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Create/update up to N issues in parallel in create mode (default: 1)',
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write on-disk caches (issue node IDs, ...) under ~/.cache/aide; '
+             'the create-mode journal for --resume goes to the system temp directory instead',
+    )
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help='Refetch cached org Issue Types instead of trusting the on-disk copy',
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='--update-auto: push every section, even those unchanged since the last push',
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        help='Create mode: skip operations a previous interrupted run of the same spec journaled as done',
+    )
+    parser.add_argument(
+        '--plan',
+        action='store_true',
+        help='Print the planned operations (creates, updates, labels, links) as JSON; no GitHub access',
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Time every phase and GitHub call; print a summary table and write a Chrome trace (see --trace-file)',
+    )
+    parser.add_argument(
+        '--trace-file',
+        default='issue-creator.trace.json',
+        metavar='PATH',
+        help='--profile: trace-event JSON output, viewable in chrome://tracing or Perfetto '
+             '(default: issue-creator.trace.json)',
+    )
+    parser.add_argument(
+        '--transport',
+        choices=['auto', 'http', 'gh'],
+        default=None,
+        help='GitHub backend: pooled HTTPS (http), gh CLI per call (gh), or http when a token is available (auto, default)',
+    )
 
     args = parser.parse_args()
 
-    # Initialize creator
-    creator = IssueCreator()
+    # Initialize creator (the GitHub client is created on the first API call)
+    profiler = Profiler() if args.profile else None
+    creator = IssueCreator(batch_size=args.batch_size, use_cache=not args.no_cache,
+                           refresh_cache=args.refresh_cache, transport_kind=args.transport, force=args.force,
+                           profiler=profiler)
+    try:
+        if args.plan:
+            run_plan(creator, args, parser)
+        else:
+            run(creator, args, parser)
+    finally:
+        creator.flush_caches()
+        for line in creator.summary():
+            print(line, file=sys.stderr)
+        if profiler:
+            for line in profiler.summary():
+                print(line, file=sys.stderr)
+            profiler.write_trace(Path(args.trace_file))
+            print(f"Trace written to {args.trace_file}", file=sys.stderr)
+
+
+def expand_spec_paths(patterns: List[str]) -> List[Path]:
+    """Expand spec arguments (files, globs, directories of *.md) into unique paths, in argument order"""
+    paths: List[Path] = []
+    seen = set()
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob('*.md') if p.is_file())
+        elif any(c in pattern for c in '*?['):
+            matches = sorted(Path(m) for m in glob.glob(pattern, recursive=True) if os.path.isfile(m))
+        else:
+            matches = [path]
+        if not matches:
+            print(f"Error: no spec files match '{pattern}'", file=sys.stderr)
+            sys.exit(1)
+        for match in matches:
+            if match.resolve() not in seen:
+                seen.add(match.resolve())
+                paths.append(match)
+    return paths
+
+
+def spec_lines(path: Optional[Path], parser: argparse.ArgumentParser) -> Iterator[str]:
+    """Yield spec lines from the spec file or stdin as they are read; prints help when there is neither"""
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            yield from f
+        return
+    if sys.stdin.isatty():
+        parser.print_help()
+        sys.exit(0)
+    yield from sys.stdin
+
+
+def check_blocker_graph(graph: BlockerGraph, create_mode: bool):
+    """Exit on a blocking cycle before anything is sent; in create mode also warn about unknown references"""
+    for cycle in graph.cycles:
+        print(f"[ERROR] Blocking cycle in spec: {' -> '.join(cycle)}", file=sys.stderr)
+    if graph.cycles:
+        sys.exit(1)
+    if create_mode:
+        for title, field_name, ref in graph.unknown():
+            print(f"[WARN] '{title}' {field_name}: {ref} matches no section in the spec and will not be linked",
+                  file=sys.stderr)
+
+
+def read_specs(creator: IssueCreator, paths: List[Path], parser: argparse.ArgumentParser,
+               stream: bool = False) -> Tuple[Iterable[IssueSpec], Callable[[], List[str]]]:
+    """Specs from the spec paths (or stdin), plus a callable returning the checklist warnings.
+
+    One file (or stdin) is parsed in a single pass, lazily when `stream` is
+    set; several files are parsed in parallel into one list, so parents and
+    blockers resolve across all of them. Before a streamed file is parsed,
+    its title and blocks/blocked_by lines are scanned for cycles
+    (iter_blocker_refs); stdin cannot be read twice, so a cycle there stops
+    the create run at the section that closes it.
+    """
+    if len(paths) > 1:
+        with span(creator.profiler, 'parse'):
+            specs, warnings = creator.parse_spec_files(paths)
+        return specs, lambda: warnings
+    path = paths[0] if paths else None
+    checklists = ChecklistScan()
+    specs_iter = creator.iter_specs(checklists.tap(spec_lines(path, parser)))
+    if stream:
+        if path:
+            graph = BlockerGraph()
+            with span(creator.profiler, 'parse'):
+                for refs in creator.iter_blocker_refs(spec_lines(path, parser)):
+                    graph.add_refs(*refs)
+            check_blocker_graph(graph, create_mode=True)
+        return specs_iter, checklists.warnings
+    with span(creator.profiler, 'parse'):
+        return list(specs_iter), checklists.warnings
+
+
+def run_plan(creator: IssueCreator, args: argparse.Namespace, parser: argparse.ArgumentParser):
+    """--plan: print the operation graph as JSON without contacting GitHub"""
+    try:
+        sync_types = [int(n.strip()) for n in args.sync_types.split(',')] if args.sync_types else []
+        link_blockers = [creator.parse_link_arg(v) for v in args.link_blocker or []]
+        link_children = [creator.parse_link_arg(v) for v in args.link_child or []]
+    except ValueError as exc:
+        print(f"[ERROR] Invalid issue numbers: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+    specs: List[IssueSpec] = []
+    if not (sync_types or link_blockers or link_children):
+        specs, checklist_warnings = read_specs(creator, expand_spec_paths(args.spec_files), parser)
+        if not specs:
+            print("No issues found in spec file", file=sys.stderr)
+            sys.exit(1)
+        for warning in checklist_warnings():
+            print(warning, file=sys.stderr)
+
+    if args.update:
+        mode, target = 'single', args.update
+    elif args.update_epic:
+        mode, target = 'epic', args.update_epic
+    elif args.update_auto:
+        mode, target = 'auto', None
+    elif args.update_blockers:
+        mode, target = 'blockers', None
+    elif args.add_child:
+        mode, target = 'add-child', args.add_child
+    else:
+        mode, target = 'create', None
+
+    plan = creator.build_plan(specs, mode, target, link_children=link_children,
+                              link_blockers=link_blockers, sync_types=sync_types)
+    json.dump(plan, sys.stdout, indent=2)
+    print()
+    if plan['warnings']:
+        for warning in plan['warnings']:
+            print(f"[WARN] {warning}", file=sys.stderr)
 
+
+def run(creator: IssueCreator, args: argparse.Namespace, parser: argparse.ArgumentParser):
+    """Dispatch the selected mode (main() reports rate limits afterwards)"""
     # Handle --sync-types mode (doesn't require spec file)
     if args.sync_types:
         try:
@@ -955,32 +2343,39 @@ Update mode metadata:
                     print(f"[ERROR] Invalid --link-child value '{value}': {exc}", file=sys.stderr)
         sys.exit(0)
 
-    # Read spec file
-    if args.spec_file:
-        with open(args.spec_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+    # Parse specs (a single file or stdin in one pass, which create mode consumes as it is read;
+    # several files in parallel into one set)
+    paths = expand_spec_paths(args.spec_files)
+    create_mode = not (args.update or args.update_epic or args.update_auto or args.update_blockers
+                       or args.add_child)
+    specs, checklist_warnings = read_specs(creator, paths, parser, stream=create_mode)
+    if isinstance(specs, list):
+        first_spec = specs[0] if specs else None
     else:
-        if sys.stdin.isatty():
-            parser.print_help()
-            sys.exit(0)
-        content = sys.stdin.read()
-
-    # Parse specs
-    specs = creator.parse_spec_file(content)
-
-    if not specs:
+        first_spec = next(specs, None)
+        specs = itertools.chain([first_spec], specs)
+    if first_spec is None:
         print("No issues found in spec file", file=sys.stderr)
         sys.exit(1)
 
-    # Check for checklists (warning only)
-    checklist_warnings = creator.check_for_checklists(content)
-    for warning in checklist_warnings:
-        print(warning, file=sys.stderr)
-        print()
+    if not create_mode:
+        # Check for checklists (warning only)
+        for warning in checklist_warnings():
+            print(warning, file=sys.stderr)
+            print()
+
+    if isinstance(specs, list) and (create_mode or args.update_blockers):
+        # Check the blocking graph before anything is sent (read_specs checks a streamed file itself)
+        check_blocker_graph(creator.blocker_graph(specs), create_mode)
 
-    # Preflight labels for spec-driven runs
-    if not (args.sync_types or args.link_blocker or args.link_child):
-        creator.ensure_labels_for_specs(specs)
+    if isinstance(specs, list):
+        # One label preflight for the whole set (a streamed create run ensures them per spec as it goes;
+        # --update-auto only for sections that will actually be pushed)
+        creator.ensure_labels_for_specs([s for s in specs if creator.needs_push(s)] if args.update_auto else specs)
+
+    if args.resume and (args.update or args.update_epic or args.update_auto or args.update_blockers
+                        or args.add_child):
+        print("[WARN] --resume only applies to create mode; ignoring it", file=sys.stderr)
 
     # Determine mode
     if args.update:
@@ -1009,8 +2404,21 @@ Update mode metadata:
         creator.add_child_to_parent(args.add_child, issue_num)
         print(f"[OK] Linked #{issue_num} to Epic #{args.add_child}")
     else:
-        # Create mode (default)
-        creator.process_specs(specs)
+        # Create mode (default); completed operations are journaled for --resume
+        source = '\n'.join(str(p.resolve()) for p in paths) if paths else '<stdin>'
+        journal = creator.open_journal(source, resume=args.resume)
+        try:
+            creator.process_specs(specs, concurrency=args.concurrency)
+        except BaseException:
+            print(f"[ERROR] Run interrupted. Completed operations are journaled in {journal.path}; "
+                  "rerun with --resume to skip them.", file=sys.stderr)
+            raise
+        finally:
+            journal.close()
+        for warning in checklist_warnings():
+            print(warning, file=sys.stderr)
+            print()
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared GitHub plumbing (aide_github) used by issue-creator.
+
+Usage:
+    python -m unittest discover -s tools/issue-creator
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TOOLS_DIR))
+from aide_github.fake import FakeGitHub, FakeTransport  # noqa: E402
+from aide_github.index import IssueTitleIndex  # noqa: E402
+from aide_github.journal import Journal  # noqa: E402
+from aide_github.profile import Profiler  # noqa: E402
+from aide_github.transport import RATE_LIMIT_ALIAS, _with_rate_limit  # noqa: E402
+
+
+class RateLimitSelectionTest(unittest.TestCase):
+    """graphql() asks for the query's cost inside the operation, never inside a fragment"""
+
+    def top_level(self, query: str) -> str:
+        costed = _with_rate_limit(query)
+        self.assertIsNotNone(costed)
+        return costed
+
+    def test_added_to_the_operation_not_a_trailing_fragment(self):
+        costed = self.top_level("query { repository { ...Fields } }\nfragment Fields on Repository { id }")
+        operation, fragment = costed.split("fragment")
+        self.assertIn(RATE_LIMIT_ALIAS, operation)
+        self.assertNotIn(RATE_LIMIT_ALIAS, fragment)
+
+    def test_leading_fragment_is_skipped(self):
+        costed = self.top_level("fragment F on Issue { id }\nquery { node(id: \"x\") { ...F } }")
+        self.assertTrue(costed.startswith("fragment F on Issue { id }\nquery"))
+        self.assertIn(RATE_LIMIT_ALIAS, costed.split("query", 1)[1])
+
+    def test_braces_in_arguments_strings_and_comments_are_ignored(self):
+        query = 'query Q($n: Int = 1) { # {\n  a(input: {s: "}"}, t: """ } """) { id } }'
+        self.assertEqual(self.top_level(query), query[:-1] + f" {RATE_LIMIT_ALIAS}: rateLimit "
+                         "{ cost limit remaining resetAt }\n}")
+
+    def test_mutations_are_left_alone(self):
+        self.assertIsNone(_with_rate_limit("mutation { addLabelsToLabelable(input: {labelIds: []}) { clientMutationId } }"))
+        self.assertIsNone(_with_rate_limit("fragment F on Issue { id }\nmutation { a { ...F } }"))
+
+    def test_cost_is_recorded_and_removed_from_the_data(self):
+        transport = FakeTransport(FakeGitHub())
+        transport.profiler = Profiler()
+        data = transport.graphql("query { repository(owner: \"acme\", name: \"widgets\") { id } }")
+        self.assertEqual(data, {"repository": {"id": "R_fake"}})
+        self.assertIn("rateLimit", transport.github.calls[-1]["fields"])
+
+
+class IssueTitleIndexTest(unittest.TestCase):
+    def index(self, *titles: str) -> IssueTitleIndex:
+        github = FakeGitHub()
+        for title in titles:
+            github.create_issue(title)
+        return IssueTitleIndex(FakeTransport(github), "acme", "widgets", persist=False)
+
+    def test_duplicate_titles_resolve_to_the_oldest_issue(self):
+        index = self.index("Other", "Shared", "Shared ")
+        self.assertEqual(index.matches("Shared"), [2, 3])
+        self.assertEqual(index.find("Shared"), 2)
+        index.add(2, "Renamed")
+        self.assertEqual(index.find("Shared"), 3)
+
+    def test_loose_lookup_ignores_case_and_whitespace(self):
+        index = self.index("Set up  the Queue")
+        self.assertIsNone(index.find("set up the queue"))
+        self.assertEqual(index.find("set up the queue", exact=False), 1)
+        self.assertEqual(index.find(" Set up  the Queue "), 1)
+
+
+class JournalTest(unittest.TestCase):
+    def test_resume_after_a_torn_write(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "run.jsonl"
+            journal = Journal(path)
+            journal.record("issue", spec=0, number=1)
+            journal.close()
+            with open(path, "a", encoding="utf-8") as f:
+                f.write('{"op": "issue", "spec": 1, "num')  # the process died mid-write
+
+            journal = Journal(path, resume=True)
+            self.assertEqual(journal.of("issue"), [{"op": "issue", "spec": 0, "number": 1}])
+            journal.record("issue", spec=1, number=2)
+            journal.close()
+            resumed = Journal(path, resume=True)
+            self.assertEqual([e["spec"] for e in resumed.of("issue")], [0, 1])
+            resumed.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
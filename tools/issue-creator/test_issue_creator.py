@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Tests for issue-creator against the in-process fake GitHub (aide_github.fake).
+
+Usage:
+    python -m unittest discover -s tools/issue-creator
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TOOLS_DIR))
+from aide_github.fake import FakeGitHub, FakeTransport  # noqa: E402
+
+
+def load_issue_creator():
+    """Import issue-creator.py (not importable by name because of the hyphen)"""
+    spec = importlib.util.spec_from_file_location('issue_creator', Path(__file__).with_name('issue-creator.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses look their module up here
+    spec.loader.exec_module(module)
+    return module
+
+
+ic = load_issue_creator()
+
+
+def spec_text(epics: int = 3, children: int = 6) -> str:
+    """Epics with children, blockers between siblings (both fields) and one repeated title"""
+    sections = []
+    for e in range(epics):
+        sections.append(f"## [Epic]: Epic {e}\n\n### Goal\nEpic {e} goal\n")
+        for c in range(children):
+            fields = [f"parent: Epic {e}"]
+            if c > 0:
+                fields.append(f"blocked_by: Task {e}.{c - 1}")
+            if c == 2:
+                fields.append(f"blocks: Task {e}.{children - 1}")
+            kind = 'Bug' if c % 3 == 0 else 'Feature'
+            sections.append(f"## [{kind}]: Task {e}.{c}\n" + '\n'.join(fields)
+                            + f"\n\n### Goal\nWork item {e}.{c}\n")
+    sections.append("## [Feature]: Task 0.1\nparent: Epic 0\n\n### Goal\nWork item 0.1, revised\n")
+    return '\n---\n\n'.join(sections)
+
+
+class ProcessSpecsConcurrencyTest(unittest.TestCase):
+    """process_specs gives the same repository state and report for any --concurrency"""
+
+    def setUp(self):
+        cache = tempfile.TemporaryDirectory()
+        self.addCleanup(cache.cleanup)
+        env = mock.patch.dict(os.environ, {'AIDE_CACHE_DIR': cache.name, 'GH_REPO': 'acme/widgets',
+                                           'AIDE_GH_RATE': 'off'})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def run_create(self, concurrency: int, stream: bool = False, github: FakeGitHub = None):
+        """(snapshot, report with issue numbers replaced by titles) of one create run (on a fresh fake by default)"""
+        github = github or FakeGitHub(latency=0.002)  # lets concurrent workers finish out of order
+        with contextlib.redirect_stderr(io.StringIO()):
+            creator = ic.IssueCreator(transport=FakeTransport(github), use_cache=False)
+            specs = creator.iter_specs(io.StringIO(spec_text()))
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                creator.process_specs(specs if stream else list(specs), concurrency=concurrency)
+        report = re.sub(r'#(\d+)', lambda m: f"#<{github.issues[int(m[1])].title}>", out.getvalue())
+        return github.snapshot(), report
+
+    def test_concurrent_run_matches_serial_run(self):
+        serial_snapshot, serial_report = self.run_create(1)
+        self.assertEqual(len(serial_snapshot), 3 + 3 * 6)
+        self.assertTrue(any(blockers for *_, blockers in serial_snapshot))
+        for concurrency in (2, 8):
+            with self.subTest(concurrency=concurrency):
+                snapshot, report = self.run_create(concurrency)
+                self.assertEqual(snapshot, serial_snapshot)
+                self.assertEqual(report, serial_report)
+
+    def test_streamed_run_matches_list_run(self):
+        snapshot, report = self.run_create(1)
+        streamed_snapshot, streamed_report = self.run_create(4, stream=True)
+        self.assertEqual(streamed_snapshot, snapshot)
+        self.assertEqual(streamed_report.replace('Creating issues...', ''),
+                         re.sub(r'Creating \d+ issues\.\.\.', '', report))
+
+    def test_rerun_does_not_reset_issue_types(self):
+        github = FakeGitHub()
+        snapshot, _ = self.run_create(4, github=github)
+        sent = len(github.calls)
+        self.assertEqual(self.run_create(4, github=github)[0], snapshot)
+        fields = [field for call in github.calls[sent:] for field in call.get('fields', [])]
+        self.assertNotIn('updateIssueIssueType', fields)
+        self.assertNotIn('createIssue', fields)
+
+
+class BlockerGraphTest(unittest.TestCase):
+    def graph(self, *sections):
+        """Graph of (title, blocked_by, blocks) sections"""
+        graph = ic.BlockerGraph()
+        for title, blocked_by, blocks in sections:
+            graph.add_refs(title, title, blocked_by, blocks)
+        return graph
+
+    def test_cycle_edge_is_refused_and_reported(self):
+        graph = self.graph(('A', ['B'], []), ('B', ['C'], []), ('C', ['a'], []))
+        self.assertEqual(graph.edges, [('A', 'B'), ('B', 'C')])
+        self.assertEqual(graph.cycles, [['C', 'A', 'B', 'C']])
+        self.assertIn('blocking cycle: C -> A -> B -> C', graph.warnings())
+
+    def test_both_fields_give_one_edge_and_forward_references_resolve(self):
+        graph = self.graph(('A', ['b '], []), ('B', [], ['A']), ('C', ['Elsewhere'], []))
+        self.assertEqual(graph.edges, [('A', 'B')])
+        self.assertEqual(graph.ordered_edges(), [('A', 'B')])
+        self.assertEqual(graph.external_edges(), [('C', 'Elsewhere')])
+        self.assertEqual(graph.cycles, [])
+
+    def test_light_scan_matches_full_parse(self):
+        with contextlib.redirect_stderr(io.StringIO()):
+            creator = ic.IssueCreator(transport=FakeTransport(FakeGitHub()), use_cache=False)
+        text = spec_text() + "\n---\n\n## [Feature]: Task 0.5\nblocks: TASK 0.0\n\n### Goal\nCloses a cycle\n"
+        scanned = ic.BlockerGraph()
+        for refs in creator.iter_blocker_refs(io.StringIO(text)):
+            scanned.add_refs(*refs)
+        parsed = creator.blocker_graph(creator.iter_specs(io.StringIO(text)))
+        self.assertEqual((scanned.edges, scanned.cycles), (parsed.edges, parsed.cycles))
+        self.assertTrue(parsed.cycles)
+
+    def test_streamed_cycle_stops_the_run(self):
+        github = FakeGitHub()
+        text = "## [Bug]: A\nblocked_by: B\n\n---\n\n## [Bug]: B\nblocked_by: A\n\n---\n\n## [Bug]: C\n"
+        err = io.StringIO()
+        with mock.patch.dict(os.environ, {'GH_REPO': 'acme/widgets', 'AIDE_GH_RATE': 'off'}), \
+                contextlib.redirect_stderr(err), contextlib.redirect_stdout(io.StringIO()):
+            creator = ic.IssueCreator(transport=FakeTransport(github), use_cache=False)
+            with self.assertRaises(SystemExit):
+                creator.process_specs(creator.iter_specs(io.StringIO(text)), concurrency=1)
+        self.assertIn('Blocking cycle in spec: B -> A -> B', err.getvalue())
+        self.assertNotIn('C', [issue.title for issue in github.issues.values()])
+
+
+class AreaMatcherTest(unittest.TestCase):
+    KEYWORDS = {'jobs': ['work queue'], 'ai': ['ai'], 'ui': ['button']}
+
+    def setUp(self):
+        cache = tempfile.TemporaryDirectory()
+        self.addCleanup(cache.cleanup)
+        env = mock.patch.dict(os.environ, {'AIDE_CACHE_DIR': cache.name})
+        env.start()
+        self.addCleanup(env.stop)
+        ic.AreaMatcher._cache.clear()
+
+    def test_substring_phrase_does_not_span_line_breaks(self):
+        for matcher in (ic.AreaMatcher(self.KEYWORDS),
+                        ic.AreaMatcher.for_config(self.KEYWORDS, config_digest='a'),
+                        self.reloaded('substring')):
+            self.assertEqual(matcher.areas("the work queue is slow"), ['jobs'])
+            self.assertEqual(matcher.areas("the work\n  queue is slow"), [])
+            self.assertEqual(matcher.areas("the work  queue is slow"), [])
+
+    def test_word_mode_matches_whole_words_and_phrases_across_whitespace(self):
+        for matcher in (ic.AreaMatcher(self.KEYWORDS, 'word'), self.reloaded('word')):
+            self.assertEqual(matcher.areas("maintain the Work\n  Queue"), ['jobs'])
+            self.assertEqual(matcher.areas("an AI button"), ['ai', 'ui'])
+            self.assertEqual(matcher.areas("buttons"), [])
+
+    def test_substring_mode_matches_inside_words(self):
+        self.assertEqual(ic.AreaMatcher(self.KEYWORDS).areas("maintain buttons"), ['ai', 'ui'])
+
+    def reloaded(self, mode: str):
+        """A matcher read back from the on-disk cache (as a second run would)"""
+        ic.AreaMatcher.for_config(self.KEYWORDS, mode, config_digest='b')
+        ic.AreaMatcher._cache.clear()
+        return ic.AreaMatcher.for_config(self.KEYWORDS, mode, config_digest='b')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for migrate-type-labels.py against the in-process fake GitHub (aide_github.fake).
+
+Usage:
+    python -m unittest discover -s tools/issue-creator
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+TOOLS_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(TOOLS_DIR))
+from aide_github.fake import FakeGitHub, FakeTransport  # noqa: E402
+
+
+def load_migrate():
+    """Import migrate-type-labels.py (not importable by name because of the hyphens)"""
+    spec = importlib.util.spec_from_file_location('migrate_type_labels', TOOLS_DIR / 'migrate-type-labels.py')
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses look their module up here
+    spec.loader.exec_module(module)
+    return module
+
+
+migrate = load_migrate()
+
+
+class LimitResumeTest(unittest.TestCase):
+    """--limit N counts legacy-labelled issues per run, so each --resume handles the next N"""
+
+    def setUp(self):
+        cache = tempfile.TemporaryDirectory()
+        self.addCleanup(cache.cleanup)
+        env = mock.patch.dict(os.environ, {'AIDE_CACHE_DIR': cache.name, 'GH_REPO': 'acme/widgets',
+                                           'AIDE_GH_RATE': 'off'})
+        env.start()
+        self.addCleanup(env.stop)
+        self.github = FakeGitHub()
+        for n in range(30):
+            self.github.create_issue(f"Issue {n}", labels=['bug'] if n % 3 else ['area:x'])
+
+    def legacy_left(self) -> int:
+        return sum(1 for issue in self.github.issues.values() if 'bug' in issue.labels)
+
+    def run_migrate(self, *argv: str) -> int:
+        args = ['migrate-type-labels.py', '--apply', '--scan', 'all', '--batch-size', '3', *argv]
+        with mock.patch.object(sys, 'argv', args), mock.patch.object(migrate, 'PAGE_SIZE', 6), \
+                mock.patch.object(migrate, 'make_transport', lambda _kind: FakeTransport(self.github)), \
+                contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            return migrate.main()
+
+    def test_each_resumed_run_handles_the_next_limit(self):
+        self.assertEqual(self.legacy_left(), 20)
+        self.assertEqual(self.run_migrate('--limit', '8'), 0)
+        self.assertEqual(self.legacy_left(), 12)
+        self.assertEqual(self.run_migrate('--limit', '8', '--resume'), 0)
+        self.assertEqual(self.legacy_left(), 4)
+        self.assertEqual(self.run_migrate('--limit', '8', '--resume'), 0)
+        self.assertEqual(self.legacy_left(), 0)
+        self.assertTrue(all(issue.issue_type == 'Bug' for issue in self.github.issues.values()
+                            if 'area:x' not in issue.labels))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,16 +10,82 @@ Usage:
   python .aide/tools/migrate-type-labels.py --state all
   python .aide/tools/migrate-type-labels.py --state all --apply
   python .aide/tools/migrate-type-labels.py --repo OWNER/REPO --state open --apply --limit 200
+  python .aide/tools/migrate-type-labels.py --state all --apply --batch-size 50 --concurrency 4
+  python .aide/tools/migrate-type-labels.py --state all --apply --resume    # continue an interrupted run
+  python .aide/tools/migrate-type-labels.py --state all --scan labels       # only fetch legacy-labelled issues
+  python .aide/tools/migrate-type-labels.py --state all --apply --profile   # per-phase timing + trace
+  python .aide/tools/migrate-type-labels.py --state all --emit-plan plan.jsonl   # review, then:
+  python .aide/tools/migrate-type-labels.py --apply-plan plan.jsonl --revalidate
+
+In --apply mode the set-type and remove-labels mutations of many issues are
+packed into aliased GraphQL documents (--batch-size operations each), and up to
+--concurrency documents run at once. Each operation succeeds or fails on its
+own; the [DONE] counters count only operations GitHub confirmed.
+
+The scan either pages through every issue or, when the legacy labels are rare,
+only through label-filtered issue lists (one per legacy label, deduplicated
+locally). --scan auto (default) picks the one needing fewer pages from the
+per-label issue counts. --limit N stops after N issues carrying a legacy
+label, so it caps the same amount of work with either scan; each run (also
+with --resume) handles the next N. Earlier versions counted every scanned
+issue, labelled or not.
+
+Scanning and applying overlap: a background thread fetches up to --prefetch
+pages ahead (default 2) into a bounded queue while the current page is
+processed, so a run takes about as long as the slower of the two rather than
+their sum. Pages are still processed strictly in order, so the output
+(including dry-run) does not depend on --prefetch.
+
+--apply checkpoints the scan cursor and counters after every page whose
+mutations have all been applied, in ~/.cache/aide/OWNER/REPO/
+migrate-type-labels-<state>.jsonl. After an interruption, rerun with --resume
+to continue after the last applied page instead of rescanning from the start.
+Once a mutation fails, no later page is checkpointed, so --resume rescans from
+the page with the failure and retries it.
+
+A dry-run with --emit-plan PATH also writes its plan as JSONL: a header line
+(repo, state), then one line per issue with its node ID, the IDs of the legacy
+labels to remove and the Issue Type to set. --apply-plan PATH runs exactly
+those mutations with no scan. Confirmed operations are journaled per plan
+file, so rerunning the same plan skips them; --revalidate first refetches
+only the plan's issues (100 per query) and drops changes that were already
+made since the plan was written. With --limit N each run applies the next N
+issues of the plan.
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
-import subprocess
+import math
+import queue
 import sys
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from aide_github import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    AliasResult,
+    GitHubError,
+    Journal,
+    Profiler,
+    Transport,
+    detect_repo,
+    gql_list,
+    gql_str,
+    load_issue_types,
+    make_transport,
+    repo_cache_path,
+    run_aliased,
+)
+from aide_github.profile import span  # noqa: E402
 
 
 DEFAULT_ISSUE_TYPE_MAPPING = {
@@ -52,56 +118,32 @@ class Issue:
     labels: Dict[str, str]  # name -> id
 
 
-def _run_gh(args: List[str]) -> str:
-    p = subprocess.run(["gh", *args], capture_output=True, text=True, check=False)
-    if p.returncode != 0:
-        stderr = (p.stderr or "").strip()
-        stdout = (p.stdout or "").strip()
-        raise RuntimeError(f"gh {' '.join(args)} failed ({p.returncode}).\n{stderr}\n{stdout}".strip())
-    return p.stdout
+def _get_repo_owner_and_name(repo_override: Optional[str]) -> Tuple[str, str]:
+    return detect_repo(repo_override)
 
 
-def _get_repo_owner_and_name(repo_override: Optional[str]) -> Tuple[str, str]:
-    if repo_override:
-        owner, name = repo_override.split("/", 1)
-        return owner, name
-    out = _run_gh(["repo", "view", "--json", "owner,name"])
-    data = json.loads(out)
-    return data["owner"]["login"], data["name"]
+def _get_issue_types(gh: Transport, owner: str, refresh: bool = False) -> Dict[str, str]:
+    # A missing organization raises with a hint; other errors keep their own message
+    with span(gh.profiler, "issue types"):
+        return load_issue_types(gh, owner, refresh=refresh)
 
 
-def _get_issue_types(owner: str) -> Dict[str, str]:
-    query = f"""
-query {{
-  organization(login: "{owner}") {{
-    issueTypes(first: 100) {{
-      nodes {{ id name }}
-    }}
-  }}
-}}
-""".strip()
-    out = _run_gh(["api", "graphql", "-f", f"query={query}"])
-    data = json.loads(out)
-    org = data.get("data", {}).get("organization")
-    if not org:
-        raise RuntimeError(
-            f"Failed to query organization issue types for owner '{owner}'. "
-            "Ensure the repo owner is an organization and Issue Types are enabled."
-        )
-    nodes = org["issueTypes"]["nodes"]
-    return {n["name"]: n["id"] for n in nodes}
+ISSUE_STATES = {"open": ["OPEN"], "closed": ["CLOSED"], "all": ["OPEN", "CLOSED"]}
+PAGE_SIZE = 100
+DEFAULT_PREFETCH = 2
 
+T = TypeVar("T")
 
-def _iter_issues(owner: str, repo: str, state: str) -> Iterable[Issue]:
-    states = {"open": ["OPEN"], "closed": ["CLOSED"], "all": ["OPEN", "CLOSED"]}[state]
-    cursor: Optional[str] = None
 
-    while True:
-        after = f', after: "{cursor}"' if cursor else ""
-        query = f"""
+def _fetch_page(gh: Transport, owner: str, repo: str, state: str, after: Optional[str],
+                label: Optional[str] = None) -> Tuple[List[Issue], Dict[str, Any]]:
+    """One page of issues (only those carrying `label`, if given) and its pageInfo"""
+    after_arg = f", after: {gql_str(after)}" if after else ""
+    label_arg = f", labels: [{gql_str(label)}]" if label else ""
+    query = f"""
 query {{
-  repository(owner: "{owner}", name: "{repo}") {{
-    issues(first: 100{after}, states: [{", ".join(states)}], orderBy: {{field: CREATED_AT, direction: ASC}}) {{
+  repository(owner: {gql_str(owner)}, name: {gql_str(repo)}) {{
+    issues(first: {PAGE_SIZE}{after_arg}{label_arg}, states: [{", ".join(ISSUE_STATES[state])}], orderBy: {{field: CREATED_AT, direction: ASC}}) {{
       nodes {{
         number
         id
@@ -113,67 +155,514 @@ query {{
   }}
 }}
 """.strip()
-        out = _run_gh(["api", "graphql", "-f", f"query={query}"])
-        data = json.loads(out)
-        conn = data["data"]["repository"]["issues"]
-
-        for n in conn["nodes"]:
-            labels = {ln["name"]: ln["id"] for ln in n["labels"]["nodes"]}
-            issue_type = n["issueType"]["name"] if n.get("issueType") else None
-            yield Issue(
-                number=int(n["number"]),
-                issue_id=n["id"],
-                issue_type_name=issue_type,
-                labels=labels,
-            )
-
-        page = conn["pageInfo"]
+    with span(gh.profiler, "scan page", label=label):
+        data = gh.graphql(query)
+    conn = data["repository"]["issues"]
+    return [_issue(n) for n in conn["nodes"]], conn["pageInfo"]
+
+
+def _issue(node: Dict[str, Any]) -> Issue:
+    return Issue(
+        number=int(node["number"]),
+        issue_id=node["id"],
+        issue_type_name=node["issueType"]["name"] if node.get("issueType") else None,
+        labels={ln["name"]: ln["id"] for ln in node["labels"]["nodes"]},
+    )
+
+
+def _iter_pages(gh: Transport, owner: str, repo: str, state: str,
+                cursor: Optional[str] = None) -> Iterable[Tuple[List[Issue], Optional[str]]]:
+    """Scan every issue: yield (issues, end cursor) per page, starting after `cursor`"""
+    while True:
+        issues, page = _fetch_page(gh, owner, repo, state, cursor)
+        cursor = page["endCursor"] or cursor
+        yield issues, cursor
         if not page["hasNextPage"]:
             return
-        cursor = page["endCursor"]
 
 
-def _set_issue_type(issue_id: str, issue_type_id: str) -> None:
-    mutation = f"""
-mutation {{
-  updateIssueIssueType(input: {{
-    issueId: "{issue_id}",
-    issueTypeId: "{issue_type_id}"
-  }}) {{
-    issue {{ number issueType {{ name }} }}
-  }}
-}}
-""".strip()
-    _run_gh(["api", "graphql", "-f", f"query={mutation}"])
+def _iter_label_pages(gh: Transport, owner: str, repo: str, state: str, labels: List[str],
+                      cursor: Optional[Dict[str, Any]] = None) -> Iterable[Tuple[List[Issue], Dict[str, Any]]]:
+    """Scan only issues carrying one of `labels`, through one label-filtered connection per label.
+
+    An issue with several legacy labels is yielded once, from the connection
+    of the first of them in LEGACY_TYPE_LABEL_TO_ISSUE_TYPE_KEY order (later
+    connections skip it, whether or not its labels were removed meanwhile).
+    Cursors are {"label": name, "after": connection cursor}.
+    """
+    order = list(LEGACY_TYPE_LABEL_TO_ISSUE_TYPE_KEY)
+    start = labels.index(cursor["label"]) if cursor else 0
+    for name in labels[start:]:
+        after = cursor["after"] if cursor and cursor["label"] == name else None
+        earlier = set(order[:order.index(name)])
+        while True:
+            issues, page = _fetch_page(gh, owner, repo, state, after, label=name)
+            after = page["endCursor"] or after
+            yield [i for i in issues if not earlier.intersection(i.labels)], {"label": name, "after": after}
+            if not page["hasNextPage"]:
+                break
+
+
+def _choose_scan(gh: Transport, owner: str, repo: str, state: str, requested: str) -> Tuple[str, List[str]]:
+    """Scan strategy: ("all", []) or ("labels", legacy labels to scan).
+
+    "auto" counts the issues carrying each legacy label in one aliased query
+    and scans by label when that needs fewer pages than scanning every issue.
+    """
+    names = list(LEGACY_TYPE_LABEL_TO_ISSUE_TYPE_KEY)
+    if requested == "all":
+        return "all", []
+    if requested == "labels":
+        return "labels", names
+
+    states = ", ".join(ISSUE_STATES[state])
+    fields = "\n".join(f"    l{i}: issues(states: [{states}], labels: [{gql_str(name)}]) {{ totalCount }}"
+                       for i, name in enumerate(names))
+    query = (f"query {{\n  repository(owner: {gql_str(owner)}, name: {gql_str(repo)}) {{\n"
+             f"    total: issues(states: [{states}]) {{ totalCount }}\n{fields}\n  }}\n}}")
+    with span(gh.profiler, "label counts"):
+        data = gh.graphql(query)["repository"]
+    total = data["total"]["totalCount"]
+    counts = {name: data[f"l{i}"]["totalCount"] for i, name in enumerate(names)}
+    used = [name for name in names if counts[name]]
+    label_pages = sum(math.ceil(counts[name] / PAGE_SIZE) for name in used)
+    full_pages = max(1, math.ceil(total / PAGE_SIZE))
+    strategy = "labels" if label_pages < full_pages else "all"
+    print(f"[SCAN] {strategy}: {sum(counts.values())} legacy label use(s) on {total} issue(s); "
+          f"~{label_pages} page(s) by label vs {full_pages} for a full scan", file=sys.stderr)
+    return strategy, used if strategy == "labels" else []
+
+
+def _prefetch(items: Iterable[T], depth: int) -> Iterator[T]:
+    """Yield `items` in order while a background thread fetches up to `depth` ahead.
+
+    The scanner runs in the thread and the caller (the applier) consumes, so
+    the next pages are requested while the current page's mutations run.
+    depth 0 iterates in the caller's thread. An exception raised by the
+    scanner is re-raised here, after the items that preceded it; when the
+    caller stops early the thread stops after its current request.
+    """
+    if depth <= 0:
+        yield from items
+        return
 
+    done = object()
+    buffer: "queue.Queue[Tuple[Any, Optional[BaseException]]]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: Tuple[Any, Optional[BaseException]]) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+            put((done, None))
+        except BaseException as e:
+            put((done, e))
+
+    threading.Thread(target=produce, name="scan-prefetch", daemon=True).start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
 
-def _remove_labels(issue_id: str, label_ids: List[str]) -> None:
-    if not label_ids:
-        return
-    label_list = ", ".join([f"\"{lid}\"" for lid in label_ids])
-    mutation = f"""
-mutation {{
-  removeLabelsFromLabelable(input: {{
-    labelableId: "{issue_id}",
-    labelIds: [{label_list}]
-  }}) {{
-    clientMutationId
+
+@dataclass(frozen=True)
+class Operation:
+    """One mutation of the apply phase (`kind` is "type" or "labels")"""
+    number: int
+    kind: str
+    field: str  # top-level mutation field, aliased by run_aliased
+    message: str
+    skipped_multi: bool = False  # type left unset (several legacy labels); counted when reported
+
+
+def _set_issue_type_op(issue: Issue, issue_type_id: str, type_name: str) -> Operation:
+    field = (f"updateIssueIssueType(input: {{issueId: {gql_str(issue.issue_id)}, "
+             f"issueTypeId: {gql_str(issue_type_id)}}}) {{ issue {{ number issueType {{ name }} }} }}")
+    return Operation(issue.number, "type", field, f"set Issue Type -> {type_name}")
+
+
+def _remove_labels_op(issue: Issue, label_names: List[str], skipped_multi: bool = False) -> Operation:
+    field = (f"removeLabelsFromLabelable(input: {{labelableId: {gql_str(issue.issue_id)}, "
+             f"labelIds: {gql_list(issue.labels[name] for name in label_names)}}}) {{ clientMutationId }}")
+    return Operation(issue.number, "labels", field, f"removed labels -> {', '.join(label_names)}", skipped_multi)
+
+
+class BatchApplier:
+    """Runs Operations in aliased mutation documents of `batch_size` fields.
+
+    Up to `concurrency` documents are in flight at once. Results are reported
+    in submission order (so output does not depend on `concurrency`), one
+    line per operation, and counted in `done` / `failed` by kind (plus
+    `skipped_multi`).
+    `after_added(callback)` runs the callback once every operation added so
+    far has been reported, unless one of them failed (used to checkpoint fully
+    applied pages); `on_done(op)` is called for each operation GitHub confirmed.
+    """
+
+    def __init__(self, gh: Transport, batch_size: int = DEFAULT_CHUNK_SIZE, concurrency: int = 1,
+                 on_done: Optional[Callable[[Operation], None]] = None):
+        self.gh = gh
+        self.on_done = on_done
+        self.batch_size = max(1, batch_size)
+        self.concurrency = max(1, concurrency)
+        self.done: Dict[str, int] = {"type": 0, "labels": 0}
+        self.failed: Dict[str, int] = {"type": 0, "labels": 0}
+        self.skipped_multi = 0
+        self._pending: List[Operation] = []
+        self._in_flight: Deque[Future] = deque()
+        self._added = 0
+        self._reported = 0
+        self._first_failure: Optional[int] = None  # index of the first operation that failed
+        self._markers: Deque[Tuple[int, Callable[[], None]]] = deque()
+        self._pool = ThreadPoolExecutor(max_workers=self.concurrency)
+
+    def add(self, op: Operation):
+        self._pending.append(op)
+        self._added += 1
+        if len(self._pending) >= self.batch_size:
+            self._dispatch()
+
+    def after_added(self, callback: Callable[[], None]):
+        self._markers.append((self._added, callback))
+        self._fire_markers()
+
+    def _fire_markers(self):
+        while self._markers and self._markers[0][0] <= self._reported:
+            added, callback = self._markers.popleft()
+            if self._first_failure is None or added <= self._first_failure:
+                callback()
+
+    def close(self):
+        """Send what is still pending and wait for every document"""
+        try:
+            if self._pending:
+                self._dispatch()
+            while self._in_flight:
+                self._report_oldest()
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def abort(self):
+        """Drop operations not sent yet and wait for (and report) the documents in flight"""
+        self._pending = []
+        try:
+            while self._in_flight:
+                try:
+                    self._report_oldest()
+                except Exception as e:
+                    print(f"[FAIL] Mutation document failed: {e}", file=sys.stderr)
+        finally:
+            self._pool.shutdown(wait=True)
+
+    def _dispatch(self):
+        chunk, self._pending = self._pending[:self.batch_size], self._pending[self.batch_size:]
+        while len(self._in_flight) >= self.concurrency:
+            self._report_oldest()
+        self._in_flight.append(self._pool.submit(self._run, chunk))
+
+    def _run(self, chunk: List[Operation]) -> List[AliasResult]:
+        with span(self.gh.profiler, "apply batch", operations=len(chunk)):
+            return run_aliased(self.gh, [(op, op.field) for op in chunk], chunk_size=len(chunk))
+
+    def _report_oldest(self):
+        # Wait before popping, so an interrupt while waiting leaves the document to abort();
+        # a document that raised is popped (abort() does not raise its error again) and
+        # counts as a failure, so no later page is checkpointed
+        future = self._in_flight[0]
+        try:
+            results = future.result()
+        except BaseException:
+            if future.done():
+                self._in_flight.popleft()
+                if self._first_failure is None:
+                    self._first_failure = self._reported
+            raise
+        self._in_flight.popleft()
+        for result in results:
+            op: Operation = result.key
+            self.skipped_multi += op.skipped_multi
+            if result.ok:
+                self.done[op.kind] += 1
+                print(f"[OK] #{op.number}: {op.message}")
+                if self.on_done:
+                    self.on_done(op)
+            else:
+                self.failed[op.kind] += 1
+                if self._first_failure is None:
+                    self._first_failure = self._reported
+                print(f"[FAIL] #{op.number} ({op.message}): {result.error}", file=sys.stderr)
+            self._reported += 1
+            self._fire_markers()
+
+
+PLAN_FORMAT = "migrate-type-labels"
+PLAN_VERSION = 1
+
+
+def _plan_header(owner: str, repo: str, state: str) -> Dict[str, Any]:
+    return {"plan": PLAN_FORMAT, "version": PLAN_VERSION, "repo": f"{owner}/{repo}", "state": state}
+
+
+def _plan_record(issue: Issue, legacy_labels: List[str], set_type: Optional[Tuple[str, str]],
+                 skipped_multi: bool) -> Dict[str, Any]:
+    """One --emit-plan line: the issue's node ID, label IDs to remove and (name, ID) of the type to set"""
+    return {
+        "number": issue.number,
+        "id": issue.issue_id,
+        "remove_labels": {name: issue.labels[name] for name in legacy_labels},
+        "set_type": {"name": set_type[0], "id": set_type[1]} if set_type else None,
+        "skipped_multi": skipped_multi,
+    }
+
+
+def _read_plan(path: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]], str]:
+    """(header, issue records, content digest) of a plan written by --emit-plan"""
+    content = path.read_bytes()
+    lines = [json.loads(line) for line in content.decode("utf-8").splitlines() if line.strip()]
+    if not lines or lines[0].get("plan") != PLAN_FORMAT:
+        raise ValueError("not a migrate-type-labels plan (write one with --emit-plan)")
+    if lines[0].get("version") != PLAN_VERSION:
+        raise ValueError(f"unsupported plan version {lines[0].get('version')!r}")
+    return lines[0], lines[1:], hashlib.sha256(content).hexdigest()[:16]
+
+
+def _current_issues(gh: Transport, ids: List[str]) -> Dict[str, Issue]:
+    """node ID -> current state of those issues, PAGE_SIZE per `nodes(ids:)` query (deleted ones are left out)"""
+    current: Dict[str, Issue] = {}
+    for start in range(0, len(ids), PAGE_SIZE):
+        chunk = ids[start:start + PAGE_SIZE]
+        query = f"""
+query {{
+  nodes(ids: {gql_list(chunk)}) {{
+    ... on Issue {{
+      number
+      id
+      issueType {{ name }}
+      labels(first: 100) {{ nodes {{ id name }} }}
+    }}
   }}
 }}
 """.strip()
-    _run_gh(["api", "graphql", "-f", f"query={mutation}"])
+        with span(gh.profiler, "revalidate", issues=len(chunk)):
+            try:
+                nodes = gh.graphql(query)["nodes"]
+            except GitHubError as e:
+                # Deleted issues come back as null nodes with NOT_FOUND errors
+                if not (e.data or {}).get("nodes"):
+                    raise
+                nodes = e.data["nodes"]
+        for node in nodes:
+            if node and node.get("id"):
+                current[node["id"]] = _issue(node)
+    return current
+
+
+def _apply_plan(gh: Transport, args: argparse.Namespace) -> int:
+    """--apply-plan: run the operations of a plan file without scanning the repository"""
+    path = Path(args.apply_plan)
+    try:
+        header, records, digest = _read_plan(path)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Could not read plan {path}: {e}", file=sys.stderr)
+        return 1
+    if args.repo and args.repo != header["repo"]:
+        print(f"[ERROR] Plan {path} was written for {header['repo']}, not {args.repo}", file=sys.stderr)
+        return 1
+    owner, repo = header["repo"].split("/", 1)
+
+    # Confirmed operations are journaled per plan (by content), so a rerun skips them
+    journal = Journal(repo_cache_path(owner, repo, f"migrate-type-labels-plan-{digest}.jsonl"), resume=True)
+    applied = {(e["number"], e["kind"]) for e in journal.of("applied")}
+    pending: List[Tuple[Dict[str, Any], List[str]]] = []
+    for record in records:
+        kinds = [kind for kind, wanted in (("type", record["set_type"]), ("labels", record["remove_labels"]))
+                 if wanted and (record["number"], kind) not in applied]
+        if kinds:
+            pending.append((record, kinds))
+    print(f"[PLAN] {len(records)} issue(s) in {path}: {len(records) - len(pending)} already applied, "
+          f"{len(pending)} to apply", file=sys.stderr)
+    if args.limit and len(pending) > args.limit:
+        # Rerunning the plan continues with the next issues, as applied ones are skipped
+        print(f"[PLAN] --limit {args.limit}: applying the first {args.limit} of them", file=sys.stderr)
+        pending = pending[:args.limit]
+
+    current: Optional[Dict[str, Issue]] = None
+    if args.revalidate:
+        current = _current_issues(gh, [record["id"] for record, _ in pending])
+
+    applier = BatchApplier(gh, args.batch_size, args.concurrency,
+                           on_done=lambda op: journal.record("applied", number=op.number, kind=op.kind))
+    unchanged = 0
+    try:
+        for record, kinds in pending:
+            number = record["number"]
+            issue = Issue(number, record["id"], None, dict(record["remove_labels"]))
+            set_type = record["set_type"] if "type" in kinds else None
+            remove = list(issue.labels) if "labels" in kinds else []
+            if current is not None:
+                now = current.get(record["id"])
+                if now is None:
+                    print(f"[SKIP] #{number}: issue no longer exists", file=sys.stderr)
+                    continue
+                if set_type and now.issue_type_name is not None:
+                    print(f"[SKIP] #{number}: Issue Type already set to {now.issue_type_name}", file=sys.stderr)
+                    set_type = None
+                # Remove by the current label IDs, and only the legacy labels still present
+                issue = Issue(number, record["id"], now.issue_type_name, now.labels)
+                remove = [name for name in remove if name in now.labels]
+                if not set_type and not remove:
+                    unchanged += 1
+                    continue
+            if set_type:
+                applier.add(_set_issue_type_op(issue, set_type["id"], set_type["name"]))
+            if remove:
+                applier.add(_remove_labels_op(issue, remove, record["skipped_multi"]))
+        applier.close()
+    except BaseException:
+        applier.abort()
+        print(f"[ERROR] Run interrupted. Applied operations are recorded in {journal.path}; "
+              f"rerun with --apply-plan {path} to apply the rest.", file=sys.stderr)
+        raise
+    finally:
+        journal.close()
+
+    if current is not None:
+        print(f"[REVALIDATE] {len(pending)} issue(s) checked; {unchanged} already migrated", file=sys.stderr)
+    failed = applier.failed["type"] + applier.failed["labels"]
+    print(
+        f"[DONE] Updated issues: set issue types={applier.done['type']}, "
+        f"removed legacy labels={applier.done['labels']}, skipped_multi_label={applier.skipped_multi}"
+        + (f", failed={failed}" if failed else ""),
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
 
 
 def main() -> int:
     parser = argparse.ArgumentParser()
     parser.add_argument("--repo", help="owner/repo override (default: current repo)")
     parser.add_argument("--state", choices=["open", "closed", "all"], default="all")
-    parser.add_argument("--limit", type=int, default=0, help="Max issues to process (0 = no limit)")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=0,
+        help="Max issues carrying a legacy type label to migrate in this run, with any --scan or --resume, "
+             "or plan issues not applied yet with --apply-plan (0 = no limit). Changed: this used to count "
+             "every scanned issue, including unlabelled ones",
+    )
     parser.add_argument("--apply", action="store_true", help="Apply changes (default: dry-run)")
+    parser.add_argument(
+        "--transport",
+        choices=["auto", "http", "gh"],
+        default=None,
+        help="GitHub backend: pooled HTTPS (http), gh CLI per call (gh), or http when a token is available (auto)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        metavar="N",
+        help=f"--apply: mutations per aliased GraphQL document (default: {DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        metavar="N",
+        help="--apply: mutation documents in flight at once (default: 1)",
+    )
+    parser.add_argument(
+        "--scan",
+        choices=["auto", "all", "labels"],
+        default="auto",
+        help="Scan every issue (all), only issues carrying a legacy label via label-filtered queries (labels), "
+             "or pick whichever needs fewer pages from the label counts (auto, default)",
+    )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=DEFAULT_PREFETCH,
+        metavar="N",
+        help=f"Scan pages fetched ahead in the background while earlier pages are processed "
+             f"(default: {DEFAULT_PREFETCH}; 0 = fetch each page only when needed)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="--apply: continue after the last page checkpointed by an interrupted run (same --repo/--state)",
+    )
+    parser.add_argument(
+        "--emit-plan",
+        metavar="PATH",
+        help="Dry-run: also write the planned changes as JSONL (one line per issue) for --apply-plan",
+    )
+    parser.add_argument(
+        "--apply-plan",
+        metavar="PATH",
+        help="Apply a plan written by --emit-plan without scanning; operations already applied are skipped",
+    )
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="--apply-plan: refetch the plan's issues first (100 per query) and skip changes already made",
+    )
+    parser.add_argument("--refresh-cache", action="store_true", help="Refetch org Issue Types instead of using the cache")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time every phase and GitHub call; print a summary table and write a Chrome trace (see --trace-file)",
+    )
+    parser.add_argument(
+        "--trace-file",
+        default="migrate-type-labels.trace.json",
+        metavar="PATH",
+        help="--profile: trace-event JSON output (default: migrate-type-labels.trace.json)",
+    )
     args = parser.parse_args()
-
-    owner, repo = _get_repo_owner_and_name(args.repo)
-    issue_types = _get_issue_types(owner)
+    if args.emit_plan and (args.apply or args.apply_plan):
+        parser.error("--emit-plan writes the plan of a dry-run; it cannot be combined with --apply/--apply-plan")
+    if args.apply_plan and args.resume:
+        parser.error("--apply-plan always skips operations already applied; --resume is for scanning runs")
+    if args.revalidate and not args.apply_plan:
+        parser.error("--revalidate requires --apply-plan")
+
+    gh = make_transport(args.transport)
+    if args.profile:
+        gh.profiler = Profiler()
+    try:
+        return _run(gh, args)
+    finally:
+        for line in gh.summary():
+            print(line, file=sys.stderr)
+        if gh.profiler:
+            for line in gh.profiler.summary():
+                print(line, file=sys.stderr)
+            gh.profiler.write_trace(Path(args.trace_file))
+            print(f"Trace written to {args.trace_file}", file=sys.stderr)
+
+
+def _run(gh: Transport, args: argparse.Namespace) -> int:
+    if args.apply_plan:
+        return _apply_plan(gh, args)
+    with span(gh.profiler, "repo lookup"):
+        owner, repo = _get_repo_owner_and_name(args.repo)
+    issue_types = _get_issue_types(gh, owner, refresh=args.refresh_cache)
 
     # Build mapping from Issue Type key -> ID, based on display names.
     issue_type_key_to_id: Dict[str, str] = {}
@@ -189,73 +678,150 @@ def main() -> int:
             file=sys.stderr,
         )
 
-    planned_set = 0
-    planned_remove = 0
-    skipped_multi = 0
-    processed = 0
-
-    for issue in _iter_issues(owner, repo, args.state):
-        processed += 1
-        if args.limit and processed > args.limit:
-            break
-
-        legacy_labels = [name for name in issue.labels.keys() if name in LEGACY_TYPE_LABEL_TO_ISSUE_TYPE_KEY]
-        if not legacy_labels:
-            continue
-
-        # Remove all legacy type labels regardless (post-migration policy).
-        remove_label_ids = [issue.labels[name] for name in legacy_labels]
-
-        # Set issue type only if missing.
-        desired_key: Optional[str] = None
-        if issue.issue_type_name is None:
-            if len(legacy_labels) != 1:
-                skipped_multi += 1
-                print(
-                    f"[SKIP] #{issue.number}: multiple legacy type labels present: {', '.join(legacy_labels)}",
-                    file=sys.stderr,
-                )
-            else:
-                desired_key = LEGACY_TYPE_LABEL_TO_ISSUE_TYPE_KEY[legacy_labels[0]]
-
-        do_set = desired_key is not None and desired_key in issue_type_key_to_id
-        do_remove = len(remove_label_ids) > 0
-
-        if do_set:
-            planned_set += 1
-        if do_remove:
-            planned_remove += 1
-
-        if not args.apply:
-            parts: List[str] = []
-            if do_set:
-                parts.append(f"set Issue Type -> {DEFAULT_ISSUE_TYPE_MAPPING[desired_key]}")
-            parts.append(f"remove labels -> {', '.join(legacy_labels)}")
-            print(f"[DRY-RUN] #{issue.number}: " + "; ".join(parts))
-            continue
-
-        if do_set:
-            _set_issue_type(issue.issue_id, issue_type_key_to_id[desired_key])
-            print(f"[OK] #{issue.number}: set Issue Type -> {DEFAULT_ISSUE_TYPE_MAPPING[desired_key]}")
-
-        _remove_labels(issue.issue_id, remove_label_ids)
-        print(f"[OK] #{issue.number}: removed labels -> {', '.join(legacy_labels)}")
-
-    if not args.apply:
+    counts = {"processed": 0, "planned_set": 0, "planned_remove": 0, "skipped_multi": 0}
+    applier: Optional[BatchApplier] = None
+    journal: Optional[Journal] = None
+    cursor: Any = None
+    scan: Optional[str] = None
+    scan_labels: List[str] = []
+    if args.resume and not args.apply:
+        print("[WARN] --resume only applies with --apply; scanning from the start", file=sys.stderr)
+    if args.apply:
+        applier = BatchApplier(gh, args.batch_size, args.concurrency)
+        journal = Journal(repo_cache_path(owner, repo, f"migrate-type-labels-{args.state}.jsonl"),
+                          resume=args.resume)
+        checkpoints = journal.of("page")
+        if checkpoints:
+            last = checkpoints[-1]
+            cursor = last["cursor"]
+            scan, scan_labels = last["scan"], last["labels"]
+            counts.update(last["counts"])
+            applier.done.update(last["done"])
+            applier.failed.update(last["failed"])
+            applier.skipped_multi = last["skipped_multi"]
+            print(f"[RESUME] Continuing after {counts['processed']} issue(s) checkpointed in {journal.path}",
+                  file=sys.stderr)
+    if scan is None:
+        scan, scan_labels = _choose_scan(gh, owner, repo, args.state, args.scan)
+    saved: Optional[Dict[str, Any]] = None
+
+    def checkpoint(page_cursor: Optional[str], page_counts: Dict[str, int]):
+        # Scan counters as of the end of the page; applied counters as reported so far
+        nonlocal saved
+        saved = dict(scan=scan, labels=scan_labels, cursor=page_cursor, counts=page_counts,
+                     done=dict(applier.done), failed=dict(applier.failed), skipped_multi=applier.skipped_multi)
+        journal.record("page", **saved)
+
+    plan_file = None
+    if args.emit_plan:
+        plan_file = open(args.emit_plan, "w", encoding="utf-8")
+        plan_file.write(json.dumps(_plan_header(owner, repo, args.state), sort_keys=True) + "\n")
+
+    limit_reached = False
+    limit_base = counts["planned_remove"]  # --limit counts this run only, also after --resume
+    try:
+        if scan == "labels":
+            pages = _iter_label_pages(gh, owner, repo, args.state, scan_labels, cursor)
+        else:
+            pages = _iter_pages(gh, owner, repo, args.state, cursor)
+        for issues, page_cursor in _prefetch(pages, args.prefetch):
+            for issue in issues:
+                # Counted in legacy-labelled issues (planned_remove), the same for every --scan
+                if args.limit and counts["planned_remove"] - limit_base >= args.limit:
+                    limit_reached = True
+                    break
+                counts["processed"] += 1
+
+                legacy_labels = [name for name in issue.labels.keys() if name in LEGACY_TYPE_LABEL_TO_ISSUE_TYPE_KEY]
+                if not legacy_labels:
+                    continue
+
+                # Set issue type only if missing.
+                desired_key: Optional[str] = None
+                if issue.issue_type_name is None:
+                    if len(legacy_labels) != 1:
+                        counts["skipped_multi"] += 1
+                        print(
+                            f"[SKIP] #{issue.number}: multiple legacy type labels present: {', '.join(legacy_labels)}",
+                            file=sys.stderr,
+                        )
+                    else:
+                        desired_key = LEGACY_TYPE_LABEL_TO_ISSUE_TYPE_KEY[legacy_labels[0]]
+
+                do_set = desired_key is not None and desired_key in issue_type_key_to_id
+
+                if do_set:
+                    counts["planned_set"] += 1
+                # Remove all legacy type labels regardless (post-migration policy).
+                counts["planned_remove"] += 1
+
+                if applier is None:
+                    parts: List[str] = []
+                    if do_set:
+                        parts.append(f"set Issue Type -> {DEFAULT_ISSUE_TYPE_MAPPING[desired_key]}")
+                    parts.append(f"remove labels -> {', '.join(legacy_labels)}")
+                    print(f"[DRY-RUN] #{issue.number}: " + "; ".join(parts))
+                    if plan_file is not None:
+                        set_type = ((DEFAULT_ISSUE_TYPE_MAPPING[desired_key], issue_type_key_to_id[desired_key])
+                                    if do_set else None)
+                        record = _plan_record(issue, legacy_labels, set_type,
+                                              desired_key is None and issue.issue_type_name is None)
+                        plan_file.write(json.dumps(record, sort_keys=True) + "\n")
+                    continue
+
+                if do_set:
+                    applier.add(_set_issue_type_op(issue, issue_type_key_to_id[desired_key],
+                                                   DEFAULT_ISSUE_TYPE_MAPPING[desired_key]))
+                applier.add(_remove_labels_op(issue, legacy_labels, skipped_multi=desired_key is None
+                                              and issue.issue_type_name is None))
+            if limit_reached:
+                break
+            if applier is not None:
+                # Recorded once every mutation of this (and each earlier) page has been applied;
+                # never past a page with a failed mutation, so --resume retries that page
+                applier.after_added(functools.partial(checkpoint, page_cursor, dict(counts)))
+        if applier is not None:
+            applier.close()
+    except BaseException:
+        if applier is not None:
+            # Documents already sent are still reported; the rest of an unfinished page is
+            # rescanned on --resume, where issues migrated meanwhile no longer match.
+            applier.abort()
+            if saved is not None:
+                journal.record("page", **saved)
+            print(f"[ERROR] Run interrupted. Progress is checkpointed in {journal.path}; "
+                  "rerun with --apply --resume to continue after the last applied page.", file=sys.stderr)
+        raise
+    finally:
+        if journal is not None:
+            journal.close()
+        if plan_file is not None:
+            plan_file.close()
+
+    if applier is None:
         print(
-            f"[DRY-RUN] Planned: set issue types={planned_set}, remove legacy labels={planned_remove}, "
-            f"skipped_multi_label={skipped_multi}",
+            f"[DRY-RUN] Planned: set issue types={counts['planned_set']}, "
+            f"remove legacy labels={counts['planned_remove']}, skipped_multi_label={counts['skipped_multi']}",
             file=sys.stderr,
         )
-        print("[DRY-RUN] Re-run with --apply to execute.", file=sys.stderr)
-    else:
-        print(
-            f"[DONE] Updated issues: set issue types={planned_set}, removed legacy labels={planned_remove}, "
-            f"skipped_multi_label={skipped_multi}",
-            file=sys.stderr,
-        )
-
-    return 0
+        if plan_file is not None:
+            print(f"[DRY-RUN] Plan written to {args.emit_plan}; apply it with --apply-plan {args.emit_plan}.",
+                  file=sys.stderr)
+        else:
+            print("[DRY-RUN] Re-run with --apply to execute.", file=sys.stderr)
+        return 0
+
+    failed = applier.failed["type"] + applier.failed["labels"]
+    print(
+        f"[DONE] Updated issues: set issue types={applier.done['type']}, "
+        f"removed legacy labels={applier.done['labels']}, skipped_multi_label={applier.skipped_multi}"
+        + (f", failed={failed}" if failed else ""),
+        file=sys.stderr,
+    )
+    if failed:
+        print("[DONE] Rerun with --apply --resume to retry from the first page with a failed mutation.",
+              file=sys.stderr)
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
@@ -8,9 +8,12 @@ Usage:
 
 import argparse
 import json
-import subprocess
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from aide_github import GitHubError, Transport, detect_repo, load_issue_types, make_transport  # noqa: E402
+
 
 DEFAULT_CONFIG = {
     "issue_type_mapping": {
@@ -61,15 +64,10 @@ def normalize_type(raw_type: str) -> str:
 
 
 def get_repo_info():
-    result = subprocess.run(
-        ["gh", "repo", "view", "--json", "owner,name"],
-        capture_output=True, text=True, check=True
-    )
-    data = json.loads(result.stdout)
-    return data["owner"]["login"], data["name"]
+    return detect_repo()
 
 
-def get_issue_id(owner: str, repo: str, issue_num: int) -> str:
+def get_issue_id(gh: Transport, owner: str, repo: str, issue_num: int) -> str:
     query = f'''{{
       repository(owner: "{owner}", name: "{repo}") {{
         issue(number: {issue_num}) {{
@@ -77,55 +75,38 @@ def get_issue_id(owner: str, repo: str, issue_num: int) -> str:
         }}
       }}
     }}'''
-    result = subprocess.run(
-        ["gh", "api", "graphql", "-f", f"query={query}"],
-        capture_output=True, text=True, check=True
-    )
-    data = json.loads(result.stdout)
-    issue = data.get("data", {}).get("repository", {}).get("issue")
+    try:
+        data = gh.graphql(query)
+    except GitHubError as e:
+        if not e.not_found:
+            raise SystemExit(f"Failed to look up issue #{issue_num} in {owner}/{repo}: {e}")
+        data = {}
+    issue = (data.get("repository") or {}).get("issue")
     if not issue:
         raise SystemExit(f"Issue #{issue_num} not found in {owner}/{repo}.")
     return issue["id"]
 
 
-def get_issue_types(owner: str) -> dict:
-    query = f'''{{
-      organization(login: "{owner}") {{
-        issueTypes(first: 100) {{
-          nodes {{
-            id
-            name
-          }}
-        }}
-      }}
-    }}'''
-    result = subprocess.run(
-        ["gh", "api", "graphql", "-f", f"query={query}"],
-        capture_output=True, text=True, check=True
-    )
-    data = json.loads(result.stdout)
-    org = data.get("data", {}).get("organization")
-    if not org:
-        raise SystemExit(
-            f"Unable to query Issue Types for organization '{owner}'. "
-            "Ensure the repo owner is an organization and Issue Types are enabled."
-        )
-    types = org["issueTypes"]["nodes"]
-    return {t["name"]: t["id"] for t in types}
+def get_issue_types(gh: Transport, owner: str, want=(), refresh: bool = False) -> dict:
+    try:
+        return load_issue_types(gh, owner, refresh=refresh, want=want)
+    except GitHubError as e:
+        raise SystemExit(f"Unable to query Issue Types for '{owner}': {e}")
 
 
-def set_issue_type(owner: str, repo: str, issue_num: int, issue_type: str, mapping: dict):
+def set_issue_type(gh: Transport, owner: str, repo: str, issue_num: int, issue_type: str, mapping: dict,
+                   refresh: bool = False):
     type_name = mapping.get(issue_type)
     if not type_name:
         raise SystemExit(
             "Unknown issue type '{0}'. Allowed values: feature, bug, technical-debt, "
             "chore, documentation, research, epic.".format(issue_type)
         )
-    issue_types = get_issue_types(owner)
+    issue_types = get_issue_types(gh, owner, want=[type_name], refresh=refresh)
     type_id = issue_types.get(type_name)
     if not type_id:
         raise SystemExit(f"Issue type '{type_name}' not found in org.")
-    issue_id = get_issue_id(owner, repo, issue_num)
+    issue_id = get_issue_id(gh, owner, repo, issue_num)
     mutation = f'''mutation {{
       updateIssueIssueType(input: {{
         issueId: "{issue_id}"
@@ -137,22 +118,27 @@ def set_issue_type(owner: str, repo: str, issue_num: int, issue_type: str, mappi
         }}
       }}
     }}'''
-    subprocess.run(
-        ["gh", "api", "graphql", "-f", f"query={mutation}"],
-        capture_output=True, text=True, check=True
-    )
+    gh.graphql(mutation)
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--issue", type=int, required=True)
     parser.add_argument("--type", required=True)
+    parser.add_argument("--transport", choices=["auto", "http", "gh"], default=None)
+    parser.add_argument("--refresh-cache", action="store_true", help="Refetch org Issue Types instead of using the cache")
     args = parser.parse_args()
 
     config = load_config()
     issue_type = normalize_type(args.type)
     owner, repo = get_repo_info()
-    set_issue_type(owner, repo, args.issue, issue_type, config["issue_type_mapping"])
+    gh = make_transport(args.transport)
+    try:
+        set_issue_type(gh, owner, repo, args.issue, issue_type, config["issue_type_mapping"],
+                       refresh=args.refresh_cache)
+    finally:
+        for line in gh.summary():
+            print(line, file=sys.stderr)
 
 
 if __name__ == "__main__":